@@ -0,0 +1,78 @@
+"""Shared fixtures for benchmarks. Large inputs are generated from sample data, and network
+requests are sent to a local replay server.
+"""
+
+from itertools import count
+
+import pytest
+from requests_ratelimiter import InMemoryBucket
+
+from pyinaturalist.client import ClientSession
+from pyinaturalist.constants import PER_PAGE_RESULTS
+from pyinaturalist.models import LifeList
+from test.replay_server import ReplayServer
+from test.sample_data import SAMPLE_DATA, j_observation_2
+
+LIFE_LIST_RANKS = ['kingdom', 'phylum', 'class', 'order', 'family', 'genus', 'species']
+LIFE_LIST_BRANCHES = 3  # Number of children per taxon; results in ~3300 taxa
+
+
+def make_page(template: dict, n_results: int = PER_PAGE_RESULTS) -> dict:
+    """Make a full page of API results from a single record"""
+    results = [{**template, 'id': i} for i in range(1, n_results + 1)]
+    return {'total_results': n_results, 'page': 1, 'per_page': n_results, 'results': results}
+
+
+@pytest.fixture(scope='session')
+def observation_page() -> dict:
+    return make_page(j_observation_2)
+
+
+@pytest.fixture(scope='session')
+def taxon_page() -> dict:
+    return make_page(SAMPLE_DATA['get_taxa']['results'][0])
+
+
+@pytest.fixture(scope='session')
+def life_list() -> LifeList:
+    """A large, complete life list with a fixed number of children per taxon"""
+    ids = count(2)
+    results = [{'id': 1, 'name': 'Life', 'rank': 'stateofmatter', 'rank_level': 100}]
+    parents = [results[0]]
+    for rank_idx, rank in enumerate(LIFE_LIST_RANKS):
+        children = [
+            {
+                'id': (taxon_id := next(ids)),
+                'name': f'{rank.title()} {taxon_id}',
+                'rank': rank,
+                'rank_level': 70 - rank_idx * 10,
+                'parent_id': parent['id'],
+                'descendant_obs_count': 1,
+                'direct_obs_count': int(rank == 'species'),
+            }
+            for parent in parents
+            for _ in range(LIFE_LIST_BRANCHES)
+        ]
+        results.extend(children)
+        parents = children
+    return LifeList.from_json({'results': results})
+
+
+@pytest.fixture(scope='session')
+def replay_server():
+    with ReplayServer(total_results=2000) as server:
+        yield server
+
+
+@pytest.fixture
+def session(replay_server, tmp_path) -> ClientSession:
+    """A session that sends requests to the replay server, with effectively no rate-limiting"""
+    session = ClientSession(
+        cache_file=tmp_path / 'api_requests.db',
+        bucket_class=InMemoryBucket,
+        per_second=1000,
+        per_minute=60_000,
+        per_day=86_400_000,
+    )
+    yield replay_server.mount(session)
+    session.close()
@@ -0,0 +1,75 @@
+"""Benchmarks for sending requests and paginating results, using a local replay server"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests_ratelimiter import InMemoryBucket
+
+from pyinaturalist.client import ClientSession, iNatClient
+from pyinaturalist.constants import API_V1
+
+
+def test_send__cache_hit(benchmark, session):
+    """Latency of getting a cached response, including request preprocessing and JSON validation"""
+    url = f'{API_V1}/taxa/1'
+    session.get(url)
+    response = benchmark(session.get, url)
+    assert response.from_cache is True
+
+
+def test_paginator_throughput(benchmark, session, replay_server):
+    """Fetch and convert all results from a paginated endpoint (2000 observations, 10 requests)"""
+    client = iNatClient(session=session)
+
+    def paginate():
+        with session.cache_disabled():
+            return client.observations.search().all()
+
+    observations = benchmark.pedantic(paginate, rounds=5)
+    assert len(observations) == replay_server.total_results
+
+
+@pytest.mark.parametrize('shared', [True, False], ids=['shared_session', 'per_thread_sessions'])
+def test_connection_reuse(benchmark, replay_server, tmp_path, shared):
+    """Send 256 requests from 32 threads, with either one shared session (one connection pool) or a
+    separate session per thread
+    """
+    thread_local = threading.local()
+    sessions: list[ClientSession] = []
+
+    def get_session() -> ClientSession:
+        if shared and sessions:
+            return sessions[0]
+        if not hasattr(thread_local, 'session'):
+            thread_local.session = replay_server.mount(
+                ClientSession(
+                    cache_file=tmp_path / f'api_requests_{len(sessions)}.db',
+                    bucket_class=InMemoryBucket,
+                    per_second=10_000,
+                    per_minute=600_000,
+                    per_day=864_000_000,
+                )
+            )
+            sessions.append(thread_local.session)
+        return thread_local.session
+
+    def send_requests():
+        replay_server.connections = 0
+        if shared:
+            get_session()
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            futures = [executor.submit(_get_taxon, get_session, i) for i in range(1, 257)]
+            return [future.result() for future in futures]
+
+    results = benchmark.pedantic(send_requests, rounds=3)
+    assert len(results) == 256
+    benchmark.extra_info['connections'] = replay_server.connections
+    for session in sessions:
+        session.close()
+
+
+def _get_taxon(get_session, taxon_id: int) -> dict:
+    session = get_session()
+    with session.cache_disabled():
+        return session.get(f'{API_V1}/taxa/{taxon_id}').json()
@@ -0,0 +1,54 @@
+"""Benchmarks for converting request params and response values"""
+
+from copy import deepcopy
+
+from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps
+from pyinaturalist.request_params import _params_cache, preprocess_request_params
+
+ROUNDS = 50
+SEARCH_PARAMS = {
+    'taxon_id': [47219, 47220, 47221],
+    'place_id': 6803,
+    'd1': '2020-01-01',
+    'd2': '2024-12-31',
+    'quality_grade': 'research',
+    'photos': True,
+    'iconic_taxa': ['Aves', 'Insecta'],
+    'per_page': 200,
+    'order_by': 'id',
+}
+
+
+def _copy_results(page: dict):
+    """Setup function to get a fresh copy of results for each round, since they're modified in place"""
+    return (deepcopy(page['results']),), {}
+
+
+def test_convert_all_timestamps(benchmark, observation_page):
+    benchmark.pedantic(
+        convert_all_timestamps, setup=lambda: _copy_results(observation_page), rounds=ROUNDS
+    )
+
+
+def test_convert_all_coordinates(benchmark, observation_page):
+    benchmark.pedantic(
+        convert_all_coordinates, setup=lambda: _copy_results(observation_page), rounds=ROUNDS
+    )
+
+
+def test_preprocess_request_params(benchmark):
+    """Preprocess params for a new query (not cached)"""
+
+    def preprocess():
+        _params_cache.clear()
+        return preprocess_request_params(SEARCH_PARAMS)
+
+    params = benchmark(preprocess)
+    assert params['taxon_id'] == '47219,47220,47221'
+
+
+def test_preprocess_request_params__paginated(benchmark):
+    """Preprocess params for subsequent pages of a query, with only pagination params changed"""
+    preprocess_request_params(SEARCH_PARAMS)
+    params = benchmark(preprocess_request_params, {**SEARCH_PARAMS, 'id_above': 12345})
+    assert params['id_above'] == '12345'
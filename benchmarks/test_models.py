@@ -0,0 +1,52 @@
+"""Benchmarks for converting API results to and from model objects"""
+
+from pyinaturalist.formatters import format_table
+from pyinaturalist.models import Observation, Taxon, make_tree, to_json_bytes
+
+
+def test_from_json_list__observations(benchmark, observation_page):
+    observations = benchmark(Observation.from_json_list, observation_page)
+    assert len(observations) == len(observation_page['results'])
+
+
+def test_from_json_list__taxa(benchmark, taxon_page):
+    taxa = benchmark(Taxon.from_json_list, taxon_page)
+    assert len(taxa) == len(taxon_page['results'])
+
+
+def test_to_dict__round_trip(benchmark, observation_page):
+    observations = Observation.from_json_list(observation_page)
+
+    def round_trip():
+        return [Observation.from_json(obs.to_dict()) for obs in observations]
+
+    results = benchmark(round_trip)
+    assert results[0].id == observations[0].id
+
+
+def test_to_dict__raw_round_trip(benchmark, observation_page):
+    """Load and dump observations without accessing nested data, so nothing is converted"""
+
+    def round_trip():
+        observations = Observation.from_json_list(observation_page)
+        return [obs.to_dict(raw=True) for obs in observations]
+
+    results = benchmark(round_trip)
+    assert results[0]['taxon'] is observation_page['results'][0]['taxon']
+
+
+def test_to_json_bytes(benchmark, observation_page):
+    observations = Observation.from_json_list(observation_page)
+    json_bytes = benchmark(to_json_bytes, observations)
+    assert json_bytes.startswith(b'[{')
+
+
+def test_format_table(benchmark, observation_page):
+    observations = Observation.from_json_list(observation_page)
+    table = benchmark(format_table, observations)
+    assert table.row_count == len(observations)
+
+
+def test_make_tree(benchmark, life_list):
+    root = benchmark(make_tree, life_list)
+    assert root.id == 1
@@ -16,6 +16,7 @@ nox.options.sessions = ['lint', 'cov']
 LIVE_DOCS_PORT = 8181
 LIVE_DOCS_IGNORE = ['*.csv', '*.ipynb', '*.pyc', '*.tmp', '**/modules/*', '**/jupyter_execute/*']
 LIVE_DOCS_WATCH = ['pyinaturalist', 'examples']
+BENCHMARK_MAX_REGRESSION = '10%'
 DEFAULT_COVERAGE_FORMATS = ['html', 'term']
 DOC_BUILD_DIR = join('docs', '_build', 'html')
 CLEAN_DIRS = [
@@ -46,6 +47,22 @@ def test(session):
     session.run('pytest', '-n', 'auto', *test_paths)
 
 
+@nox.session(python=False)
+def benchmark(session):
+    """Run benchmarks, and compare results with the previous run (if any).
+    Fails if any benchmark is more than 10% slower than previous results.
+    """
+    cmd = [
+        'pytest',
+        'benchmarks',
+        '--benchmark-autosave',
+        '--benchmark-compare',
+        f'--benchmark-compare-fail=mean:{BENCHMARK_MAX_REGRESSION}',
+        '--benchmark-columns=mean,stddev,rounds',
+    ]
+    session.run(*cmd, *session.posargs)
+
+
 @nox.session(python=False)
 def clean(session):
     """Clean up temporary build + documentation files"""
@@ -4,11 +4,45 @@ This allows abbreviated imports like::
 
     >>> from pyinat import iNatClient, to_csv, to_parquet
 
+Like ``pyinaturalist``, names are imported on first access.
 """
 
-from pyinaturalist import *
+from importlib import import_module as _import_module
+from typing import Any as _Any
 
-try:
-    from pyinaturalist_convert import *
-except ImportError:
-    pass
+import pyinaturalist
+
+
+def __getattr__(name: str) -> _Any:
+    if name == '__all__':
+        value: _Any = sorted(set(pyinaturalist.__all__) | set(_get_convert_names()))
+    # pyinaturalist-convert takes precedence for any duplicate names
+    elif name in _get_convert_names():
+        value = getattr(_import_convert(), name)
+    else:
+        try:
+            value = getattr(pyinaturalist, name)
+        except AttributeError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__getattr__('__all__')))
+
+
+def _import_convert():
+    try:
+        return _import_module('pyinaturalist_convert')
+    except ImportError:
+        return None
+
+
+def _get_convert_names() -> list[str]:
+    module = _import_convert()
+    if module is None:
+        return []
+    names = getattr(module, '__all__', None)
+    return names if names is not None else [n for n in vars(module) if not n.startswith('_')]
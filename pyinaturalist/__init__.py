@@ -1,24 +1,137 @@
 # ruff: noqa: F401, F403
 # isort: skip_file
-from pyinaturalist.client import *
-from pyinaturalist.constants import *
-from pyinaturalist.formatters import enable_logging, format_table, pprint, pprint_tree
-from pyinaturalist.models import *
-from pyinaturalist.request_params import get_interval_ranges
-from pyinaturalist.v0 import *
-from pyinaturalist.v2 import *
-from pyinaturalist.v1 import *
-
-# For disambiguation
-from pyinaturalist.v0 import create_observation as create_observation_v0
-from pyinaturalist.v0 import get_observations as get_observations_v0
-from pyinaturalist.v0 import update_observation as update_observation_v0
-from pyinaturalist.v0 import delete_observation as delete_observation_v0
-from pyinaturalist.v2 import get_observations as get_observations_v2
-from pyinaturalist.v2 import create_observation as create_observation_v2
-from pyinaturalist.v2 import update_observation as update_observation_v2
-from pyinaturalist.v2 import delete_observation as delete_observation_v2
-from pyinaturalist.v2 import upload as upload_v2
-from pyinaturalist.v2 import get_taxa as get_taxa_v2
-from pyinaturalist.v2 import get_taxa_by_id as get_taxa_by_id_v2
-from pyinaturalist.v2 import get_taxa_autocomplete as get_taxa_autocomplete_v2
+"""All public classes and functions are available from the top-level package. Constants are
+imported immediately; everything else is imported on first access (see PEP 562), so programs that
+only need part of the package don't pay the startup cost of importing all of it.
+"""
+
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING
+from typing import Any as _Any
+
+# Static imports for type checkers and IDEs, which can't infer types of lazily imported names
+if TYPE_CHECKING:
+    from pyinaturalist.client import *
+
+    # Type checkers use the first of any duplicate names, so models go before constants
+    from pyinaturalist.models import *
+    from pyinaturalist.constants import *
+    from pyinaturalist.formatters import enable_logging, format_table, pprint, pprint_tree
+    from pyinaturalist.request_params import get_interval_ranges
+    from pyinaturalist.spatial import SpatialIndex
+    from pyinaturalist.store import ObservationStore
+    from pyinaturalist.v0 import *
+    from pyinaturalist.v2 import *
+    from pyinaturalist.v1 import *
+    from pyinaturalist.v0 import create_observation as create_observation_v0
+    from pyinaturalist.v0 import get_observations as get_observations_v0
+    from pyinaturalist.v0 import update_observation as update_observation_v0
+    from pyinaturalist.v0 import delete_observation as delete_observation_v0
+    from pyinaturalist.v2 import get_observations as get_observations_v2
+    from pyinaturalist.v2 import create_observation as create_observation_v2
+    from pyinaturalist.v2 import update_observation as update_observation_v2
+    from pyinaturalist.v2 import delete_observation as delete_observation_v2
+    from pyinaturalist.v2 import upload as upload_v2
+    from pyinaturalist.v2 import get_taxa as get_taxa_v2
+    from pyinaturalist.v2 import get_taxa_by_id as get_taxa_by_id_v2
+    from pyinaturalist.v2 import get_taxa_autocomplete as get_taxa_autocomplete_v2
+else:
+    from pyinaturalist.constants import *
+
+    # Constants with the same name as something in a lazily imported module, which takes precedence
+    _SHADOWED_CONSTANTS = ['ConservationStatus']
+    for _name in _SHADOWED_CONSTANTS:
+        del globals()[_name]
+    del _name
+
+# Modules with contents available at the top level. These are imported in this order, and later
+# modules take precedence for any duplicate names.
+_LAZY_MODULES = [
+    'pyinaturalist.client',
+    'pyinaturalist.models',
+    'pyinaturalist.v0',
+    'pyinaturalist.v2',
+    'pyinaturalist.v1',
+]
+
+# Individual names available at the top level, as {name: (module, attribute)}
+_LAZY_NAMES = {
+    'enable_logging': ('pyinaturalist.formatters', 'enable_logging'),
+    'format_table': ('pyinaturalist.formatters', 'format_table'),
+    'pprint': ('pyinaturalist.formatters', 'pprint'),
+    'pprint_tree': ('pyinaturalist.formatters', 'pprint_tree'),
+    'get_interval_ranges': ('pyinaturalist.request_params', 'get_interval_ranges'),
+    'SpatialIndex': ('pyinaturalist.spatial', 'SpatialIndex'),
+    'ObservationStore': ('pyinaturalist.store', 'ObservationStore'),
+    # For disambiguation
+    'create_observation_v0': ('pyinaturalist.v0', 'create_observation'),
+    'get_observations_v0': ('pyinaturalist.v0', 'get_observations'),
+    'update_observation_v0': ('pyinaturalist.v0', 'update_observation'),
+    'delete_observation_v0': ('pyinaturalist.v0', 'delete_observation'),
+    'get_observations_v2': ('pyinaturalist.v2', 'get_observations'),
+    'create_observation_v2': ('pyinaturalist.v2', 'create_observation'),
+    'update_observation_v2': ('pyinaturalist.v2', 'update_observation'),
+    'delete_observation_v2': ('pyinaturalist.v2', 'delete_observation'),
+    'upload_v2': ('pyinaturalist.v2', 'upload'),
+    'get_taxa_v2': ('pyinaturalist.v2', 'get_taxa'),
+    'get_taxa_by_id_v2': ('pyinaturalist.v2', 'get_taxa_by_id'),
+    'get_taxa_autocomplete_v2': ('pyinaturalist.v2', 'get_taxa_autocomplete'),
+}
+
+
+def __getattr__(name: str) -> _Any:
+    if name == '__all__':
+        value: _Any = _get_all_names()
+    elif name in _LAZY_NAMES:
+        module_name, attr = _LAZY_NAMES[name]
+        value = getattr(_import_module(module_name), attr)
+    elif name.startswith('_'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    else:
+        for module in reversed(_import_lazy_modules()):
+            if name in _get_public_names(module):
+                value = getattr(module, name)
+                break
+        else:
+            value = _import_submodule(name)
+
+    # Save the value so this is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_get_all_names()))
+
+
+def _get_all_names() -> list[str]:
+    """Get all public names, including ones that haven't been imported yet. This imports all lazily
+    loaded modules, and is needed for ``from pyinaturalist import *``.
+    """
+    names = {name for name in globals() if not name.startswith('_')}
+    names |= set(_LAZY_NAMES)
+    for module in _import_lazy_modules():
+        names |= _get_public_names(module)
+    return sorted(names)
+
+
+def _import_lazy_modules() -> list:
+    return [_import_module(module_name) for module_name in _LAZY_MODULES]
+
+
+def _import_submodule(name: str) -> _Any:
+    """Get a submodule by name (e.g., ``pyinaturalist.converters``)"""
+    try:
+        return _import_module(f'{__name__}.{name}')
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+
+def _get_public_names(module) -> set[str]:
+    """Get the names that would be imported by ``from module import *``"""
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith('_')]
+    return set(names)
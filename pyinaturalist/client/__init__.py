@@ -1,31 +1,78 @@
 # ruff: noqa: F401, F403, F405
 # isort: skip_file
+from typing import TYPE_CHECKING, Any
+
+from pyinaturalist.client.bulk import BulkExecutor, BulkReport, BulkResult, run_bulk
 from pyinaturalist.client.paginator import *
 from pyinaturalist.client.session import *
+from pyinaturalist.client.streaming import (
+    MultipartStream,
+    iter_csv_rows,
+    iter_json_results,
+    iter_xml_elements,
+    read_json_stream,
+)
+from pyinaturalist.client.timing import RequestTiming, TimingCallback
 from pyinaturalist.client.oauth import *
 from pyinaturalist.client.oauth_callback import *
-from pyinaturalist.client.client import iNatClient
+from pyinaturalist.client.tiling import BoundingBox, TiledPaginator
+from pyinaturalist.client.download import DownloadReport, MediaDownload, download_media
+
+# iNatClient depends on controllers and API functions, which depend on this package; so it's imported
+# on first access, to allow importing those modules first
+if TYPE_CHECKING:
+    from pyinaturalist.client.client import iNatClient
 
 __all__ = [
     'AutocompletePaginator',
+    'BoundingBox',
+    'BulkExecutor',
+    'BulkReport',
+    'BulkResult',
+    'CacheMetrics',
+    'ConcurrentPaginator',
+    'DownloadReport',
     'ClientSession',
     'FileLockSQLiteBucket',
     'IDPaginator',
     'IDRangePaginator',
     'JsonPaginator',
+    'MediaDownload',
+    'MultipartStream',
     'Paginator',
+    'PreloadReport',
+    'RequestTiming',
+    'TiledPaginator',
+    'TimingCallback',
     'WrapperPaginator',
     'build_authorize_url',
     'clear_cache',
     'delete',
+    'download_media',
     'get',
     'get_access_token',
     'get_access_token_via_auth_code',
     'get_auth_code_via_server',
     'get_local_session',
+    'get_shared_session',
     'iNatClient',
+    'iter_csv_rows',
+    'iter_json_results',
+    'iter_xml_elements',
     'paginate_all',
     'post',
     'put',
+    'read_json_stream',
+    'run_bulk',
     'set_keyring_credentials',
+    'use_shared_session',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'iNatClient':
+        from pyinaturalist.client.client import iNatClient
+
+        globals()['iNatClient'] = iNatClient
+        return iNatClient
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,216 @@
+"""Utilities for sending many independent requests concurrently, e.g. for bulk uploads"""
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from logging import getLogger
+from time import perf_counter, sleep
+from typing import Any, Generic, TypeVar
+
+from requests.exceptions import ConnectionError, HTTPError, RetryError, Timeout
+from urllib3.exceptions import MaxRetryError
+
+from pyinaturalist.constants import (
+    BULK_MAX_ATTEMPTS,
+    BULK_MAX_WORKERS,
+    RETRY_BACKOFF,
+    RETRY_STATUSES,
+)
+
+ItemT = TypeVar('ItemT')
+logger = getLogger(__name__)
+
+
+@dataclass
+class BulkResult(Generic[ItemT]):
+    """Result of a single item in a bulk request"""
+
+    item: ItemT  #: Input item
+    result: Any = None  #: Return value for the item, if successful
+    error: Exception | None = None  #: Last error raised for the item, if unsuccessful
+    attempts: int = 0  #: Number of attempts made
+    elapsed: float = 0.0  #: Total time spent on the item, in seconds
+    children: list['BulkResult'] = field(default_factory=list)  #: Results of any follow-up requests
+
+    @property
+    def ok(self) -> bool:
+        """The item and all of its follow-up requests succeeded"""
+        return self.error is None and all(child.ok for child in self.children)
+
+
+class BulkReport(list[BulkResult]):
+    """Results of a bulk request, in the same order as the input items"""
+
+    @property
+    def succeeded(self) -> list[BulkResult]:
+        return [result for result in self if result.ok]
+
+    @property
+    def failed(self) -> list[BulkResult]:
+        return [result for result in self if not result.ok]
+
+    @property
+    def summary(self) -> str:
+        return f'{len(self)} items: {len(self.succeeded)} succeeded, {len(self.failed)} failed'
+
+
+class BulkExecutor:
+    """Thread pool that runs request functions with retries, and records a :py:class:`.BulkResult`
+    for each item. Follow-up requests for an item (for example, setting observation fields after
+    creating an observation) can be submitted as soon as it succeeds, so they run concurrently with
+    the remaining items.
+
+    Args:
+        max_workers: Maximum number of items to process at once
+        max_attempts: Maximum number of times to try each item
+        callback: Function to call with each result after it completes (for example, to show
+            progress)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = BULK_MAX_WORKERS,
+        max_attempts: int = BULK_MAX_ATTEMPTS,
+        callback: Callable[[BulkResult], None] | None = None,
+    ):
+        self.callback = callback
+        self.max_attempts = max_attempts
+        self.results = BulkReport()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._pending: deque[tuple[Future, BulkResult]] = deque()
+
+    def __enter__(self) -> 'BulkExecutor':
+        return self
+
+    def __exit__(self, *args):
+        # Cancel any items that haven't started yet, e.g. if submitting items failed
+        self._executor.shutdown(cancel_futures=True)
+
+    def submit(
+        self,
+        func: Callable[[ItemT], Any],
+        item: ItemT,
+        on_success: Callable[[BulkResult[ItemT]], None] | None = None,
+        parent: BulkResult | None = None,
+    ) -> BulkResult[ItemT]:
+        """Submit an item to process
+
+        Args:
+            func: Function to call with the item
+            item: Item to process
+            on_success: Function to call with the result if successful, from the same worker thread.
+                If it raises an error, the error is recorded in the result.
+            parent: Record the result as a follow-up request for this result, instead of as a
+                top-level result
+        """
+        result: BulkResult[ItemT] = BulkResult(item)
+        (parent.children if parent else self.results).append(result)
+        future = self._executor.submit(self._run_item, func, result, on_success)
+        with self._lock:
+            self._pending.append((future, result))
+        return result
+
+    def add_failure(self, item: ItemT, error: Exception) -> BulkResult[ItemT]:
+        """Record an item that failed before it could be submitted (for example, with invalid
+        parameters), so it's included in results and passed to the callback like any other item
+        """
+        result: BulkResult[ItemT] = BulkResult(item, error=error)
+        future: Future = Future()
+        future.set_result(None)
+        self.results.append(result)
+        with self._lock:
+            self._pending.append((future, result))
+        return result
+
+    def wait(self) -> BulkReport:
+        """Wait for all submitted items, including any follow-up requests, to complete. If a
+        callback was provided, it is called from this thread with each result as it completes.
+        """
+        running: dict[Future, BulkResult] = {}
+        while True:
+            # Follow-up requests are submitted before their parent item completes, so they will
+            # always be queued by the time the parent's completion is handled here
+            with self._lock:
+                while self._pending:
+                    future, result = self._pending.popleft()
+                    running[future] = result
+            if not running:
+                break
+
+            done, _ = wait_futures(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+                result = running.pop(future)
+                if self.callback:
+                    self.callback(result)
+
+        self._executor.shutdown()
+        logger.info(f'Bulk request completed: {self.results.summary}')
+        return self.results
+
+    def _run_item(self, func: Callable, result: BulkResult, on_success: Callable | None = None):
+        start = perf_counter()
+        while result.attempts < self.max_attempts:
+            if result.attempts:
+                sleep(RETRY_BACKOFF * 2 ** (result.attempts - 1))
+            result.attempts += 1
+            try:
+                result.result = func(result.item)
+                result.error = None
+                break
+            except Exception as e:
+                result.error = e
+                if not is_retryable_error(e):
+                    break
+                logger.warning(f'Attempt {result.attempts} failed for {result.item}: {e}')
+        result.elapsed = perf_counter() - start
+
+        if result.error is None and on_success:
+            try:
+                on_success(result)
+            except Exception as e:
+                logger.warning(f'Follow-up for {result.item} failed: {e}')
+                result.error = e
+
+
+def run_bulk(
+    func: Callable[[ItemT], Any],
+    items: Iterable[ItemT],
+    max_workers: int = BULK_MAX_WORKERS,
+    max_attempts: int = BULK_MAX_ATTEMPTS,
+    callback: Callable[[BulkResult[ItemT]], None] | None = None,
+) -> BulkReport:
+    """Call a function for each item using a bounded thread pool. Failures are recorded per item
+    instead of raised, and transient errors (connection errors, timeouts, and server errors) are
+    retried with exponential backoff.
+
+    All requests still go through the same rate limiter, so ``max_workers`` mainly helps with
+    overlapping network latency and upload time, rather than exceeding rate limits.
+
+    Args:
+        func: Function to call with each item
+        items: Items to process
+        max_workers: Maximum number of items to process at once
+        max_attempts: Maximum number of times to try each item
+        callback: Function to call with each result after it completes (for example, to show
+            progress)
+
+    Returns:
+        Results for each item, in the same order as the input
+    """
+    with BulkExecutor(max_workers, max_attempts, callback) as executor:
+        for item in items:
+            executor.submit(func, item)
+        return executor.wait()
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Determine if a failed request is likely to succeed if sent again"""
+    if isinstance(error, HTTPError):
+        status = getattr(error.response, 'status_code', None)
+        return status == 429 or status in RETRY_STATUSES
+    return isinstance(error, (ConnectionError, MaxRetryError, RetryError, Timeout))
@@ -2,26 +2,33 @@
 # TODO: Improve Sphinx docs generated for controller attributes
 # TODO: Use a custom template or directive to generate summary of all controller methods
 from asyncio import AbstractEventLoop
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from inspect import ismethod
 from logging import getLogger
 from typing import Any, Literal
 
-from requests import HTTPError
+from requests import HTTPError, Request
 
 from pyinaturalist.client.oauth import (
     _decode_jwt_exp,
     get_access_token,
     get_access_token_via_auth_code,
 )
-from pyinaturalist.client.paginator import Paginator
-from pyinaturalist.client.session import ClientSession
-from pyinaturalist.constants import RequestParams
+from pyinaturalist.client.paginator import Paginator, _chunkify
+from pyinaturalist.client.session import ClientSession, PreloadReport
+from pyinaturalist.constants import (
+    API_V1,
+    BULK_MAX_WORKERS,
+    ICONIC_TAXA,
+    MAX_IDS_PER_REQUEST,
+    RequestParams,
+)
 from pyinaturalist.controllers import (
     AnnotationController,
     IdentificationController,
+    MediaController,
     ObservationController,
     ObservationFieldController,
     PlaceController,
@@ -33,6 +40,7 @@ from pyinaturalist.controllers import (
 from pyinaturalist.exceptions import AuthenticationError
 from pyinaturalist.models import T
 from pyinaturalist.request_params import get_valid_kwargs, strip_empty_values
+from pyinaturalist.v1 import get_controlled_terms, get_places_by_id, get_taxa_by_id
 
 JWT_EXPIRY_BUFFER = timedelta(seconds=60)
 
@@ -83,6 +91,7 @@ class iNatClient:
 
     * :fa:`tag` :py:class:`annotations <.AnnotationController>`
     * :fa:`fingerprint` :py:class:`identifications <.IdentificationController>`
+    * :fa:`camera` :py:class:`media <.MediaController>`
     * :fa:`binoculars` :py:class:`observations <.ObservationController>`
     * :fa:`tag` :py:class:`observation_fields <.ObservationFieldController>`
     * :fa:`location-dot` :py:class:`places <.PlaceController>`
@@ -132,6 +141,9 @@ class iNatClient:
         self.identifications = IdentificationController(
             self
         )  #: Interface for :py:class:`identification requests <.IdentificationController>`
+        self.media = MediaController(
+            self
+        )  #: Interface for :py:class:`media downloads <.MediaController>`
         self.observations = ObservationController(
             self
         )  #: Interface for :py:class:`observation requests <.ObservationController>`
@@ -242,6 +254,82 @@ class iNatClient:
         kwargs = self.add_defaults(request_function, kwargs, auth)
         return cls(request_function, model, loop=self.loop, **kwargs)
 
+    def warm_cache(
+        self,
+        controlled_terms: bool = True,
+        iconic_taxa: bool = True,
+        place_ids: Iterable[int] | None = None,
+        taxon_ids: Iterable[int] | None = None,
+        ancestors: bool = True,
+        max_workers: int = BULK_MAX_WORKERS,
+        refresh: bool = False,
+    ) -> PreloadReport:
+        """Fetch reference data into the cache ahead of time, so later requests for it don't need
+        to wait on the API. See :py:meth:`.ClientSession.preload` for details.
+
+        Records are requested in the same batches used by the corresponding controller methods, so
+        for example, ``client.places.from_ids(place_ids)`` will be fully cached afterward.
+
+        Example:
+            >>> report = client.warm_cache(place_ids=[1, 14, 97394], taxon_ids=[47219, 54327])
+            >>> print(report.summary)
+            6 requests: 4 fetched, 0 revalidated, 2 fresh, 0 failed
+
+        Args:
+            controlled_terms: Fetch all controlled terms (annotations)
+            iconic_taxa: Fetch all iconic taxa
+            place_ids: Place IDs to fetch
+            taxon_ids: Taxon IDs to fetch
+            ancestors: Also fetch all ancestors of ``taxon_ids``
+            max_workers: Maximum number of requests to send at once
+            refresh: Revalidate all cached responses, even if they haven't expired yet
+        """
+        requests: list[Request] = []
+        if controlled_terms:
+            requests.append(self._prepare_preload(get_controlled_terms, 'controlled_terms'))
+        if iconic_taxa:
+            requests += self._prepare_id_batches(
+                get_taxa_by_id, 'taxa', [i for i in ICONIC_TAXA if i]
+            )
+        if place_ids:
+            requests += self._prepare_id_batches(get_places_by_id, 'places', place_ids)
+        if taxon_ids:
+            requests += self._prepare_id_batches(get_taxa_by_id, 'taxa', taxon_ids)
+        report = self.session.preload(requests, max_workers=max_workers, refresh=refresh)
+
+        # Ancestor IDs are only known after fetching the target taxa
+        if taxon_ids and ancestors:
+            target_ids = set(taxon_ids)
+            ancestor_ids = {
+                ancestor_id
+                for result in report.succeeded
+                if result.item.url.startswith(f'{API_V1}/taxa/')
+                for taxon in result.result.json().get('results', [])
+                if taxon.get('id') in target_ids
+                for ancestor_id in taxon.get('ancestor_ids', [])
+            }
+            report += self.session.preload(
+                self._prepare_id_batches(get_taxa_by_id, 'taxa', sorted(ancestor_ids - target_ids)),
+                max_workers=max_workers,
+                refresh=refresh,
+            )
+        return report
+
+    def _prepare_id_batches(
+        self, request_function: Callable, endpoint: str, ids: Iterable[int]
+    ) -> list[Request]:
+        return [
+            self._prepare_preload(request_function, endpoint, ids=batch)
+            for batch in _chunkify(dict.fromkeys(ids), MAX_IDS_PER_REQUEST)
+        ]
+
+    def _prepare_preload(self, request_function: Callable, endpoint: str, **kwargs) -> Request:
+        """Prepare a GET request with the same default params that ``request_function`` would use"""
+        params = get_valid_kwargs(request_function, self.default_params)
+        return self.session.prepare_inat_request(
+            'GET', f'{API_V1}/{endpoint}', params=params, **kwargs
+        )
+
     def request(self, request_function: Callable, *args, auth: bool = False, **kwargs):
         """Send a request, with client settings applied.
 
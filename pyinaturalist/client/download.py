@@ -0,0 +1,222 @@
+"""Utilities for downloading photo and sound files in bulk"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from requests import Response
+
+from pyinaturalist.client.bulk import BulkReport, BulkResult, run_bulk
+from pyinaturalist.client.session import ClientSession, get_local_session
+from pyinaturalist.constants import (
+    BULK_MAX_ATTEMPTS,
+    BULK_MAX_WORKERS,
+    STREAM_CHUNK_SIZE,
+    PathOrStr,
+)
+
+if TYPE_CHECKING:
+    from pyinaturalist.models import Photo, Sound
+
+# Downloaded files are already saved locally, so skip reading from or writing to the HTTP cache
+DOWNLOAD_HEADERS = {'Accept': '*/*', 'Cache-Control': 'no-store'}
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class MediaDownload:
+    """Result of downloading a single photo or sound file"""
+
+    path: Path  #: Local file path
+    status: str  #: One of ``'downloaded'``, ``'resumed'``, or ``'skipped'``
+    size: int = 0  #: File size, in bytes
+
+
+class DownloadReport(BulkReport):
+    """Results of a bulk media download. Each successful result contains a
+    :py:class:`.MediaDownload`.
+    """
+
+    @property
+    def downloaded(self) -> list[BulkResult]:
+        """Files that were downloaded in full"""
+        return self._with_status('downloaded')
+
+    @property
+    def resumed(self) -> list[BulkResult]:
+        """Files that were partially downloaded before, and completed this time"""
+        return self._with_status('resumed')
+
+    @property
+    def skipped(self) -> list[BulkResult]:
+        """Files that had already been downloaded"""
+        return self._with_status('skipped')
+
+    @property
+    def summary(self) -> str:
+        return (
+            f'{len(self)} files: {len(self.downloaded)} downloaded, {len(self.resumed)} resumed, '
+            f'{len(self.skipped)} skipped, {len(self.failed)} failed'
+        )
+
+    def _with_status(self, status: str) -> list[BulkResult]:
+        return [r for r in self.succeeded if r.result.status == status]
+
+
+def download_media(
+    media: Iterable['Photo | Sound'],
+    dest: PathOrStr = '.',
+    size: str = 'medium',
+    session: ClientSession | None = None,
+    verify: bool = False,
+    overwrite: bool = False,
+    max_workers: int = BULK_MAX_WORKERS,
+    max_attempts: int = BULK_MAX_ATTEMPTS,
+    callback: Callable[[BulkResult], None] | None = None,
+) -> DownloadReport:
+    """Download many photo and/or sound files to a local directory, with multiple downloads in
+    progress at once.
+
+    Files are streamed to disk in chunks, and are named by ID (for example, ``12345_medium.jpg`` for
+    photos and ``12345.wav`` for sounds). This can safely be run again on the same directory, for
+    example after an interrupted download:
+
+    * Files that have already been downloaded will be skipped
+    * Incomplete files (saved with a ``.part`` suffix) will be resumed where they left off, if
+      supported by the server and the remote file hasn't changed
+
+    Downloaded files aren't stored in the HTTP cache, but requests are still rate-limited.
+
+    Example:
+        >>> observations = client.observations.search(taxon_id=47219, photos=True).limit(500)
+        >>> photos = [photo for obs in observations for photo in obs.photos]
+        >>> report = download_media(photos, dest='~/honey_bees', size='large')
+        >>> print(report.summary)
+        812 files: 812 downloaded, 0 resumed, 0 skipped, 0 failed
+
+    Args:
+        media: Photos and/or sounds to download
+        dest: Directory to save files in
+        size: Photo size to download (see :py:data:`.PHOTO_SIZES`); ignored for sounds
+        session: Session to use for downloads; defaults to a thread-local session
+        verify: Instead of assuming existing files are complete, check their size against the
+            remote file size (requires a ``HEAD`` request per file)
+        overwrite: Download files again even if they already exist
+        max_workers: Maximum number of files to download at once
+        max_attempts: Maximum number of times to try downloading each file
+        callback: Function to call with each :py:class:`.BulkResult` as it completes
+
+    Returns:
+        A :py:class:`.BulkResult` for each file, in the same order as the input. Each result's
+        ``item`` is a :py:class:`.Photo` or :py:class:`.Sound`, and ``result`` is a
+        :py:class:`.MediaDownload`. Duplicate files are only included once.
+    """
+    dest = Path(dest).expanduser()
+    dest.mkdir(parents=True, exist_ok=True)
+    session = session or get_local_session()
+
+    # Avoid downloading the same file more than once at the same time
+    items, filenames = [], set()
+    for item in media:
+        filename = _try_get_filename(item, size)
+        if filename is None or filename not in filenames:
+            filenames.add(filename)
+            items.append(item)
+    logger.info(f'Downloading {len(items)} files to {dest}')
+
+    def _download(item: 'Photo | Sound') -> MediaDownload:
+        path = dest / get_media_filename(item, size)
+        return _download_file(session, _get_media_url(item, size), path, verify, overwrite)
+
+    report = run_bulk(
+        _download, items, max_workers=max_workers, max_attempts=max_attempts, callback=callback
+    )
+    report = DownloadReport(report)
+    logger.info(f'Download completed: {report.summary}')
+    return report
+
+
+def get_media_filename(media: 'Photo | Sound', size: str = 'medium') -> str:
+    """Get the local filename to use for a downloaded photo or sound"""
+    url_name = _get_media_url(media, size).rsplit('/', 1)[-1].split('?')[0]
+    is_photo = hasattr(media, 'url_size')
+    # Photo URLs guessed from IDs don't have an extension, but will be JPEG
+    ext = url_name.rsplit('.', 1)[-1].lower() if '.' in url_name else 'jpg' if is_photo else 'bin'
+    name = f'{media.id}_{size}' if is_photo else str(media.id)
+    return f'{name}.{ext}'
+
+
+def _try_get_filename(media: 'Photo | Sound', size: str) -> str | None:
+    try:
+        return get_media_filename(media, size)
+    except ValueError:
+        return None
+
+
+def _get_media_url(media: 'Photo | Sound', size: str) -> str:
+    url_size = getattr(media, 'url_size', None)
+    url = (url_size(size) if url_size else None) or media.url
+    if not url:
+        raise ValueError(f'No URL available for {media}')
+    return url
+
+
+def _download_file(
+    session: ClientSession, url: str, path: Path, verify: bool = False, overwrite: bool = False
+) -> MediaDownload:
+    """Download a single file, resuming a previous partial download if possible"""
+    if path.exists() and not overwrite:
+        size = path.stat().st_size
+        if not verify or _get_remote_size(session, url) in (size, None):
+            return MediaDownload(path, 'skipped', size)
+
+    # Use an existing partial download, if any, only if the remote file hasn't changed since then
+    part_path = path.with_name(f'{path.name}.part')
+    etag_path = path.with_name(f'{path.name}.etag')
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    etag = etag_path.read_text() if etag_path.exists() else None
+    headers = dict(DOWNLOAD_HEADERS)
+    if offset and etag:
+        headers['Range'] = f'bytes={offset}-'
+        headers['If-Range'] = etag
+
+    response = session.request(
+        'GET',
+        url,
+        headers=headers,
+        raise_for_status=False,
+        stream=True,
+    )
+    # The partial download was already complete
+    if response.status_code == 416 and offset:
+        response.close()
+        return _finish_download(part_path, etag_path, path, 'resumed')
+    response.raise_for_status()
+
+    # A full response means the server either doesn't support ranges or the file has changed
+    resumed = response.status_code == 206
+    if new_etag := response.headers.get('ETag'):
+        etag_path.write_text(new_etag)
+    _write_response(response, part_path, append=resumed)
+    return _finish_download(part_path, etag_path, path, 'resumed' if resumed else 'downloaded')
+
+
+def _get_remote_size(session: ClientSession, url: str) -> int | None:
+    response = session.request('HEAD', url, headers=dict(DOWNLOAD_HEADERS), allow_redirects=True)
+    length = response.headers.get('Content-Length')
+    return int(length) if length else None
+
+
+def _write_response(response: Response, path: Path, append: bool = False):
+    with response, path.open('ab' if append else 'wb') as f:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            f.write(chunk)
+
+
+def _finish_download(part_path: Path, etag_path: Path, path: Path, status: str) -> MediaDownload:
+    part_path.replace(path)
+    etag_path.unlink(missing_ok=True)
+    return MediaDownload(path, status, path.stat().st_size)
@@ -3,9 +3,11 @@
 from asyncio import AbstractEventLoop, get_running_loop
 from collections import deque
 from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+from json import JSONDecodeError
 from logging import getLogger
-from math import ceil
+from math import ceil, inf
+from time import perf_counter, sleep
 from typing import (
     TYPE_CHECKING,
     Generic,
@@ -13,11 +15,16 @@ from typing import (
 
 from requests import Response
 
+from pyinaturalist.client.streaming import read_json_stream
+from pyinaturalist.client.timing import TimingMixin
 from pyinaturalist.constants import (
+    BULK_MAX_WORKERS,
     EXPORT_URL,
     LARGE_REQUEST_WARNING,
     PER_PAGE_RESULTS,
+    REQUEST_RETRIES,
     REQUESTS_PER_MINUTE,
+    RETRY_BACKOFF,
     IntOrStr,
     JsonResponse,
     RequestParams,
@@ -38,6 +45,9 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         limit: Maximum number of total results to fetch
         per_page: Maximum number of results to fetch per page
         loop: An event loop to use to run any executors used for async iteration
+        stream: Incrementally parse each page of results while it is being downloaded, to reduce
+            peak memory usage. Requires a ``request_function`` that returns a response object.
+            Pages with invalid (truncated) JSON are requested again, like non-streamed responses.
         kwargs: Original request parameters
     """
 
@@ -49,6 +59,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         limit: int | None = None,
         per_page: int | None = None,
         loop: AbstractEventLoop | None = None,
+        stream: bool = False,
         **request_kwargs,
     ):
         self.request_function = request_function
@@ -62,6 +73,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         self.per_page = per_page or PER_PAGE_RESULTS
         self.page = 1
         self.results_fetched = 0
+        self.stream = stream
         self.total_limit = limit
         self.total_results: int | None = None
 
@@ -127,7 +139,18 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
 
     def next_page(self) -> list[T]:
         """Get the next page of results, as model objects"""
-        return self.model.from_json_list(self._next_page())
+        session = self.request_kwargs.get('session')
+        if not isinstance(session, TimingMixin):
+            return self.model.from_json_list(self._next_page())
+
+        # Add model conversion time to the timing details for the request
+        with session.defer_timing() as timings:
+            results = self._next_page()
+            start = perf_counter()
+            models = self.model.from_json_list(results)
+            if timings:
+                timings[-1].add('model_conversion', perf_counter() - start)
+        return models
 
     def _next_page(self) -> list[ResponseResult]:
         """Get the next page of results, as raw JSON"""
@@ -138,14 +161,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         if self.total_limit and self.results_fetched + self.per_page > self.total_limit:
             self.per_page = self.total_limit - self.results_fetched
 
-        # Fetch results; handle response object or dict
-        response = self.request_function(
-            *self.request_args,
-            **self.request_kwargs,
-            **self._get_pagination_kwargs(),
-        )
-        if isinstance(response, Response):
-            response = response.json()
+        response = self._get_response()
         results = response.get('results', response)
 
         # Note: For id-based pagination, only the first page's 'total_results' is accurate
@@ -161,6 +177,30 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
 
         return results
 
+    def _get_response(self) -> JsonResponse:
+        """Fetch the current page; handle response object or dict"""
+        kwargs = {**self.request_kwargs, **self._get_pagination_kwargs()}
+        if not self.stream:
+            response = self.request_function(*self.request_args, **kwargs)
+            return response.json() if isinstance(response, Response) else response
+
+        # Streamed responses aren't validated by ClientSession.send(), so invalid (truncated) JSON
+        # is retried here instead
+        retries = 0
+        while True:
+            response = self.request_function(*self.request_args, **kwargs, stream=True)
+            if not isinstance(response, Response):
+                return response
+            try:
+                return read_json_stream(response)
+            except JSONDecodeError:
+                if retries >= REQUEST_RETRIES:
+                    raise
+                _logger.info('Invalid JSON response; retrying...')
+                sleep(RETRY_BACKOFF * 2**retries)
+                retries += 1
+                kwargs['force_refresh'] = True
+
     # The following two methods may be overridden by subclasses for different pagination methods
     def _get_pagination_kwargs(self) -> RequestParams:
         """Get any extra request parameters needed for pagination"""
@@ -285,6 +325,107 @@ def _chunkify(iterable: Iterable, max_size: int) -> Iterator[list]:
         yield iterable[index : index + max_size]
 
 
+class ConcurrentPaginator(Paginator):
+    """Paginator that fetches the first page to get the total number of results, and then fetches
+    the remaining pages concurrently. Pages are still returned in order. This is much faster for
+    queries with many pages of results, although requests are still rate-limited.
+
+    Only a few pages are requested ahead of the page currently being returned, so stopping early
+    (with a ``limit``, ``one()``, or ``break``) doesn't leave a large number of requests running.
+    Use :py:meth:`.close` to cancel any remaining requests if the paginator isn't fully iterated.
+
+    This only works for endpoints that support page-based pagination, and for which results are not
+    likely to change while they are being fetched.
+
+    Args:
+        max_workers: Maximum number of requests to send at once
+    """
+
+    def __init__(self, *args, max_workers: int = BULK_MAX_WORKERS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: deque[Future] = deque()
+        self._next_submit = 2
+        self._last_page = 1
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            yield from super().__iter__()
+        finally:
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        try:
+            async for result in super().__aiter__():
+                yield result
+        finally:
+            self.close()
+
+    def one(self) -> T | None:
+        """Get the first result from the query, without fetching any other pages"""
+        self.total_limit = 1
+        return super().one()
+
+    async def async_one(self):
+        self.total_limit = 1
+        return await super().async_one()
+
+    def close(self):
+        """Cancel any pending requests, and stop fetching further pages"""
+        self.exhausted = True
+        for future in self._futures:
+            future.cancel()
+        self._futures.clear()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def _next_page(self) -> list[ResponseResult]:
+        if self.exhausted:
+            return []
+        if self._executor is None:
+            return self._first_page()
+
+        response = self._futures.popleft().result()
+        results = response.get('results', response)
+        if self.total_limit:
+            results = results[: self.total_limit - self.results_fetched]
+        self.results_fetched += len(results)
+        self.page += 1
+        self._submit_pages()
+        if not self._futures:
+            self.close()
+        return results
+
+    def _first_page(self) -> list[ResponseResult]:
+        """Get the first page of results, and then start fetching the remaining pages"""
+        results = super()._next_page()
+        if self.exhausted:
+            return results
+
+        # Use the actual page size, in case it's different from the requested page size
+        self.per_page = len(results)
+        total = min(self.total_results or 0, self.total_limit or inf)
+        self._last_page = ceil(total / self.per_page)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._submit_pages()
+        if not self._futures:
+            self.close()
+        return results
+
+    def _submit_pages(self):
+        """Keep up to ``max_workers`` requests queued or running ahead of the current page"""
+        while len(self._futures) < self.max_workers and self._next_submit <= self._last_page:
+            self._futures.append(self._executor.submit(self._get_page, self._next_submit))
+            self._next_submit += 1
+
+    def _get_page(self, page: int) -> JsonResponse:
+        response = self.request_function(
+            *self.request_args, **self.request_kwargs, page=page, per_page=self.per_page
+        )
+        return response.json() if isinstance(response, Response) else response
+
+
 class AutocompletePaginator(Paginator):
     """Paginator that attempts to get as many results as possible from an autocomplete endpoint.
     This is necessary for some problematic queries for which there are many matches but not ranked
@@ -366,14 +507,32 @@ class JsonIDRangePaginator(JsonPaginatorMixin, IDRangePaginator):
     pass
 
 
+class JsonConcurrentPaginator(JsonPaginatorMixin, ConcurrentPaginator):
+    def __iter__(self) -> Iterator[ResponseResult]:  # type: ignore[override]
+        """Iterate over raw paginated results, and cancel pending requests if stopped early"""
+        try:
+            yield from super().__iter__()
+        finally:
+            self.close()
+
+
 def paginate_all(request_function: Callable, *args, method: str = 'page', **kwargs) -> JsonResponse:
     """Get all pages of a multi-page request. Explicit pagination parameters will be overridden.
 
+    Args:
+        request_function: API request function to paginate
+        method: Pagination method: ``'page'`` (page number), ``'id'`` (ID range), or
+            ``'concurrent'`` (page number, with pages after the first fetched concurrently)
+
     Returns:
         Response dict containing combined results, in the same format as ``api_func``
     """
-    paginator = JsonIDRangePaginator if method == 'id' else JsonPaginator
-    return paginator(request_function, *args, **kwargs).all()
+    paginators: dict[str, type[JsonPaginatorMixin]] = {
+        'concurrent': JsonConcurrentPaginator,
+        'id': JsonIDRangePaginator,
+        'page': JsonPaginator,
+    }
+    return paginators.get(method, JsonPaginator)(request_function, *args, **kwargs).all()
 
 
 class WrapperPaginator(Paginator):
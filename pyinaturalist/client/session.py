@@ -3,12 +3,14 @@
 import json
 import threading
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import timedelta
 from importlib.metadata import version as pkg_version
 from json import JSONDecodeError
 from logging import DEBUG, INFO, getLogger
 from os import getenv
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from requests import ConnectionError, PreparedRequest, Request, Response, Session
@@ -35,11 +37,23 @@ from urllib3.util import Retry, Timeout
 from urllib3.util.timeout import _DEFAULT_TIMEOUT as _UNSET
 from urllib3.util.timeout import _TYPE_TIMEOUT as TimeoutType
 
+from pyinaturalist.client.bulk import BulkExecutor, BulkReport, BulkResult
+from pyinaturalist.client.streaming import MultipartStream, ProgressCallback
+from pyinaturalist.client.timing import (
+    CacheTimingMixin,
+    TimingCallback,
+    TimingMixin,
+    TransportTimingMixin,
+)
 from pyinaturalist.constants import (
+    BULK_MAX_WORKERS,
     CACHE_EXPIRATION,
     CACHE_FILE,
     CONNECT_TIMEOUT,
     IGNORED_PARAMETERS,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
     RATELIMIT_FILE,
     REQUEST_BURST_RATE,
     REQUEST_RETRIES,
@@ -66,9 +80,14 @@ from pyinaturalist.request_params import (
 
 _logger = getLogger('pyinaturalist')
 thread_local = threading.local()
+_shared_session: 'ClientSession | None' = None
+_shared_session_enabled = False
+_shared_session_lock = threading.Lock()
 
 
-class ClientSession(CacheMixin, LimiterMixin, Session):
+class ClientSession(
+    TimingMixin, CacheMixin, CacheTimingMixin, LimiterMixin, TransportTimingMixin, Session
+):
     """Custom session class used for sending API requests. Combines the following features and
     settings:
 
@@ -76,6 +95,17 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
     * Rate-limiting (skipped for cached requests)
     * Retries
     * Timeouts
+    * Conditional requests
+    * Per-request timing
+
+    Expired cache entries and ``refresh=True`` requests are revalidated with the server using any
+    ``ETag`` or ``Last-Modified`` validators from the cached response. If the server responds with
+    ``304 Not Modified``, the cached response is renewed without downloading it again. Cache usage
+    is tracked in :py:attr:`.cache_metrics`.
+
+    To see where time is spent for each request (cache, rate-limiting, network, decoding, and
+    retries), pass a ``timing_callback`` function, which will be called with a
+    :py:class:`.RequestTiming` object after each request is completed.
     """
 
     def __init__(
@@ -96,6 +126,10 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         timeout: float | None = REQUEST_TIMEOUT,
         write_timeout: float | None = WRITE_TIMEOUT,
         user_agent: str | None = None,
+        timing_callback: TimingCallback | None = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
         **kwargs,
     ):
         """Get a Session object, optionally with custom settings for caching and rate-limiting.
@@ -124,6 +158,12 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             write_timeout: Maximum number of seconds to wait for sending data (create/update);
                 ignored if ``timeout=None``
             user_agent: Additional User-Agent info to pass to API requests
+            timing_callback: Function to call with a :py:class:`.RequestTiming` after each request
+            pool_connections: Number of connection pools (one per host) to keep open
+            pool_maxsize: Maximum number of open connections to keep and reuse per host. When
+                sharing a session across threads, this should be at least the number of threads.
+            pool_block: When all connections to a host are in use, wait for one to be released
+                instead of opening a new connection that will be discarded after use
             kwargs: Additional keyword arguments for :py:class:`~requests_cache.session.CachedSession`
                 and/or :py:class:`~requests_ratelimiter.requests_ratelimiter.LimiterSession`
         """
@@ -133,6 +173,7 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             url_patterns.update(urls_expire_after)
         self.read_timeout = timeout
         self.write_timeout = write_timeout
+        self.cache_metrics = CacheMetrics()
 
         # Extra args to pass to rate limiter backend
         bucket_kwargs = kwargs.pop('bucket_kwargs', {})
@@ -160,6 +201,7 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             per_day=per_day,
             per_host=True,
             burst=burst,
+            timing_callback=timing_callback,
             **kwargs,
         )
 
@@ -176,8 +218,14 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             backoff_factor=backoff_factor,
             status_forcelist=RETRY_STATUSES,
         )
-        adapter = HTTPAdapter(max_retries=self.retries)
+        self.pool_settings: dict[str, Any] = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block,
+        }
+        adapter = HTTPAdapter(max_retries=self.retries, **self.pool_settings)
         self.mount('https://', adapter)
+        self.mount('http://', adapter)
 
         # Default headers
         self.headers['Accept'] = 'application/json'
@@ -200,6 +248,7 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         json: dict | None = None,
         params: RequestParams | None = None,
         allow_str_ids: bool = False,
+        upload_callback: ProgressCallback | None = None,
         **kwargs,
     ) -> Request:
         """Translate pyinaturalist-specific options into standard request arguments"""
@@ -212,10 +261,19 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         if access_token:
             headers['Authorization'] = f'Bearer {access_token}'
 
-        # Convert any datetimes in request body, and read any files or URLs for uploading
+        # Convert any datetimes in request body
         json = preprocess_request_body(json)
+
+        # For uploads, stream form data and file contents instead of loading them into memory
         if files:
-            files = {'file': ensure_file_obj(files, self)}  # type: ignore
+            body = MultipartStream(
+                data,
+                {'file': ensure_file_obj(files, self)},
+                callback=upload_callback,
+                close_files=isinstance(files, (str, Path)),
+            )
+            headers['Content-Type'] = body.content_type
+            data, files = body, None  # type: ignore
 
         # Convert into a PreparedRequest
         return Request(
@@ -249,6 +307,7 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         force_refresh: bool = False,
         stream: bool = False,
         timeout: TimeoutType | Timeout = _UNSET,
+        upload_callback: ProgressCallback | None = None,
         verify: bool = True,
         **params: RequestParams,
     ) -> Response:
@@ -271,9 +330,13 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
                 (e.g., a "soft refresh," like F5 in a browser)
             force_refresh: Always make a new request, and overwrite any previously cached response
                 (e.g., a "hard refresh", like Ctrl-F5 in a browser))
-            stream: Stream the response content
+            stream: Stream the response content. JSON responses will not be read or validated
+                in advance, so invalid (truncated) JSON will not be retried; see
+                :py:func:`.iter_json_results` for incremental parsing.
             timeout: Time (in seconds) to wait for a response from the server; if exceeded, a
                 :py:exc:`requests.exceptions.Timeout` will be raised.
+            upload_callback: Function to call with ``(bytes_sent, total_bytes)`` while uploading
+                ``files``
             verify: Verify SSL certificates
             params: All other keyword arguments will be interpreted as request parameters
 
@@ -291,20 +354,25 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             ids=ids,
             json=json,
             params=params,
+            upload_callback=upload_callback,
         )
 
-        response = self.send(
-            request,
-            dry_run=dry_run,
-            expire_after=expire_after,
-            only_if_cached=only_if_cached,
-            refresh=refresh,
-            force_refresh=force_refresh,
-            timeout=timeout,
-            allow_redirects=allow_redirects,
-            stream=stream,
-            verify=verify,
-        )
+        try:
+            response = self.send(
+                request,
+                dry_run=dry_run,
+                expire_after=expire_after,
+                only_if_cached=only_if_cached,
+                refresh=refresh,
+                force_refresh=force_refresh,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+                stream=stream,
+                verify=verify,
+            )
+        finally:
+            if isinstance(request.data, MultipartStream):
+                request.data.close()
 
         # Raise an exception if the request failed (after retries are exceeded)
         if raise_for_status:
@@ -347,43 +415,105 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         if dry_run or is_dry_run_enabled(request.method):
             return MockResponse(request)
 
-        # Send the request and validate the response
-        try:
-            response = super().send(
-                request,
-                expire_after=expire_after,
-                refresh=refresh,
-                force_refresh=force_refresh,
-                timeout=timeout,  # type: ignore[arg-type]
-                **kwargs,
-            )
-        # Handle connection errors not captured by urllib3 retry handling (write timeouts, remote disconnects);
-        except ConnectionError as e:
-            if not any(msg in str(e).lower() for msg in RETRYABLE_CONNECTION_ERRORS):
-                raise
-            _logger.debug('Connection error:', exc_info=True)
-            _logger.warning('Connection error; retrying...')
-
-            # Reuse the same retry object to share retry state and limits
-            retries = retries or self.retries
-            retries = retries.increment(request.method, request.url, error=e)
-            # Wait with configured backoff before retrying
-            retries.sleep()
-            return self.send(request, retries=retries, timeout=timeout, **kwargs)
-
-        response = self._validate_json(
-            request,
-            response,
-            expire_after=expire_after,
-            retries=retries,
-            timeout=timeout,
-            **kwargs,
-        )
+        with self.record_timing(request) as timing:
+            # Send the request and validate the response
+            try:
+                # Streamed uploads are never cached, and skip the cache entirely to avoid reading the
+                # whole request body to create a cache key
+                if isinstance(request.body, MultipartStream):
+                    kwargs.pop('only_if_cached', None)
+                    self._start_phase('ratelimit_wait')
+                    response = LimiterMixin.send(self, request, timeout=timeout, **kwargs)
+                else:
+                    self._start_phase('cache')
+                    response = super().send(
+                        request,
+                        expire_after=expire_after,
+                        refresh=refresh,
+                        force_refresh=force_refresh,
+                        timeout=timeout,  # type: ignore[arg-type]
+                        **kwargs,
+                    )
+                    # If no request was sent, the 'cache' phase is still open
+                    self._end_phase('cache', 'cache_lookup')
+                    self._end_phase('cache_write')
+            # Handle connection errors not captured by urllib3 retry handling (write timeouts, remote disconnects);
+            except ConnectionError as e:
+                if not any(msg in str(e).lower() for msg in RETRYABLE_CONNECTION_ERRORS):
+                    raise
+                _logger.debug('Connection error:', exc_info=True)
+                _logger.warning('Connection error; retrying...')
+
+                # Reuse the same retry object to share retry state and limits
+                retries = retries or self.retries
+                retries = retries.increment(request.method, request.url, error=e)
+                # Wait with configured backoff before retrying
+                self._start_phase('retry_wait')
+                retries.sleep()
+                self._end_phase('retry_wait')
+                timing.retries += 1
+                if isinstance(request.body, MultipartStream):
+                    request.body.seek(0)
+                return self.send(request, retries=retries, timeout=timeout, **kwargs)
+
+            # Streamed responses are parsed incrementally (and retried, if needed) by the caller instead
+            validated = response
+            if not kwargs.get('stream'):
+                validated = self._validate_json(
+                    request,
+                    response,
+                    expire_after=expire_after,
+                    retries=retries,
+                    timeout=timeout,
+                    **kwargs,
+                )
+            # If the response was retried, metrics were already recorded for the final response
+            if validated is response:
+                self.cache_metrics.record(response)
+            response = validated
+            timing.status_code = response.status_code
+            timing.from_cache = getattr(response, 'from_cache', False)
 
         if _logger.level <= DEBUG:
             _logger.debug(format_response(response))
         return response
 
+    def preload(
+        self,
+        requests: Iterable[str | Request | PreparedRequest],
+        max_workers: int = BULK_MAX_WORKERS,
+        refresh: bool = False,
+        **kwargs,
+    ) -> 'PreloadReport':
+        """Fetch GET requests into the cache concurrently, for example to make sure reference data
+        is available before a long-running job. Requests with a fresh cached response are not sent
+        again, and expired ones are revalidated with the server if possible.
+
+        Example:
+            >>> report = session.preload([f'{API_V1}/controlled_terms', f'{API_V1}/taxa/1,3'])
+            >>> print(report.summary)
+            2 requests: 1 fetched, 0 revalidated, 1 fresh, 0 failed
+
+        Args:
+            requests: URLs or request objects to fetch. To match the cache keys of later requests,
+                these should be prepared the same way, e.g. with :py:meth:`.prepare_inat_request`.
+            max_workers: Maximum number of requests to send at once
+            refresh: Revalidate all cached responses, even if they haven't expired yet
+            kwargs: Additional keyword arguments for :py:meth:`.send`
+        """
+
+        def fetch(request: Request | PreparedRequest) -> Response:
+            response = self.send(request, refresh=refresh, **kwargs)
+            response.raise_for_status()
+            return response
+
+        executor = BulkExecutor(max_workers=max_workers)
+        for request in requests:
+            executor.submit(fetch, Request('GET', request) if isinstance(request, str) else request)
+        report = PreloadReport(executor.wait())
+        _logger.info(f'Preload completed: {report.summary}')
+        return report
+
     def get_refresh_params(self, endpoint) -> dict:
         """In some cases, we need to be sure we have the most recent version of a resource, for example
         when updating projects. Normally we would handle this with cache headers, but the CDN cache does
@@ -419,10 +549,12 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             return response
 
         # Attempt to decode the response content as JSON
+        self._start_phase('json_decode')
         try:
             response_json = response.json()
         # Update retry state and wait before sending the request again
         except JSONDecodeError as e:
+            self._end_phase('json_decode')
             _logger.info('Invalid JSON response; retrying...')
             retries = retries or self.retries
             retries = retries.increment(
@@ -430,12 +562,17 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
                 response.request.url,
                 error=e,
             )
+            self._start_phase('retry_wait')
             retries.sleep()
+            self._end_phase('retry_wait')
+            if timing := self.current_timing:
+                timing.retries += 1
             kwargs['force_refresh'] = True
             kwargs['retries'] = retries
             return self.send(request, **kwargs)
         # Save decoded JSON on response object, to avoid decoding twice
         else:
+            self._end_phase('json_decode')
             response.json = lambda **kwargs: response_json  # type: ignore
             return response
 
@@ -455,6 +592,99 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             pass
 
 
+class PreloadReport(BulkReport):
+    """Results of :py:meth:`ClientSession.preload`, with responses grouped by how they were
+    fetched
+    """
+
+    @property
+    def fetched(self) -> list[BulkResult]:
+        """Requests that were not cached, and were downloaded in full"""
+        return [r for r in self.succeeded if not getattr(r.result, 'from_cache', False)]
+
+    @property
+    def revalidated(self) -> list[BulkResult]:
+        """Requests with an expired cached response that was renewed by the server"""
+        return [r for r in self.succeeded if getattr(r.result, 'revalidated', False)]
+
+    @property
+    def fresh(self) -> list[BulkResult]:
+        """Requests that already had a fresh cached response"""
+        return [
+            r
+            for r in self.succeeded
+            if getattr(r.result, 'from_cache', False)
+            and not getattr(r.result, 'revalidated', False)
+        ]
+
+    @property
+    def summary(self) -> str:
+        return (
+            f'{len(self)} requests: {len(self.fetched)} fetched, '
+            f'{len(self.revalidated)} revalidated, {len(self.fresh)} fresh, '
+            f'{len(self.failed)} failed'
+        )
+
+
+@dataclass
+class CacheMetrics:
+    """Running totals of cache usage for a session, including bytes that did not need to be
+    downloaded because a cached response was either still fresh or revalidated by the server.
+
+    Example:
+        >>> session = ClientSession()
+        >>> session.get(f'{API_V1}/taxa/3')
+        >>> session.get(f'{API_V1}/taxa/3', refresh=True)
+        >>> print(session.cache_metrics.summary())
+        {'hits': 0, 'revalidated': 1, 'misses': 1, 'bytes_downloaded': 8415, 'bytes_saved': 8415}
+
+    Attributes:
+        hits: Number of fresh responses returned from the cache
+        revalidated: Number of expired or refreshed responses renewed with ``304 Not Modified``
+        misses: Number of responses downloaded in full
+        bytes_downloaded: Total size of downloaded response bodies
+        bytes_saved: Total size of response bodies reused from the cache
+    """
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, response: Response):
+        """Update totals for a response returned by :py:meth:`ClientSession.send`"""
+        size = _get_content_size(response)
+        with self._lock:
+            if getattr(response, 'revalidated', False):
+                self.revalidated += 1
+                self.bytes_saved += size
+            elif getattr(response, 'from_cache', False):
+                self.hits += 1
+                self.bytes_saved += size
+            else:
+                self.misses += 1
+                self.bytes_downloaded += size
+
+    def reset(self):
+        """Reset all totals to zero"""
+        with self._lock:
+            self.hits = self.revalidated = self.misses = 0
+            self.bytes_downloaded = self.bytes_saved = 0
+
+    def summary(self) -> dict[str, int]:
+        """Get all totals as a dict"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'bytes_downloaded': self.bytes_downloaded,
+                'bytes_saved': self.bytes_saved,
+            }
+
+
 class RequestTimeout(Timeout):
     """Timeout class that adjusts timeouts for write operations"""
 
@@ -523,14 +753,61 @@ def get_local_session(**kwargs) -> ClientSession:
     context (for example, a :py:class:`~concurrent.futures.ThreadPoolExecutor`), this will create
     and store a separate session object for each thread.
 
+    If shared session mode is enabled with :py:func:`.use_shared_session`, this will instead return
+    a single session shared by all threads.
+
     Args:
         kwargs: Keyword arguments for :py:func:`.ClientSession`
     """
+    if _shared_session_enabled:
+        return get_shared_session(**kwargs)
     if not hasattr(thread_local, 'session'):
         thread_local.session = ClientSession(**kwargs)
     return thread_local.session
 
 
+def get_shared_session(**kwargs) -> ClientSession:
+    """Get a single Session object shared by all threads. Compared to a separate session per thread,
+    this reuses one connection pool, one cache database connection, and one rate limiter, so
+    connections opened by one thread can be reused by others.
+
+    Settings only apply when the session is first created. For many threads, ``pool_maxsize``
+    should be at least the number of threads; otherwise, extra connections will be opened and
+    discarded (or with ``pool_block=True``, threads will wait for a free connection).
+
+    Example:
+        >>> session = get_shared_session(pool_maxsize=32)
+        >>> with ThreadPoolExecutor(max_workers=32) as executor:
+        ...     executor.map(lambda id: get_taxa_by_id(id, session=session), taxon_ids)
+
+    Args:
+        kwargs: Keyword arguments for :py:func:`.ClientSession`
+    """
+    global _shared_session
+
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = ClientSession(**kwargs)
+    return _shared_session
+
+
+def use_shared_session(enabled: bool = True):
+    """Use a single shared session (from :py:func:`.get_shared_session`) for all API requests that
+    don't explicitly pass a ``session`` argument, instead of a separate session per thread
+
+    Example:
+        >>> use_shared_session()
+        >>> with ThreadPoolExecutor(max_workers=32) as executor:
+        ...     executor.map(get_taxa_by_id, taxon_ids)
+
+    Args:
+        enabled: Enable or disable shared session mode
+    """
+    global _shared_session_enabled
+    _shared_session_enabled = enabled
+
+
 class MockResponse(CachedResponse):
     """A mock response to return in dry-run mode.
     This behaves the same as a cached response, but with the following additions:
@@ -601,6 +878,19 @@ def format_response(response: Response) -> str:
     )
 
 
+def _get_content_size(response: Response) -> int:
+    """Get the size of a response body without reading it, if it hasn't been read already (e.g.,
+    for streamed responses)
+    """
+    content = getattr(response, '_content', None)
+    if isinstance(content, bytes):
+        return len(content)
+    try:
+        return int(response.headers.get('Content-Length', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
 def _format_expiration(response: Response) -> str:
     if not getattr(response, 'from_cache', False):
         return 'not cached'
@@ -611,7 +901,8 @@ def _format_expiration(response: Response) -> str:
         expires_str = f'expires in {expires_delta}'
     else:
         expires_str = 'never expires'
-    return f'cached; {expires_str}'
+    revalidated_str = 'revalidated; ' if getattr(response, 'revalidated', False) else ''
+    return f'cached; {revalidated_str}{expires_str}'
 
 
 def _format_transfer(response: Response) -> str:
@@ -654,5 +945,6 @@ def _format_body(body) -> str:
                 body[key] = '[REDACTED]'
         return body
     except Exception:
-        size_str = f' ({format_file_size(len(body))})' if isinstance(body, (str, bytes)) else ''
+        is_sized = isinstance(body, (str, bytes, MultipartStream))
+        size_str = f' ({format_file_size(len(body))})' if is_sized else ''
         return f'(non-JSON request body{size_str})'
@@ -0,0 +1,354 @@
+"""Utilities for streaming large request and response bodies, without holding them in memory all
+at once
+"""
+
+import codecs
+import csv
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from io import BytesIO, UnsupportedOperation
+from json import JSONDecodeError, JSONDecoder
+from logging import getLogger
+from mimetypes import guess_type
+from typing import IO, cast
+from uuid import uuid4
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from requests import Response
+from requests.utils import guess_filename, super_len
+
+from pyinaturalist.constants import STREAM_CHUNK_SIZE, JsonResponse, ResponseResult
+
+# Callback for upload progress, which receives (bytes sent, total bytes)
+ProgressCallback = Callable[[int, int], None]
+
+WHITESPACE = ' \t\n\r'
+
+_decoder = JSONDecoder()
+logger = getLogger(__name__)
+
+
+def iter_json_results(
+    response: Response,
+    key: str = 'results',
+    metadata: dict | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[ResponseResult]:
+    """Incrementally parse records from a JSON response, yielding each record as soon as it has
+    been downloaded. This avoids holding the full response body in memory at once, which is
+    useful for large pages of results (for example, observations with identifications).
+
+    The response should be sent with ``stream=True``. Accepts either a top-level list of records,
+    or an object containing a list of records under ``key``.
+
+    Example:
+        >>> response = get(f'{API_V1}/observations', per_page=200, stream=True)
+        >>> metadata = {}
+        >>> for result in iter_json_results(response, metadata=metadata):
+        ...     print(result['id'])
+        >>> print(metadata['total_results'])
+
+    Args:
+        response: A streamed response object
+        key: Key containing the list of records
+        metadata: An optional dict that will be updated with any other top-level response values
+            (e.g., ``total_results``)
+        chunk_size: Number of bytes to read at a time
+
+    Raises:
+        :py:exc:`json.JSONDecodeError` if the response is not valid JSON (for example, truncated)
+    """
+    reader = _IncrementalJsonReader(response.iter_content(chunk_size=chunk_size))
+    metadata = metadata if metadata is not None else {}
+    try:
+        if reader.next_char() == '[':
+            yield from reader.iter_array()
+            return
+
+        reader.expect('{')
+        while reader.next_char() != '}':
+            item_key = reader.decode_value()
+            reader.expect(':')
+            if item_key == key:
+                yield from reader.iter_array()
+            else:
+                metadata[item_key] = reader.decode_value()
+            if reader.next_char() == ',':
+                reader.expect(',')
+    finally:
+        response.close()
+
+
+def read_json_stream(response: Response, key: str = 'results', **kwargs) -> JsonResponse:
+    """Read a streamed JSON response with :py:func:`.iter_json_results`, and return the combined
+    response dict. The result is the same as ``response.json()``, but peak memory usage is lower,
+    since the raw response body is never held in memory all at once.
+    """
+    response_json: JsonResponse = {}
+    results = list(iter_json_results(response, key=key, metadata=response_json, **kwargs))
+    response_json[key] = results
+    return response_json
+
+
+def iter_csv_rows(
+    response: Response, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[dict[str, str]]:
+    """Incrementally parse rows from a CSV response, yielding each row as a dict (keyed by the
+    header row) as soon as it has been downloaded. The response should be sent with ``stream=True``.
+
+    Example:
+        >>> response = get(f'{API_V0}/observations.csv', per_page=200, stream=True)
+        >>> for row in iter_csv_rows(response):
+        ...     print(row['id'], row['scientific_name'])
+
+    Args:
+        response: A streamed response object
+        chunk_size: Number of bytes to read at a time
+    """
+    try:
+        yield from csv.DictReader(_iter_text_lines(response, chunk_size))
+    finally:
+        response.close()
+
+
+def iter_xml_elements(
+    response: Response, tags: str | Iterable[str], chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[Element]:
+    """Incrementally parse records from an XML response, yielding each element with a matching tag
+    as soon as it has been downloaded. The response should be sent with ``stream=True``.
+
+    Each element is removed from the parsed document after it's yielded, so memory usage stays
+    constant regardless of response size.
+
+    Example:
+        Get Darwin Core records from a v0 observation export:
+
+        >>> response = get(f'{API_V0}/observations.dwc', per_page=200, stream=True)
+        >>> for element in iter_xml_elements(response, f'{{{DWR_NAMESPACE}}}SimpleDarwinRecord'):
+        ...     print(element.findtext(f'{{{DWC_NAMESPACE}}}scientificName'))
+
+    Args:
+        response: A streamed response object
+        tags: One or more element tags to match, in ``{namespace}name`` format
+        chunk_size: Number of bytes to read at a time
+    """
+    tags = {tags} if isinstance(tags, str) else set(tags)
+    parser: XMLPullParser[Element] = XMLPullParser(events=('start', 'end'))
+    parents: list[Element] = []
+
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            parser.feed(chunk)
+            # Only start and end events are requested, which are always (event, element) tuples
+            events = cast(Iterator[tuple[str, Element]], parser.read_events())
+            for event, element in events:
+                if event == 'start':
+                    parents.append(element)
+                    continue
+                parents.pop()
+                if element.tag in tags:
+                    yield element
+                    # Discard elements that have already been processed
+                    if parents:
+                        parents[-1].remove(element)
+        parser.close()
+    finally:
+        response.close()
+
+
+def _iter_text_lines(response: Response, chunk_size: int) -> Iterator[str]:
+    """Decode a streamed response and split it into lines, keeping line endings (as expected by
+    :py:mod:`csv`, for values that contain newlines)
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split('\n')
+        for line in lines:
+            yield line + '\n'
+    buffer += decoder.decode(b'', final=True)
+    if buffer:
+        yield buffer
+
+
+class _IncrementalJsonReader:
+    """Minimal incremental reader for a stream of JSON text. Individual values are decoded with
+    the stdlib decoder, once enough of the stream has been buffered to contain them.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.buffer = ''
+        self.chunks = chunks
+        self.exhausted = False
+        self.pos = 0
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def iter_array(self) -> Iterator:
+        """Yield values from an array as they are decoded"""
+        self.expect('[')
+        while self.next_char() != ']':
+            yield self.decode_value()
+            if self.next_char() == ',':
+                self.expect(',')
+        self.expect(']')
+
+    def decode_value(self):
+        """Decode the next complete JSON value, reading more data as needed"""
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                # A value that ends at the end of the buffer may be incomplete (e.g., a number)
+                if end < len(self.buffer) or self.exhausted:
+                    break
+            except JSONDecodeError:
+                if self.exhausted:
+                    raise
+            self._read()
+
+        # Discard parsed content, so the buffer only holds unparsed data
+        self.buffer = self.buffer[end:]
+        self.pos = 0
+        return value
+
+    def expect(self, char: str):
+        """Consume the next non-whitespace character, which must match ``char``"""
+        if self.next_char() != char:
+            raise self._error(f'Expecting {char!r}')
+        self.pos += 1
+
+    def next_char(self) -> str:
+        """Skip any whitespace and get the next character, without consuming it"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.exhausted:
+                raise self._error('Unexpected end of response')
+            self._read()
+
+    def _read(self):
+        """Read the next chunk of data from the stream"""
+        try:
+            chunk = next(self.chunks)
+            self.buffer += self._text_decoder.decode(chunk)
+        except StopIteration:
+            self.buffer += self._text_decoder.decode(b'', final=True)
+            self.exhausted = True
+
+    def _error(self, msg: str) -> JSONDecodeError:
+        return JSONDecodeError(msg, self.buffer, self.pos)
+
+
+class MultipartStream:
+    """A ``multipart/form-data`` request body that reads file contents lazily, in chunks, while the
+    request is being sent. Compared to the default encoding used by ``requests``, memory usage stays
+    constant regardless of file size.
+
+    Example:
+        >>> with open('~/observations/2020_09_01_140031.jpg', 'rb') as f:
+        ...     body = MultipartStream({'observation_photo[observation_id]': 1234}, {'file': f})
+        ...     session.post(url, data=body, headers={'Content-Type': body.content_type})
+
+    Args:
+        fields: Form fields to include before any files
+        files: File-like objects to upload, keyed by form field name
+        chunk_size: Number of bytes to read at a time when iterating over the body
+        callback: Function to call with ``(bytes_sent, total_bytes)`` as the body is read
+        close_files: Close file objects when this stream is closed
+    """
+
+    def __init__(
+        self,
+        fields: Mapping | None = None,
+        files: Mapping[str, IO] | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        callback: ProgressCallback | None = None,
+        close_files: bool = False,
+    ):
+        self.boundary = uuid4().hex
+        self.callback = callback
+        self.chunk_size = chunk_size
+        self.close_files = close_files
+        self.files = list((files or {}).values())
+        self._index = 0
+        self._pos = 0
+
+        # Each part is a file-like object, its starting position, and its size
+        self._parts: list[tuple[IO, int, int]] = []
+        for name, value in (fields or {}).items():
+            for v in value if isinstance(value, (list, tuple)) else [value]:
+                self._add_bytes(self._part_header(name) + str(v).encode() + b'\r\n')
+        for name, file_obj in (files or {}).items():
+            self._add_bytes(self._part_header(name, guess_filename(file_obj) or name))
+            self._add_file(file_obj)
+            self._add_bytes(b'\r\n')
+        self._add_bytes(f'--{self.boundary}--\r\n'.encode())
+        self.len = sum(size for _, _, size in self._parts)
+
+    @property
+    def content_type(self) -> str:
+        """Value for the request's ``Content-Type`` header"""
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read up to ``size`` bytes of the encoded body (or all remaining bytes, if not specified)"""
+        remaining = self.len - self._pos if size is None or size < 0 else size
+        chunks = []
+        while remaining > 0 and self._index < len(self._parts):
+            part, _, _ = self._parts[self._index]
+            chunk = part.read(remaining)
+            if not chunk:
+                self._index += 1
+                continue
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        data = b''.join(chunks)
+        self._pos += len(data)
+        if data and self.callback:
+            self.callback(self._pos, self.len)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Rewind to the beginning of the body, e.g. to retry a failed request. Seeking to any other
+        position is not supported.
+        """
+        if (offset, whence) != (0, 0):
+            raise UnsupportedOperation('MultipartStream can only be rewound to the start')
+        for part, start, _ in self._parts:
+            part.seek(start)
+        self._index = self._pos = 0
+        return 0
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self):
+        """Close any file objects opened for this upload"""
+        if self.close_files:
+            for file_obj in self.files:
+                file_obj.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    def __len__(self) -> int:
+        return self.len
+
+    def _add_bytes(self, value: bytes):
+        self._parts.append((BytesIO(value), 0, len(value)))
+
+    def _add_file(self, file_obj: IO):
+        start = file_obj.tell() if hasattr(file_obj, 'tell') else 0
+        self._parts.append((file_obj, start, super_len(file_obj)))
+
+    def _part_header(self, name: str, filename: str | None = None) -> bytes:
+        header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"'
+        if filename:
+            header += f'; filename="{filename}"'
+            if mimetype := guess_type(filename)[0]:
+                header += f'\r\nContent-Type: {mimetype}'
+        return f'{header}\r\n\r\n'.encode()
@@ -0,0 +1,216 @@
+"""Classes to split large geographic queries into smaller tiles that can be fetched concurrently"""
+
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from copy import copy
+from logging import getLogger
+from typing import NamedTuple
+
+from pyinaturalist.client.paginator import Paginator
+from pyinaturalist.constants import (
+    BULK_MAX_WORKERS,
+    TILE_MAX_DEPTH,
+    TILE_MAX_RESULTS,
+    RequestParams,
+)
+from pyinaturalist.models import T
+
+logger = getLogger(__name__)
+
+
+class BoundingBox(NamedTuple):
+    """A geographic bounding box, using the same coordinates as the ``swlat``, ``swlng``,
+    ``nelat``, and ``nelng`` request parameters. Boxes that cross the antimeridian have
+    ``swlng > nelng``.
+    """
+
+    swlat: float
+    swlng: float
+    nelat: float
+    nelng: float
+
+    @classmethod
+    def from_params(cls, params: RequestParams) -> 'BoundingBox':
+        """Get a bounding box from request parameters, or the whole world if not specified"""
+        return cls(
+            float(params.get('swlat', -90)),
+            float(params.get('swlng', -180)),
+            float(params.get('nelat', 90)),
+            float(params.get('nelng', 180)),
+        )
+
+    @property
+    def params(self) -> RequestParams:
+        """Bounding box as request parameters"""
+        return self._asdict()
+
+    @property
+    def width(self) -> float:
+        """Width in degrees of longitude"""
+        width = self.nelng - self.swlng
+        return width if width >= 0 else width + 360
+
+    def contains(self, lat: float, lng: float) -> bool:
+        """Check if a point is within this bounding box (including its edges)"""
+        if not self.swlat <= lat <= self.nelat:
+            return False
+        if self.swlng <= self.nelng:
+            return self.swlng <= lng <= self.nelng
+        return lng >= self.swlng or lng <= self.nelng
+
+    def split(self) -> list['BoundingBox']:
+        """Split into four equal quadrants"""
+        mid_lat = (self.swlat + self.nelat) / 2
+        mid_lng = self.swlng + self.width / 2
+        mid_lng = mid_lng - 360 if mid_lng > 180 else mid_lng
+        return [
+            BoundingBox(self.swlat, self.swlng, mid_lat, mid_lng),
+            BoundingBox(self.swlat, mid_lng, mid_lat, self.nelng),
+            BoundingBox(mid_lat, self.swlng, self.nelat, mid_lng),
+            BoundingBox(mid_lat, mid_lng, self.nelat, self.nelng),
+        ]
+
+
+class TiledPaginator(Paginator[T]):
+    """Paginator that splits a bounding box query into tiles, and fetches the tiles concurrently.
+
+    Tiles are found with a quadtree: starting with the whole bounding box, each tile is split into
+    four quadrants until each one has at most ``max_tile_results`` results, using ``per_page=0``
+    requests to get result counts. Each tile is then paginated separately, with up to
+    ``max_workers`` requests in progress at once. Results on the edge between two tiles are only
+    returned once.
+
+    Since tiles are fetched concurrently, results are not returned in any particular order. Use
+    :py:meth:`.close` to cancel any remaining requests if the paginator isn't fully iterated.
+
+    Args:
+        paginator: Paginator for the original query, which will be copied for each tile
+        max_tile_results: Maximum number of results per tile
+        max_depth: Maximum number of times to split a tile
+        max_workers: Maximum number of requests to send at once
+    """
+
+    def __init__(
+        self,
+        paginator: Paginator[T],
+        max_tile_results: int = TILE_MAX_RESULTS,
+        max_depth: int = TILE_MAX_DEPTH,
+        max_workers: int = BULK_MAX_WORKERS,
+    ):
+        self.bbox = BoundingBox.from_params(paginator.request_kwargs)
+        super().__init__(
+            paginator.request_function,
+            paginator.model,
+            *paginator.request_args,
+            limit=paginator.total_limit,
+            per_page=paginator.per_page,
+            loop=paginator.loop,
+            **{**paginator.request_kwargs, **self.bbox.params},
+        )
+        self.paginator = paginator
+        self.max_tile_results = max_tile_results
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+        self.tiles: list[tuple[BoundingBox, int]] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[Future, Paginator[T]] = {}
+        self._seen_ids: set = set()
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            yield from super().__iter__()
+        finally:
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        try:
+            async for result in super().__aiter__():
+                yield result
+        finally:
+            self.close()
+
+    def __del__(self):
+        # The executor may not exist if __init__ failed
+        if getattr(self, '_executor', None):
+            self.close()
+
+    def get_tiles(self) -> list[tuple[BoundingBox, int]]:
+        """Split the bounding box into tiles, and get the result count for each one. Tiles with no
+        results are skipped.
+        """
+        if self.tiles is not None:
+            return self.tiles
+
+        self.tiles = []
+        pending = [self.bbox]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for depth in range(self.max_depth + 1):
+                counts = executor.map(lambda bbox: self._tile_paginator(bbox).count(), pending)
+                next_pending = []
+                for bbox, count in zip(pending, counts, strict=False):
+                    if count > self.max_tile_results and depth < self.max_depth:
+                        next_pending.extend(bbox.split())
+                    elif count > 0:
+                        self.tiles.append((bbox, count))
+                if not (pending := next_pending):
+                    break
+
+        self.total_results = sum(count for _, count in self.tiles)
+        logger.info(
+            f'Split query into {len(self.tiles)} tiles with {self.total_results} total results'
+        )
+        return self.tiles
+
+    def next_page(self) -> list[T]:
+        """Get the next page of results from any tile"""
+        if self.exhausted:
+            return []
+        if self._executor is None:
+            self._start()
+        if not self._futures:
+            self.close()
+            return []
+
+        done, _ = wait(self._futures, return_when=FIRST_COMPLETED)
+        future = next(iter(done))
+        tile = self._futures.pop(future)
+        results = future.result()
+        if not tile.exhausted:
+            self._submit(tile)
+
+        # Deduplicate results on tile edges, and stop early if a limit is reached
+        results = [r for r in results if r.id not in self._seen_ids]
+        self._seen_ids.update(r.id for r in results)
+        if self.total_limit:
+            results = results[: self.total_limit - self.results_fetched]
+        self.results_fetched += len(results)
+        if self.total_limit and self.results_fetched >= self.total_limit:
+            self.close()
+        return results
+
+    def close(self):
+        """Cancel any pending requests, and stop fetching further tiles"""
+        self.exhausted = True
+        for future in self._futures:
+            future.cancel()
+        self._futures.clear()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def _start(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        for bbox, _ in self.get_tiles():
+            self._submit(self._tile_paginator(bbox))
+
+    def _submit(self, tile: Paginator[T]):
+        self._futures[self._executor.submit(tile.next_page)] = tile  # type: ignore[union-attr]
+
+    def _tile_paginator(self, bbox: BoundingBox) -> Paginator[T]:
+        """Make a copy of the original paginator, limited to a single tile"""
+        tile = copy(self.paginator)
+        tile.request_kwargs = {**self.paginator.request_kwargs, **bbox.params}
+        return tile
+
+    def __str__(self) -> str:
+        n_tiles = len(self.tiles) if self.tiles is not None else 'unknown'
+        return f'{super().__str__()[:-1]}, tiles={n_tiles})'
@@ -0,0 +1,166 @@
+"""Utilities for measuring where time is spent while sending a request"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from logging import getLogger
+from time import perf_counter
+
+from requests import PreparedRequest, Response
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class RequestTiming:
+    """Timing details for a single request, including any retries. Times are in seconds.
+
+    Phases that may be recorded:
+
+    * ``cache_lookup``: Getting a cached response, if any, and checking if it can be used
+    * ``ratelimit_wait``: Waiting for the rate limiter before sending a request
+    * ``response``: Connecting and sending a request, until response headers are received
+    * ``download``: Reading the response body (not included for streamed responses)
+    * ``cache_write``: Saving a new response to the cache
+    * ``json_decode``: Decoding and validating the JSON response body
+    * ``retry_wait``: Waiting between retries for connection errors and invalid responses
+    * ``model_conversion``: Converting results into model objects (for paginated requests)
+    """
+
+    method: str  #: HTTP method
+    url: str  #: Request URL
+    status_code: int | None = None  #: Response status code, if a response was received
+    from_cache: bool = False  #: Indicates if the response was returned from the cache
+    retries: int = 0  #: Number of times the request was retried
+    total: float = 0.0  #: Total time spent sending the request, including retries
+    phases: dict[str, float] = field(default_factory=dict)  #: Time spent in each phase
+
+    def add(self, phase: str, seconds: float):
+        """Add time to a phase. Phases may be repeated for retries, so times are combined."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+# Function to call with timing details after each request is completed
+TimingCallback = Callable[[RequestTiming], None]
+
+
+class _TimingState(threading.local):
+    """Per-thread timing state for a session"""
+
+    def __init__(self):
+        self.timing: RequestTiming | None = None
+        self.deferred: list[RequestTiming] | None = None
+        self.marks: dict[str, float] = {}
+
+
+class TimingMixin:
+    """Session mixin that records a :py:class:`.RequestTiming` for each request, and passes it to
+    ``timing_callback``. The other mixins below record timing for individual phases, and depend on
+    their position in the session's MRO.
+    """
+
+    def __init__(self, *args, timing_callback: TimingCallback | None = None, **kwargs):
+        self.timing_callback = timing_callback
+        self._timing_state = _TimingState()
+        super().__init__(*args, **kwargs)
+
+    @contextmanager
+    def record_timing(self, request: PreparedRequest) -> Iterator[RequestTiming]:
+        """Record timing for a request, including any retries sent while this is active"""
+        state = self._timing_state
+        if state.timing is not None:
+            yield state.timing
+            return
+
+        state.timing = timing = RequestTiming(method=request.method or '', url=request.url or '')
+        start = perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.total = perf_counter() - start
+            state.timing = None
+            state.marks.clear()
+            if state.deferred is not None:
+                state.deferred.append(timing)
+            else:
+                self._emit_timing(timing)
+
+    @contextmanager
+    def defer_timing(self) -> Iterator[list[RequestTiming]]:
+        """Hold timing details for any requests sent in this context, so the caller can add more
+        details before they are passed to ``timing_callback``
+        """
+        state = self._timing_state
+        if state.deferred is not None:
+            yield state.deferred
+            return
+
+        deferred: list[RequestTiming] = []
+        state.deferred = deferred
+        try:
+            yield deferred
+        finally:
+            state.deferred = None
+            for timing in deferred:
+                self._emit_timing(timing)
+
+    @property
+    def current_timing(self) -> RequestTiming | None:
+        """Timing details for the request currently being sent in this thread, if any"""
+        return self._timing_state.timing
+
+    def _start_phase(self, name: str):
+        self._timing_state.marks[name] = perf_counter()
+
+    def _end_phase(self, name: str, phase: str | None = None):
+        """Add time since :py:meth:`._start_phase` was called, if it was called"""
+        state = self._timing_state
+        start = state.marks.pop(name, None)
+        if start is not None and state.timing is not None:
+            state.timing.add(phase or name, perf_counter() - start)
+
+    def _emit_timing(self, timing: RequestTiming):
+        if not self.timing_callback:
+            return
+        try:
+            self.timing_callback(timing)
+        except Exception:
+            logger.warning('Error in timing callback', exc_info=True)
+
+
+class CacheTimingMixin:
+    """Session mixin placed after ``CacheMixin``, which is only reached if a request needs to be
+    sent. Records time spent getting a cached response, and marks the start of any cache write.
+    """
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self._end_phase('cache', 'cache_lookup')  # type: ignore[attr-defined]
+        self._start_phase('ratelimit_wait')  # type: ignore[attr-defined]
+        response = super().send(request, **kwargs)  # type: ignore[misc]
+        self._start_phase('cache_write')  # type: ignore[attr-defined]
+        return response
+
+
+class TransportTimingMixin:
+    """Session mixin placed after ``LimiterMixin``, which records rate-limiting delays and time
+    spent on the request itself
+    """
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self._end_phase('ratelimit_wait')  # type: ignore[attr-defined]
+        start = perf_counter()
+        response = super().send(request, **kwargs)  # type: ignore[misc]
+        transfer = perf_counter() - start
+
+        if timing := self._timing_state.timing:  # type: ignore[attr-defined]
+            # Use the full transfer time if elapsed time isn't available (e.g., a mock response)
+            elapsed = getattr(response, 'elapsed', None)
+            elapsed = elapsed.total_seconds() if isinstance(elapsed, timedelta) else transfer
+            timing.add('response', elapsed)
+            if not kwargs.get('stream'):
+                timing.add('download', max(transfer - elapsed, 0.0))
+            retries = getattr(response.raw, 'retries', None)
+            timing.retries += len(getattr(retries, 'history', None) or ())
+        return response
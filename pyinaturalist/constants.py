@@ -27,13 +27,29 @@ KEYRING_KEY = '/inaturalist'
 # Pagination settings
 PER_PAGE_RESULTS = 200  # Default number of records per page for paginated queries
 LARGE_REQUEST_WARNING = 5000  # Show a warning for queries that will return over this many results
+STREAM_CHUNK_SIZE = 65536  # Number of bytes to read at a time from streamed responses
+TILE_MAX_RESULTS = 10000  # Default maximum number of results per tile for tiled geographic queries
+TILE_MAX_DEPTH = 8  # Default maximum number of times to split a tile into quadrants
+# Date range size to split histogram queries into, for intervals that return many bins
+HISTOGRAM_SPLIT_INTERVALS = {'hour': 'week', 'day': 'year', 'week': 'year'}
+PARTITION_MIN_DURATION = timedelta(minutes=1)  # Minimum date range size for partitioned queries
+USER_COUNTS_MAX_RESULTS = 500  # Maximum results returned by observation observers and identifiers
+INAT_CREATED_MIN = datetime(2008, 1, 1)  # Earliest creation date for any iNaturalist records
+SPATIAL_CELL_SIZE = 1.0  # Default grid cell size, in degrees, for local spatial indexes
+# Minimum time between full ID reconciliations when syncing observations to a local store
+SYNC_RECONCILE_INTERVAL = timedelta(days=1)
 
 # Maximum number of IDs that can be included in a single observation or taxon request
 MAX_IDS_PER_REQUEST = 30
 
 # Rate-limiting and retry settings
+BULK_MAX_ATTEMPTS = 3  # Maximum number of attempts for each item in a bulk request
+BULK_MAX_WORKERS = 4  # Default number of concurrent requests for bulk requests
 CONNECT_TIMEOUT = 5
 MAX_FILESIZE = 20000000  # 20MB maximum file size for uploads
+POOL_BLOCK = False  # Wait for a free connection instead of opening extra ones when a pool is full
+POOL_CONNECTIONS = 10  # Number of connection pools (one per host) to keep open
+POOL_MAXSIZE = 32  # Maximum number of open connections to reuse per host
 REQUEST_BURST_RATE = 5
 REQUESTS_PER_SECOND = 1
 REQUESTS_PER_MINUTE = 60
@@ -74,10 +90,22 @@ CACHE_EXPIRATION = {
 CACHE_FILE = DATA_DIR / 'api_requests.db'
 IGNORED_PARAMETERS = ['Authorization', 'access_token', 'password', 'client_secret']
 RATELIMIT_FILE = DATA_DIR / 'api_ratelimit.db'
+STORE_FILE = DATA_DIR / 'observations.db'
 
 # Response formats supported by v0 GET /observations endpoint
 OBSERVATION_FORMATS = ['atom', 'csv', 'dwc', 'json', 'kml', 'widget']
 
+# XML namespaces and record elements for v0 observation export formats
+ATOM_NAMESPACE = 'http://www.w3.org/2005/Atom'
+DWC_NAMESPACE = 'http://rs.tdwg.org/dwc/terms/'
+DWR_NAMESPACE = 'http://rs.tdwg.org/dwc/xsd/simpledarwincore/'
+KML_NAMESPACE = 'http://www.opengis.net/kml/2.2'
+OBSERVATION_RECORD_TAGS = {
+    'atom': [f'{{{ATOM_NAMESPACE}}}entry'],
+    'dwc': [f'{{{DWR_NAMESPACE}}}SimpleDarwinRecord', f'{{{DWC_NAMESPACE}}}Occurrence'],
+    'kml': [f'{{{KML_NAMESPACE}}}Placemark'],
+}
+
 # Taxon ID and name of main taxa 'categories' that can be filtered on
 ICONIC_TAXA = {
     0: 'Unknown',
@@ -7,7 +7,9 @@ the client, grouped by resource type.
 from pyinaturalist.controllers.base_controller import BaseController
 from pyinaturalist.controllers.annotation_controller import AnnotationController
 from pyinaturalist.controllers.identification_controller import IdentificationController
+from pyinaturalist.controllers.media_controller import MediaController
 from pyinaturalist.controllers.observation_controller import ObservationController
+from pyinaturalist.controllers.local_observation_controller import LocalObservationController
 from pyinaturalist.controllers.observation_field_controller import ObservationFieldController
 from pyinaturalist.controllers.place_controller import PlaceController
 from pyinaturalist.controllers.project_controller import ProjectController
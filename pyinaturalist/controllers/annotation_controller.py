@@ -3,7 +3,7 @@ from logging import getLogger
 from pyinaturalist.client import delete, post
 from pyinaturalist.constants import API_V2, IntOrStr
 from pyinaturalist.controllers import BaseController
-from pyinaturalist.models import Annotation, ControlledTerm
+from pyinaturalist.models import Annotation, ControlledTerm, ControlledTermValue
 from pyinaturalist.v1 import get_controlled_terms, get_controlled_terms_for_taxon
 
 logger = getLogger(__name__)
@@ -15,6 +15,7 @@ class AnnotationController(BaseController):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._term_lookup: dict[int, ControlledTerm] = {}
+        self._value_lookup: dict[tuple[int, int], tuple[ControlledTerm, ControlledTermValue]] = {}
 
     @property
     def term_lookup(self) -> dict[int, ControlledTerm]:
@@ -23,6 +24,17 @@ class AnnotationController(BaseController):
             self._term_lookup = {term.id: term for term in self.all()}
         return self._term_lookup
 
+    @property
+    def value_lookup(self) -> dict[tuple[int, int], tuple[ControlledTerm, ControlledTermValue]]:
+        """Get a lookup table of ``(controlled term ID, value ID)`` to term and value objects"""
+        if not self._value_lookup:
+            self._value_lookup = {
+                (term.id, value.id): (term, value)
+                for term in self.term_lookup.values()
+                for value in term.values
+            }
+        return self._value_lookup
+
     def all(self, **params) -> list[ControlledTerm]:
         """List controlled terms and their possible values
 
@@ -66,21 +78,30 @@ class AnnotationController(BaseController):
         """Fill in missing information for the specified annotations. If only term and value IDs are
         present, this will look up, cache, and add complete controlled term details.
 
+        Controlled terms are fetched once per client, and the API response is cached for 7 days
+        across processes. For best performance, pass annotations from many observations at once.
+
         Args:
             annotations: Observation annotations
 
         Returns:
             Annotation objects with ``controlled_attribute`` and ``controlled_value`` populated
         """
+        value_lookup = self.value_lookup
+        missing_ids = set()
         for annotation in annotations or []:
-            term = self.term_lookup.get(annotation.controlled_attribute.id)
-            if term:
+            attribute_id = annotation.controlled_attribute.id
+            value = annotation.controlled_value
+            if value and (match := value_lookup.get((attribute_id, value.id))):
+                annotation.controlled_attribute, annotation.controlled_value = match
+            elif term := self.term_lookup.get(attribute_id):
                 annotation.controlled_attribute = term
-                annotation.controlled_value = term.get_value_by_id(annotation.controlled_value.id)
+                annotation.controlled_value = None
             else:
-                logger.warning(
-                    f'No controlled attribute found for ID: {annotation.controlled_attribute.id}'
-                )
+                missing_ids.add(attribute_id)
+
+        if missing_ids:
+            logger.warning(f'No controlled attribute found for IDs: {sorted(missing_ids)}')
         return annotations
 
     def _resolve_annotation_ids(
@@ -0,0 +1,264 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+from dateutil.tz import tzlocal
+
+from pyinaturalist.client import IDRangePaginator, Paginator
+from pyinaturalist.constants import JsonResponse, MultiInt, RequestParams
+from pyinaturalist.converters import ensure_list, try_datetime, try_int
+from pyinaturalist.docs import copy_doc_signature
+from pyinaturalist.docs import templates as docs
+from pyinaturalist.models import Observation
+from pyinaturalist.request_params import COMMON_PARAMS
+from pyinaturalist.store import ObservationStore
+
+
+class LocalObservationController:
+    """:fa:`database` Controller for searching observations saved in a local
+    :py:class:`.ObservationStore`, with the same interface as :py:class:`.ObservationController`.
+    Searches are translated into SQL queries, using the store's indexed columns.
+
+    Example:
+        >>> store = ObservationStore()
+        >>> client.observations.sync(store, place_id=7953)
+        >>> local = LocalObservationController(store)
+        >>> observations = local.search(taxon_id=47224, quality_grade='research', d1='2020-01-01').all()
+
+    Args:
+        store: Store to search
+    """
+
+    def __init__(self, store: ObservationStore | None = None):
+        self.store = store or ObservationStore()
+
+    def __call__(self, observation_id: int, **params) -> Observation | None:
+        """Get a single observation by ID
+
+        Args:
+            observation_id: A single observation ID
+        """
+        return self.store.get(observation_id)
+
+    def from_ids(self, observation_ids: MultiInt, **params) -> Paginator[Observation]:
+        """Get one or more observations by ID. Observations not in the store are skipped.
+
+        Args:
+            observation_ids: One or more observation IDs
+        """
+        return self.search(id=observation_ids, **params)
+
+    @copy_doc_signature(*docs._get_observations)
+    def search(self, **params) -> Paginator[Observation]:
+        """Search observations in the local store
+
+        .. rubric:: Notes
+
+        * Results are paginated by ID, and observations are only loaded one page at a time
+        * Only the following search parameters are supported; any others will raise a
+          ``ValueError``:
+
+          * IDs: ``id``, ``not_id``, ``id_above``, ``id_below``
+          * Taxa: ``taxon_id`` (including descendants), ``without_taxon_id``
+          * Users: ``user_id`` (ID or login), ``user_login``
+          * Places: ``place_id``, ``swlat``, ``swlng``, ``nelat``, ``nelng``, ``geo``
+          * Observed date: ``d1``, ``d2``, ``observed_on``, ``year``, ``month``, ``day``
+          * Other dates: ``created_d1``, ``created_d2``, ``created_on``, ``updated_since``
+          * Other attributes: ``quality_grade``, ``verifiable``, ``captive``, ``geoprivacy``,
+            ``license``
+
+        Example:
+            >>> local = LocalObservationController(store)
+            >>> query = local.search(taxon_id=47224, place_id=7953, quality_grade='research')
+            >>> print(query.count())
+            >>> observations = query.all()
+        """
+        limit = params.pop('limit', None)
+        params = {k: v for k, v in params.items() if v is not None and k not in COMMON_PARAMS}
+        order = params.pop('order', 'asc')
+        params.pop('order_by', None)
+        params.pop('page', None)
+        per_page = params.pop('per_page', None)
+        where, args = _build_query(params)
+
+        def _search_local(id_above=None, id_below=None, per_page=None, **kwargs) -> JsonResponse:
+            conditions, page_args = ([where] if where else []), list(args)
+            if id_above is not None:
+                conditions.append('id > ?')
+                page_args.append(id_above)
+            if id_below is not None:
+                conditions.append('id < ?')
+                page_args.append(id_below)
+
+            results = []
+            if per_page != 0:
+                results = self.store.search(
+                    ' AND '.join(conditions), page_args, order=order, limit=per_page
+                )
+            return {'total_results': self.store.count(where, args), 'results': results}
+
+        return IDRangePaginator(
+            _search_local,
+            Observation,
+            order=order,
+            per_page=per_page,
+            limit=limit,
+        )
+
+
+def _build_query(params: RequestParams) -> tuple[str, list]:
+    """Translate observation search parameters into a SQL ``WHERE`` clause and arguments for
+    :py:meth:`.ObservationStore.search`
+    """
+    params = dict(params)
+    conditions: list[str] = []
+    args: list = []
+
+    def add_condition(sql: str, *values):
+        conditions.append(sql)
+        args.extend(values)
+
+    def add_in(column: str, values, negate: bool = False):
+        values = ensure_list(values, split_str_list=True)
+        placeholders = ','.join('?' * len(values))
+        add_condition(f'{column} {"NOT IN" if negate else "IN"} ({placeholders})', *values)
+
+    def add_lookup(table: str, column: str, values, negate: bool = False):
+        """Match observation IDs from a lookup table (for place or taxon IDs)"""
+        values = _int_list(values)
+        subquery = (
+            f'SELECT observation_id FROM {table} WHERE {column} IN ({",".join("?" * len(values))})'
+        )
+        add_condition(f'id {"NOT IN" if negate else "IN"} ({subquery})', *values)
+
+    # IDs
+    if 'id' in params:
+        add_in('id', _int_list(params.pop('id')))
+    if 'not_id' in params:
+        add_in('id', _int_list(params.pop('not_id')), negate=True)
+    for key, operator in [('id_above', '>'), ('id_below', '<')]:
+        if key in params:
+            add_condition(f'id {operator} ?', int(params.pop(key)))
+
+    # Taxa, users, and places
+    if 'taxon_id' in params:
+        add_lookup('observation_taxa', 'taxon_id', params.pop('taxon_id'))
+    if 'without_taxon_id' in params:
+        add_lookup('observation_taxa', 'taxon_id', params.pop('without_taxon_id'), negate=True)
+    if 'user_id' in params:
+        user_ids = ensure_list(params.pop('user_id'), split_str_list=True)
+        ids = [try_int(user_id) for user_id in user_ids]
+        logins = [user_id for user_id, id in zip(user_ids, ids, strict=True) if id is None]
+        ids = [id for id in ids if id is not None]
+        if ids and logins:
+            placeholders = ','.join('?' * len(ids)), ','.join('?' * len(logins))
+            sql = f'(user_id IN ({placeholders[0]}) OR user_login IN ({placeholders[1]}))'
+            add_condition(sql, *ids, *logins)
+        elif ids:
+            add_in('user_id', ids)
+        else:
+            add_in('user_login', logins)
+    if 'user_login' in params:
+        add_in('user_login', params.pop('user_login'))
+    if 'place_id' in params:
+        add_lookup('observation_places', 'place_id', params.pop('place_id'))
+    for key, column, operator in [
+        ('swlat', 'latitude', '>='),
+        ('swlng', 'longitude', '>='),
+        ('nelat', 'latitude', '<='),
+        ('nelng', 'longitude', '<='),
+    ]:
+        if key in params:
+            add_condition(f'{column} {operator} ?', float(params.pop(key)))
+    if 'geo' in params:
+        add_condition(f'latitude IS {"NOT " if _bool(params.pop("geo")) else ""}NULL')
+
+    # Observed date
+    if 'd1' in params:
+        add_condition('observed_on >= ?', _date(params.pop('d1')))
+    if 'd2' in params:
+        add_condition('observed_on <= ?', _date(params.pop('d2')))
+    if 'observed_on' in params:
+        add_condition('observed_on = ?', _date(params.pop('observed_on')))
+    for key, start, length in [('year', 1, 4), ('month', 6, 2), ('day', 9, 2)]:
+        if key in params:
+            add_in(
+                f'CAST(substr(observed_on, {start}, {length}) AS INTEGER)',
+                _int_list(params.pop(key)),
+            )
+
+    # Other dates
+    if 'created_d1' in params:
+        add_condition('created_at >= ?', _timestamp(params.pop('created_d1')))
+    if 'created_d2' in params:
+        value = params.pop('created_d2')
+        if _is_date(value):
+            add_condition('created_at < ?', _timestamp(_date_value(value) + timedelta(days=1)))
+        else:
+            add_condition('created_at <= ?', _timestamp(value))
+    if 'created_on' in params:
+        created_on = _date_value(params.pop('created_on'))
+        add_condition(
+            'created_at >= ? AND created_at < ?',
+            _timestamp(created_on),
+            _timestamp(created_on + timedelta(days=1)),
+        )
+    if 'updated_since' in params:
+        add_condition('updated_at >= ?', _timestamp(params.pop('updated_since')))
+
+    # Other attributes
+    if 'quality_grade' in params:
+        add_in('quality_grade', params.pop('quality_grade'))
+    if 'verifiable' in params:
+        verifiable = _bool(params.pop('verifiable'))
+        add_in('quality_grade', ['needs_id', 'research'], negate=not verifiable)
+    if 'captive' in params:
+        add_condition('captive = ?', _bool(params.pop('captive')))
+    if 'geoprivacy' in params:
+        add_in('geoprivacy', params.pop('geoprivacy'))
+    if 'license' in params:
+        licenses = ensure_list(params.pop('license'), split_str_list=True)
+        add_in('license_code', [license.upper() for license in licenses])
+
+    if params:
+        raise ValueError(f'Unsupported parameters for local search: {", ".join(sorted(params))}')
+    return ' AND '.join(conditions), args
+
+
+def _bool(value) -> bool:
+    return str(value).lower() == 'true'
+
+
+def _int_list(value) -> list[int]:
+    return [int(v) for v in ensure_list(value, split_str_list=True)]
+
+
+def _is_date(value) -> bool:
+    """Check if a value is a date without a time"""
+    if isinstance(value, str):
+        return len(value.strip()) <= 10
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def _date_value(value) -> date:
+    dt = value if isinstance(value, date) else try_datetime(value)
+    if dt is None:
+        raise ValueError(f'Invalid date: {value}')
+    return dt.date() if isinstance(dt, datetime) else dt
+
+
+def _date(value) -> str:
+    """Format a date to compare with ``observed_on`` values"""
+    return _date_value(value).isoformat()
+
+
+def _timestamp(value) -> str:
+    """Format a date or datetime to compare with timestamp values (UTC ISO 8601 strings). Like
+    request params, datetimes without a timezone are assumed to be in local time.
+    """
+    dt = try_datetime(value) if isinstance(value, str) else value
+    if dt is None:
+        raise ValueError(f'Invalid date: {value}')
+    if not isinstance(dt, datetime):
+        dt = datetime.combine(dt, time())
+    if not dt.tzinfo:
+        dt = dt.replace(tzinfo=tzlocal())
+    return dt.astimezone(timezone.utc).isoformat()
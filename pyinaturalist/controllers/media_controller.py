@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+
+from pyinaturalist.client.download import DownloadReport, download_media
+from pyinaturalist.constants import PathOrStr
+from pyinaturalist.controllers import BaseController
+from pyinaturalist.models import Observation, Photo, Sound
+
+
+class MediaController(BaseController):
+    """:fa:`camera` Controller for downloading photo and sound files"""
+
+    def download(
+        self,
+        media: Iterable[Photo | Sound | Observation],
+        dest: PathOrStr = '.',
+        size: str = 'medium',
+        **kwargs,
+    ) -> DownloadReport:
+        """Download many photo and/or sound files to a local directory, with multiple downloads in
+        progress at once. Downloads can be interrupted and resumed later. See
+        :py:func:`.download_media` for details.
+
+        Example:
+            >>> observations = client.observations.search(taxon_id=47219, photos=True).limit(500)
+            >>> report = client.media.download(observations, dest='~/honey_bees', size='large')
+            >>> print(report.summary)
+            812 files: 812 downloaded, 0 resumed, 0 skipped, 0 failed
+
+        Args:
+            media: Photos and/or sounds to download, or observations to download all media from
+            dest: Directory to save files in
+            size: Photo size to download (see :py:data:`.PHOTO_SIZES`); ignored for sounds
+            kwargs: Additional keyword arguments for :py:func:`.download_media`
+        """
+        return download_media(
+            _flatten_media(media), dest=dest, size=size, session=self.client.session, **kwargs
+        )
+
+
+def _flatten_media(media: Iterable[Photo | Sound | Observation]) -> Iterable[Photo | Sound]:
+    for item in media:
+        if isinstance(item, Observation):
+            yield from item.photos
+            yield from item.sounds
+        else:
+            yield item
@@ -1,32 +1,62 @@
-from collections.abc import Callable
-
-from pyinaturalist.client import IDPaginator, IDRangePaginator, Paginator
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from itertools import chain, islice
+from logging import getLogger
+
+from pyinaturalist.client import (
+    BulkReport,
+    ConcurrentPaginator,
+    IDPaginator,
+    IDRangePaginator,
+    Paginator,
+    TiledPaginator,
+)
 from pyinaturalist.constants import (
     API_V1,
+    BULK_MAX_WORKERS,
+    HISTOGRAM_SPLIT_INTERVALS,
+    INAT_CREATED_MIN,
     MAX_IDS_PER_REQUEST,
+    PARTITION_MIN_DURATION,
+    SYNC_RECONCILE_INTERVAL,
+    TILE_MAX_DEPTH,
+    TILE_MAX_RESULTS,
+    USER_COUNTS_MAX_RESULTS,
     V1_OBS_ORDER_BY_PROPERTIES,
+    V2_OBS_ORDER_BY_PROPERTIES,
+    DateOrStr,
     IntOrStr,
+    JsonResponse,
     MultiFile,
     MultiInt,
     MultiIntOrStr,
+    RequestParams,
 )
 from pyinaturalist.controllers import BaseController
-from pyinaturalist.converters import ensure_list
+from pyinaturalist.converters import ensure_list, get_histogram_interval, try_datetime
 from pyinaturalist.docs import copy_doc_signature
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.models import (
     Annotation,
     ControlledTermCounts,
     Histogram,
+    HistogramMatrix,
     LifeList,
     Observation,
     Photo,
     Sound,
+    TaxonCount,
     TaxonCounts,
     TaxonSummary,
     UserCounts,
 )
-from pyinaturalist.request_params import validate_multiple_choice_param
+from pyinaturalist.request_params import (
+    convert_fields_param,
+    get_interval_ranges,
+    validate_multiple_choice_param,
+)
+from pyinaturalist.store import ObservationStore, SyncResult, SyncState, get_query_key
 from pyinaturalist.v1 import (
     create_observation,
     delete_observation,
@@ -40,6 +70,10 @@ from pyinaturalist.v1 import (
     update_observation,
     upload,
 )
+from pyinaturalist.v2 import create_observations, update_observations, upload_bulk
+from pyinaturalist.v2 import get_observations as get_observations_v2
+
+logger = getLogger(__name__)
 
 
 class ObservationController(BaseController):
@@ -88,7 +122,7 @@ class ObservationController(BaseController):
             **params,
         )
 
-    @copy_doc_signature(*docs._get_observations, docs._only_id)
+    @copy_doc_signature(*docs._get_observations, docs._observation_v2, docs._only_id)
     def search(self, **params) -> Paginator[Observation]:
         """Search observations
 
@@ -97,6 +131,9 @@ class ObservationController(BaseController):
         * :fas:`lock-open` :ref:`Optional authentication <auth>` (For private/obscured coordinates)
         * :fas:`file-circle-plus` :ref:`Paginated endpoint <pagination>`
         * API reference: :v1:`GET /observations <Observations/get_observations>`
+        * If ``fields`` or ``except_fields`` are specified, the v2 API will be used instead, and
+          only the selected fields will be returned:
+          :v2:`GET /observations <Observations/get_observations>`
 
         Examples:
 
@@ -129,13 +166,23 @@ class ObservationController(BaseController):
 
             >>> obs = client.observations.search(observation_fields={'Species count': 2}).all()
 
+            Return only selected fields, using dot notation for nested fields. This results in
+            much smaller responses for large queries:
+
+            >>> obs = client.observations.search(
+            >>>     place_id=7953,
+            >>>     fields=['id', 'taxon.id', 'taxon.name', 'location'],
+            >>> ).all()
+
         """
+        if params.get('fields') or params.get('except_fields'):
+            return self._search_v2(**params)
 
         # Inline request function needed to pass to ObservationPaginator (IDRangePaginator),
         # which requires a callable that accepts pagination kwargs directly. The v1 function
         # handles its own pagination and cannot be used here.
         def _request_observations(**params):
-            return self.client.session.get(f'{API_V1}/observations', **params).json()
+            return self.client.session.get(f'{API_V1}/observations', **params)
 
         params = validate_multiple_choice_param(params, 'order_by', V1_OBS_ORDER_BY_PROPERTIES)
         params = self.client.add_defaults(_request_observations, params)
@@ -148,8 +195,153 @@ class ObservationController(BaseController):
             **params,
         )
 
-    @copy_doc_signature(*docs._get_observations, docs._observation_histogram)
-    def histogram(self, **params) -> Histogram:
+    def search_tiled(
+        self,
+        max_tile_results: int = TILE_MAX_RESULTS,
+        max_depth: int = TILE_MAX_DEPTH,
+        max_workers: int = BULK_MAX_WORKERS,
+        **params,
+    ) -> TiledPaginator[Observation]:
+        """Search observations within a large area, split into smaller tiles that are fetched
+        concurrently. Accepts the same parameters as :py:meth:`.search`.
+
+        The bounding box (``swlat``, ``swlng``, ``nelat``, and ``nelng``; or the whole world, if
+        not specified) is recursively split into quadrants until each one has at most
+        ``max_tile_results`` results, and then each tile is paginated separately. Compared to a
+        single query, this is faster for large areas, and results in many small queries that are
+        more likely to be cached. See :py:class:`.TiledPaginator` for details.
+
+        Example:
+            Get all research-grade observations of Odonates in North America:
+
+            >>> paginator = client.observations.search_tiled(
+            ...     taxon_id=47792,
+            ...     quality_grade='research',
+            ...     swlat=7,
+            ...     swlng=-168,
+            ...     nelat=84,
+            ...     nelng=-52,
+            ... )
+            >>> print(paginator.get_tiles())
+            >>> observations = paginator.all()
+
+        Args:
+            max_tile_results: Maximum number of results per tile
+            max_depth: Maximum number of times to split a tile
+            max_workers: Maximum number of requests to send at once
+        """
+        return TiledPaginator(
+            self.search(**params),
+            max_tile_results=max_tile_results,
+            max_depth=max_depth,
+            max_workers=max_workers,
+        )
+
+    def sync(self, store: ObservationStore, reconcile: bool | None = None, **params) -> SyncResult:
+        """Sync observations matching the search criteria into a local
+        :py:class:`.ObservationStore`. Accepts the same parameters as :py:meth:`.search`.
+
+        On the first sync, all matching observations are fetched. After that, only observations
+        updated since the last sync are fetched (using ``updated_since``), and then saved to the
+        store if they are new or have changed.
+
+        An incremental sync can't tell when an observation has been deleted, or no longer matches
+        the search criteria. To handle this, the IDs of all matching observations are periodically
+        reconciled with the store, which is much faster than fetching complete records: local
+        observations that are no longer in the results are removed, and any that are missing
+        locally are fetched. By default this is done if it's been longer than
+        ``SYNC_RECONCILE_INTERVAL`` (1 day) since the last reconciliation.
+
+        Example:
+            >>> with ObservationStore() as store:
+            ...     result = client.observations.sync(store, place_id=7953, taxon_id=47224)
+            ...     print(result.summary)
+            ...     observations = store.all(result.query_key)
+
+        If ``updated_since`` is also given, the later of that and the time of the most recent update
+        from the last sync will be used. Reconciliation is not limited by ``updated_since``.
+
+        Args:
+            store: Store to save observations to
+            reconcile: Always (``True``) or never (``False``) reconcile observation IDs with the
+                store, instead of only after ``SYNC_RECONCILE_INTERVAL``
+        """
+        if params.get('fields') or params.get('except_fields'):
+            raise ValueError('Only complete observation records can be synced')
+
+        updated_since = params.pop('updated_since', None)
+        updated_since = _to_utc(updated_since) if updated_since else None
+        query_key = get_query_key(params)
+        sync_start = datetime.now(timezone.utc)
+        state = store.get_sync_state(query_key) or SyncState(query_key, params)
+        result = SyncResult(query_key)
+        if state.updated_since and (not updated_since or state.updated_since > updated_since):
+            updated_since = state.updated_since
+
+        # Fetch new and updated observations since the last sync
+        paginator = self.search(**params, updated_since=updated_since)
+        while page := paginator.next_page():
+            n_new, n_updated = store.upsert(page, query_key)
+            result.new += n_new
+            result.updated += n_updated
+            updated_at = [obs.updated_at for obs in page if obs.updated_at]
+            if updated_at and (not state.updated_since or max(updated_at) > state.updated_since):
+                state.updated_since = max(updated_at)
+            state.max_id = max(state.max_id or 0, *(obs.id for obs in page))
+
+        if reconcile is None:
+            reconcile = (
+                not state.last_reconciled
+                or sync_start - state.last_reconciled > SYNC_RECONCILE_INTERVAL
+            )
+        if reconcile:
+            result.deleted, n_missing = self._reconcile(store, query_key, **params)
+            result.new += n_missing
+            result.reconciled = True
+            state.last_reconciled = sync_start
+
+        state.last_synced = sync_start
+        store.save_sync_state(state)
+        logger.info(f'Synced observations for query {query_key}: {result.summary}')
+        return result
+
+    def _reconcile(self, store: ObservationStore, query_key: str, **params) -> tuple[int, int]:
+        """Compare remote and local observation IDs for a synced query; remove local observations
+        that no longer match, and fetch matching observations missing from the store
+
+        Returns:
+            Number of observations removed, and number added
+        """
+        remote_ids = {obs.id for obs in self.search(**params, fields=['id'])}
+        local_ids = store.ids(query_key)
+        n_removed = store.remove_from_query(query_key, local_ids - remote_ids)
+        n_added = 0
+        if missing_ids := sorted(remote_ids - local_ids):
+            paginator = self.from_ids(missing_ids)
+            while page := paginator.next_page():
+                n_added += store.upsert(page, query_key)[0]
+        return n_removed, n_added
+
+    def _search_v2(self, **params) -> Paginator[Observation]:
+        """Search observations using the v2 API, with a selection of return fields"""
+        # Record IDs are always needed for ID-based pagination
+        fields = convert_fields_param(params.get('fields'))
+        if isinstance(fields, dict):
+            params['fields'] = {**fields, 'id': True}
+
+        params = validate_multiple_choice_param(params, 'order_by', V2_OBS_ORDER_BY_PROPERTIES)
+        params = self.client.add_defaults(get_observations_v2, params)
+
+        return ObservationPaginator(
+            get_observations_v2,
+            Observation,
+            loop=self.client.loop,
+            annotation_callback=self.client.annotations.lookup,
+            **params,
+        )
+
+    @copy_doc_signature(*docs._get_observations, docs._observation_histogram, docs._max_workers)
+    def histogram(self, max_workers: int = BULK_MAX_WORKERS, **params) -> Histogram:
         """Search observations and return histogram data for the given time interval
 
         .. rubric:: Notes
@@ -166,6 +358,10 @@ class ObservationController(BaseController):
           ``created_d1``, to limit the number of groups returned. You can override those values if you
           want data from a longer or shorter time span.
         * The 'hour' interval only works with ``date_field='created'``
+        * For 'hour', 'day', and 'week' intervals, long date ranges are split into smaller ranges
+          (a week of hours, or a year of days or weeks) that are fetched concurrently and then
+          combined, so you can get a fine-grained histogram over any time span. This requires both
+          start and end dates (``d1`` and ``d2``, or ``created_d1`` and ``created_d2``).
 
         Example:
             Get observations per month during the first half of 2020 in Austria (place ID 8057)
@@ -211,26 +407,89 @@ class ObservationController(BaseController):
 
                 .. literalinclude:: ../sample_data/v1/get_observation_histogram_day.py
                     :lines: 3-
+        """
+        params = self.client.add_defaults(self.client.session.get, params)
+        results = self._get_histograms(_split_histogram_params(params), max_workers)
+        return Histogram.from_json(_merge_histograms(results))
 
+    def histogram_matrix(
+        self,
+        taxon_ids: MultiInt | None = None,
+        place_ids: MultiInt | None = None,
+        max_workers: int = BULK_MAX_WORKERS,
+        **params,
+    ) -> HistogramMatrix:
+        """Get histograms for multiple taxa or places over the same time interval, combined into
+        a table of counts. Histograms are fetched concurrently, and accept the same parameters as
+        :py:meth:`.histogram`.
+
+        Example:
+            Compare observations per month of year for three species of swallowtail butterflies:
+
+            >>> matrix = client.observations.histogram_matrix(
+            ...     taxon_ids=[60551, 62453, 59911],
+            ...     interval='month_of_year',
+            ...     place_id=1,
+            ... )
+            >>> df = matrix.to_dataframe()
+
+        Args:
+            taxon_ids: Get one histogram per taxon
+            place_ids: Get one histogram per place
+            max_workers: Maximum number of requests to send at once
         """
+        if (taxon_ids is None) == (place_ids is None):
+            raise ValueError('Either taxon_ids or place_ids must be specified, but not both')
+        id_field = 'taxon_id' if taxon_ids is not None else 'place_id'
+        ids = [int(id) for id in ensure_list(taxon_ids if taxon_ids is not None else place_ids)]
+
+        # Flatten any date range splits for all IDs, so they can all run concurrently
         params = self.client.add_defaults(self.client.session.get, params)
-        response = self.client.session.get(f'{API_V1}/observations/histogram', **params).json()
-        return Histogram.from_json(response['results'])
+        param_groups = [_split_histogram_params({**params, id_field: id}) for id in ids]
+        results = self._get_histograms(list(chain.from_iterable(param_groups)), max_workers)
+
+        iter_results = iter(results)
+        histograms = {
+            id: Histogram.from_json(_merge_histograms(list(islice(iter_results, len(group)))))
+            for id, group in zip(ids, param_groups, strict=True)
+        }
+        return HistogramMatrix.from_histograms(histograms, id_field=id_field)
+
+    def _get_histograms(
+        self, param_sets: list[RequestParams], max_workers: int = BULK_MAX_WORKERS
+    ) -> list[JsonResponse]:
+        """Get raw histogram results for one or more sets of request params"""
+
+        def _get_histogram(params: RequestParams) -> JsonResponse:
+            response = self.client.session.get(f'{API_V1}/observations/histogram', **params)
+            return response.json()['results']
+
+        if len(param_sets) == 1:
+            return [_get_histogram(param_sets[0])]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_get_histogram, param_sets))
 
     # TODO: Example response UserCounts object?
-    @copy_doc_signature(*docs._get_observations)
-    def identifiers(self, **params) -> UserCounts:
+    @copy_doc_signature(*docs._get_observations, docs._partition, docs._max_workers)
+    def identifiers(
+        self, partition: bool = False, max_workers: int = BULK_MAX_WORKERS, **params
+    ) -> UserCounts:
         """Get identifiers of observations matching the search criteria and the count of
         observations they have identified. By default, results are sorted by ID count in descending.
 
         .. rubric:: Notes
 
         * API reference: :v1:`GET /observations/identifiers <Observations/get_observations_identifiers>`
-        * This endpoint will only return up to 500 results.
+        * This endpoint will only return up to 500 results, unless ``partition=True`` is used (see
+          :py:meth:`.observers` for details)
 
         Example:
             >>> client.observations.identifiers(place_id=72645)
         """
+        if partition:
+            return self._get_user_counts_partitioned(
+                get_observation_identifiers, max_workers, **params
+            )
         response = self.client.request(get_observation_identifiers, **params)
         return UserCounts.from_json(response)
 
@@ -261,8 +520,10 @@ class ObservationController(BaseController):
         return LifeList.from_json(response)
 
     # TODO: Example response UserCounts object?
-    @copy_doc_signature(*docs._get_observations)
-    def observers(self, **params) -> UserCounts:
+    @copy_doc_signature(*docs._get_observations, docs._partition, docs._max_workers)
+    def observers(
+        self, partition: bool = False, max_workers: int = BULK_MAX_WORKERS, **params
+    ) -> UserCounts:
         """Get observers of observations matching the search criteria and the count of
         observations and distinct taxa of rank species they have observed.
 
@@ -273,12 +534,69 @@ class ObservationController(BaseController):
         * This endpoint will only return up to 500 results
         * See this issue for more details: https://github.com/inaturalist/iNaturalistAPI/issues/235
 
+        To get all results, use ``partition=True``. This splits the query by observation creation
+        date (``created_d1`` and ``created_d2``), which are then fetched concurrently. Any date
+        range with more than 500 results is split in half until all results are returned. Results
+        are then combined by user; see :py:meth:`.UserCounts.merge` for details. Note that species
+        counts can't be combined exactly, so these will be lower than the actual values.
+
         Example:
             >>> client.observations.observers(place_id=72645, order_by='species_count')
+
+            Get all observers in Mexico:
+
+            >>> client.observations.observers(place_id=6793, partition=True)
         """
+        if partition:
+            return self._get_user_counts_partitioned(
+                get_observation_observers, max_workers, **params
+            )
         response = self.client.request(get_observation_observers, **params)
         return UserCounts.from_json(response)
 
+    def _get_user_counts_partitioned(
+        self, request_function: Callable, max_workers: int = BULK_MAX_WORKERS, **params
+    ) -> UserCounts:
+        """Split a user count query by creation date until no partition exceeds the API result
+        limit, and then combine results for all partitions
+        """
+        start = _to_utc(params.pop('created_d1', None) or INAT_CREATED_MIN)
+        end = _to_utc(params.pop('created_d2', None) or datetime.now(timezone.utc), end_of_day=True)
+        # Request the maximum number of results, so only partitions over the API limit are split
+        params.pop('page', None)
+        params['per_page'] = USER_COUNTS_MAX_RESULTS
+
+        def _get_partition(date_range: tuple[datetime, datetime]) -> JsonResponse:
+            created_d1, created_d2 = date_range
+            return self.client.request(
+                request_function, created_d1=created_d1, created_d2=created_d2, **params
+            )
+
+        partitions = []
+        pending: list[tuple[datetime, datetime]] = [(start, end)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending:
+                next_pending: list[tuple[datetime, datetime]] = []
+                for (d1, d2), response in zip(
+                    pending, executor.map(_get_partition, pending), strict=True
+                ):
+                    is_capped = response.get('total_results', 0) > len(response['results'])
+                    if is_capped and d2 - d1 > PARTITION_MIN_DURATION:
+                        # Date params are inclusive, so end the first half just before the second
+                        mid = (d1 + (d2 - d1) / 2).replace(microsecond=0)
+                        next_pending += [(d1, mid - timedelta(milliseconds=1)), (mid, d2)]
+                        continue
+                    if is_capped:
+                        logger.warning(f'Results for {d1} to {d2} are incomplete')
+                    partitions.append(UserCounts.from_json(response))
+                pending = next_pending
+
+        logger.info(f'Combining results from {len(partitions)} partitions')
+        results = UserCounts.merge(partitions)
+        if params.get('order_by') == 'species_count':
+            results.data.sort(key=lambda user: user.species_count, reverse=True)
+        return results
+
     @copy_doc_signature(*docs._get_observations)
     def popular_fields(self, **params) -> ControlledTermCounts:
         """Get controlled terms values and a monthly histogram of observations matching the search
@@ -313,8 +631,8 @@ class ObservationController(BaseController):
         response = self.client.request(get_observation_species_counts, count_only=True, **params)
         return response['total_results']
 
-    @copy_doc_signature(*docs._get_observations)
-    def species_counts(self, **params) -> TaxonCounts:
+    @copy_doc_signature(*docs._get_observations, docs._max_workers)
+    def species_counts(self, max_workers: int = BULK_MAX_WORKERS, **params) -> TaxonCounts:
         """Get all species (or other 'leaf taxa') associated with observations matching the search
         criteria, and the count of observations they are associated with.
 
@@ -322,12 +640,32 @@ class ObservationController(BaseController):
 
         * API reference: :v1:`GET /observations/species_counts <Observations/get_observations_species_counts>`
         * **Leaf taxa** are the leaves of the taxonomic tree, like species, subspecies, variety, or form
+        * By default, only the first page of results is returned. To get all results, use
+          ``page='all'``. After the first page, all remaining pages will be fetched concurrently.
 
         Example:
             >>> client.observations.species_counts(user_login='my_username', quality_grade='research')
+
+            Get all species observed in Mexico:
+
+            >>> client.observations.species_counts(place_id=6793, page='all')
         """
-        response = self.client.request(get_observation_species_counts, **params)
-        return TaxonCounts.from_json(response)
+        if params.get('page') != 'all':
+            response = self.client.request(get_observation_species_counts, **params)
+            return TaxonCounts.from_json(response)
+
+        params.setdefault('per_page', 500)
+        paginator = self.client.paginate(
+            get_observation_species_counts,
+            TaxonCount,
+            cls=ConcurrentPaginator,
+            max_workers=max_workers,
+            **params,
+        )
+        # Results may shift between pages if observations are added while fetching
+        results = TaxonCounts(data=paginator.all())  # type: ignore [call-arg]
+        results.deduplicate()
+        return results
 
     def taxon_summary(self, observation_id: int, **params) -> TaxonSummary:
         """Get information about an observation's taxon, within the context of the observation's location
@@ -367,6 +705,43 @@ class ObservationController(BaseController):
         response = self.client.request(create_observation, auth=True, **params)
         return Observation.from_json(response)
 
+    def create_bulk(self, observations: Iterable[RequestParams], **params) -> BulkReport:
+        """Create multiple observations, with multiple requests in progress at once. Observation
+        field values, photos, and sounds are sent as follow-up requests as soon as each observation
+        has been created.
+
+        Each observation is assigned a UUID before sending (if it doesn't already have one), so
+        retried requests will not create duplicate observations. Errors are reported per
+        observation instead of raised.
+
+        .. rubric:: Notes
+
+        * :fa:`lock` :ref:`Requires authentication <auth>`
+        * API reference: :v2:`POST /observations <Observations/post_observations>`
+
+        Example:
+            >>> report = client.observations.create_bulk(
+            ...     [
+            ...         {'species_guess': 'Pieris rapae', 'photos': '~/photo_1.jpg'},
+            ...         {'species_guess': 'Danaus plexippus', 'observation_fields': {297: 3}},
+            ...     ],
+            ... )
+            >>> print(report.summary)
+
+        Args:
+            observations: Parameters for each observation to create; see
+                :py:func:`.v2.create_observation` for details
+            max_workers: Maximum number of requests to send at once
+            max_attempts: Maximum number of times to try each request
+            callback: Function to call with each :py:class:`.BulkResult` as it completes
+
+        Returns:
+            A :py:class:`.BulkResult` for each observation, in the same order as the input
+        """
+        return self.client.request(
+            create_observations, auth=True, observations=observations, **params
+        )
+
     def delete(self, observation_ids: MultiInt, **params):
         """Delete one or more observations
 
@@ -408,6 +783,37 @@ class ObservationController(BaseController):
         response = self.client.request(update_observation, auth=True, **params)
         return Observation.from_json(response)
 
+    def update_bulk(self, observations: Iterable[RequestParams], **params) -> BulkReport:
+        """Update multiple observations by UUID, with multiple requests in progress at once.
+        Errors are reported per observation instead of raised.
+
+        .. rubric:: Notes
+
+        * :fa:`lock` :ref:`Requires authentication <auth>`
+        * API reference: :v2:`PUT /observations/{uuid} <Observations/put_observations_uuid>`
+
+        Example:
+            >>> report = client.observations.update_bulk(
+            ...     [
+            ...         {'uuid': '53411fc2-bdf0-434e-afce-4dac33970173', 'captive_flag': True},
+            ...         {'uuid': '8b7a1b0e-ad12-4d48-b2b0-6a1a7f1bd7c5', 'description': 'updated'},
+            ...     ],
+            ... )
+
+        Args:
+            observations: Parameters for each observation to update, including ``uuid``; see
+                :py:func:`.v2.update_observation` for details
+            max_workers: Maximum number of requests to send at once
+            max_attempts: Maximum number of times to try each request
+            callback: Function to call with each :py:class:`.BulkResult` as it completes
+
+        Returns:
+            A :py:class:`.BulkResult` for each observation, in the same order as the input
+        """
+        return self.client.request(
+            update_observations, auth=True, observations=observations, **params
+        )
+
     def upload(
         self,
         observation_id: int,
@@ -469,6 +875,40 @@ class ObservationController(BaseController):
                 response_objs.append(Sound.from_json(response))
         return response_objs
 
+    def upload_bulk(self, uploads: Iterable[tuple[str, MultiFile]], **params) -> BulkReport:
+        """Upload many photo and/or sound files to one or more existing observations, with
+        multiple uploads in progress at once. Failed uploads are retried individually, and errors
+        are reported per file instead of raised.
+
+        .. rubric:: Notes
+
+        * :fa:`lock` :ref:`Requires authentication <auth>`
+        * API reference: :v2:`POST /observation_photos <ObservationPhotos/post_observation_photos>`
+        * API reference: :v2:`POST /observation_sounds <ObservationSounds/post_observation_sounds>`
+
+        Example:
+
+            >>> results = client.observations.upload_bulk(
+            ...     [
+            ...         ('53411fc2-bdf0-434e-afce-4dac33970173', ['~/observations/2020_09_01_140031.jpg']),
+            ...         ('8b7a1b0e-ad12-4d48-b2b0-6a1a7f1bd7c5', '~/observations/2020_09_01_141507.mp3'),
+            ...     ],
+            ...     max_workers=4,
+            ... )
+            >>> failed = [result.item for result in results if not result.ok]
+
+        Args:
+            uploads: Pairs of ``(observation_uuid, files)``, where ``files`` may be one or more image
+                or audio files, file-like objects, file paths, or URLs
+            max_workers: Maximum number of files to upload at once
+            max_attempts: Maximum number of times to try uploading each file
+            callback: Function to call with each :py:class:`.BulkResult` as it completes
+
+        Returns:
+            A :py:class:`.BulkResult` for each file, in the same order as the input
+        """
+        return self.client.request(upload_bulk, auth=True, uploads=uploads, **params)
+
 
 class ObservationPaginator(IDRangePaginator):
     """Paginate through observation results by a range of IDs instead of standard pagination
@@ -490,7 +930,78 @@ class ObservationPaginator(IDRangePaginator):
 
     def next_page(self) -> list[Observation]:
         observations = super().next_page()
-        # Use cached controlled_terms lookup to fill in missing annotation details
+        # Use cached controlled_terms lookup to fill in missing annotation details for the whole page
+        # at once, then split the results back up by observation
+        annotations = [annotation for obs in observations for annotation in obs.annotations or []]
+        if not annotations:
+            return observations
+
+        annotations = self.annotation_callback(annotations)
+        start = 0
         for obs in observations:
-            obs.annotations = self.annotation_callback(obs.annotations)
+            end = start + len(obs.annotations or [])
+            obs.annotations = annotations[start:end]
+            start = end
         return observations
+
+
+def _to_utc(value: DateOrStr, end_of_day: bool = False) -> datetime:
+    """Convert a date, datetime, or string to a timezone-aware datetime, assuming UTC if needed.
+
+    Args:
+        end_of_day: For a date without a time, use the last millisecond of that day instead of the
+            start, so it can be used as an inclusive end date
+    """
+    is_date = not isinstance(value, datetime) and (
+        isinstance(value, date) or len(str(value).strip()) <= 10
+    )
+    dt = try_datetime(value) if isinstance(value, str) else value
+    if dt is None:
+        raise ValueError(f'Invalid date: {value}')
+    if not isinstance(dt, datetime):
+        dt = datetime(dt.year, dt.month, dt.day)
+    if is_date and end_of_day:
+        dt += timedelta(days=1, milliseconds=-1)
+    return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _split_histogram_params(params: RequestParams) -> list[RequestParams]:
+    """Split histogram request params with a long date range into params for smaller date ranges,
+    if needed for the histogram interval
+    """
+    interval = str(params.get('interval') or '').replace(' ', '_')
+    prefix = 'created_' if params.get('date_field') == 'created' else ''
+    d1, d2 = params.get(f'{prefix}d1'), params.get(f'{prefix}d2')
+    split_interval = HISTOGRAM_SPLIT_INTERVALS.get(interval)
+    if not (split_interval and d1 and d2):
+        return [params]
+
+    starts = [start for start, _ in get_interval_ranges(d1, d2, split_interval)]
+    if len(starts) <= 1:
+        return [params]
+
+    # Date params are inclusive, so end each range just before the next one starts: the previous
+    # day for date-only values, or the previous second for datetimes. The original start and end
+    # values are kept, so date-only values keep the same meaning.
+    step = timedelta(days=1) if type(starts[1]) is date else timedelta(seconds=1)
+    ends = [start - step for start in starts[1:]] + [d2]
+    starts[0] = d1
+    return [
+        {**params, f'{prefix}d1': start, f'{prefix}d2': end}
+        for start, end in zip(starts, ends, strict=False)
+    ]
+
+
+def _merge_histograms(results: list[JsonResponse]) -> JsonResponse:
+    """Combine raw histogram results by adding counts for each bin. Bins at the edges of split
+    date ranges (for example, a week that spans two years) may be included in more than one result.
+    """
+    if len(results) == 1:
+        return results[0]
+
+    interval = get_histogram_interval(results[0])
+    counts: dict[str, int] = {}
+    for result in results:
+        for label, count in result[interval].items():
+            counts[label] = counts.get(label, 0) + count
+    return {interval: dict(sorted(counts.items()))}
@@ -192,23 +192,21 @@ def safe_split(value: Any, delimiter: str = '|') -> list[str]:
 
 
 def ensure_file_obj(value: AnyFile, session: Session | None = None) -> IO:
-    """Load data into a file-like object, if it isn't already. Accepts local file paths and URLs."""
+    """Load data into a file-like object, if it isn't already. Accepts local file paths and URLs.
+    Local files are opened without reading their contents, so they can be streamed while uploading.
+    """
     file_size = 0
 
     # Load from URL
     if isinstance(value, str) and URL_PATTERN.match(value):
         session = session or Session()
         response = session.get(value)
-        file_obj: IO = response.raw  # type: ignore  # HTTPResponse acts as an IO class
-        try:
-            file_size = int(response.headers.get('Content-Length'))  # type: ignore [arg-type]
-        except (TypeError, ValueError):
-            pass
-    # Load from local file path
+        file_obj: IO = BytesIO(response.content)
+    # Open a local file path; contents will be read lazily when uploading
     elif isinstance(value, (str, Path)):
         file_path = Path(value).expanduser().resolve()
         logger.info(f'Reading from file: {file_path}')
-        file_obj = BytesIO(file_path.read_bytes())
+        file_obj = open(file_path, 'rb')
     # Otherwise, assume it's already a file or file-like object
     elif hasattr(value, 'read'):
         file_obj = value
@@ -216,11 +214,13 @@ def ensure_file_obj(value: AnyFile, session: Session | None = None) -> IO:
         file_obj = BytesIO(value)  # type: ignore [arg-type]
 
     # Verify maximum file size
-    if not file_size and hasattr(file_obj, 'seek'):
+    if hasattr(file_obj, 'seek'):
         file_obj.seek(0, SEEK_END)
         file_size = file_obj.tell()
         file_obj.seek(0)
     if file_size > MAX_FILESIZE:
+        if isinstance(value, (str, Path)):
+            file_obj.close()
         raise ValueError(f'File size exceeds maximum allowed ({MAX_FILESIZE} bytes): {file_size}')
 
     return file_obj
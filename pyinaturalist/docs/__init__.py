@@ -8,6 +8,7 @@
 from pyinaturalist.docs.docstrings import ApiDocstring, copy_annotations, copy_docstrings
 from pyinaturalist.docs.emoji import EMOJI
 from pyinaturalist.docs.signatures import (
+    LazySignature,
     copy_doc_signature,
     copy_signatures,
     document_common_args,
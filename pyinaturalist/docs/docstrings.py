@@ -2,6 +2,7 @@
 
 import re
 from collections.abc import Callable, Iterable
+from functools import lru_cache
 from inspect import cleandoc
 from typing import get_type_hints
 
@@ -68,19 +69,7 @@ class ApiDocstring:
     @staticmethod
     def _split_sections(docstring: str) -> dict[str, str]:
         """Split a docstring into a dict of ``{section_title: section_content}``"""
-        docstring = docstring or ''
-        sections = dict.fromkeys(DEFAULT_SECTIONS, '')
-        current_section = 'Description'
-
-        for line in docstring.splitlines():
-            if SECTION_PATTERN.match(line):
-                current_section = line.strip().rstrip(':')
-                sections[current_section] = ''
-            else:
-                sections[current_section] += line + '\n'
-
-        # Unindent section content and trim trailing whitespace
-        return {k: cleandoc(v.rstrip()) for k, v in sections.items()}
+        return dict(_split_sections(docstring or ''))
 
     def __str__(self) -> str:
         """Reassemble sections back into a complete docstring"""
@@ -91,6 +80,28 @@ class ApiDocstring:
         return docstring
 
 
+# Template docstrings are reused by many functions, so only parse them once
+@lru_cache(maxsize=None)
+def _split_sections(docstring: str) -> dict[str, str]:
+    sections = dict.fromkeys(DEFAULT_SECTIONS, '')
+    current_section = 'Description'
+
+    for line in docstring.splitlines():
+        if SECTION_PATTERN.match(line):
+            current_section = line.strip().rstrip(':')
+            sections[current_section] = ''
+        else:
+            sections[current_section] += line + '\n'
+
+    # Unindent section content and trim trailing whitespace
+    return {k: cleandoc(v.rstrip()) for k, v in sections.items()}
+
+
+@lru_cache(maxsize=None)
+def _get_type_hints(func: Callable) -> dict:
+    return get_type_hints(func)
+
+
 def copy_annotations(
     target_function: Callable,
     template_functions: list[TemplateFunction],
@@ -98,7 +109,7 @@ def copy_annotations(
 ) -> Callable:
     """Copy type annotations from one or more template functions to a target function"""
     for template_function in template_functions:
-        annotations = get_type_hints(template_function)
+        annotations = dict(_get_type_hints(template_function))
         if not include_return:
             annotations.pop('return', None)
         if hasattr(target_function, '__annotations__'):
@@ -92,21 +92,46 @@ def copy_signatures(
 ) -> Callable:
     """Copy function signatures from one or more template functions to a target function.
 
+    The new signature is built on first access (e.g., by :py:func:`inspect.signature` or
+    ``help()``) instead of at import time; see :py:class:`.LazySignature`.
+
     Args:
         target_function: Function to modify
         template_functions: Functions containing params to apply to ``target_function``
         exclude_args: Arguments to exclude from the copied signature
     """
+    target_sig = signature(target_function)
+    target_function.__signature__ = LazySignature(  # type: ignore[attr-defined]
+        partial(
+            _build_signature,
+            target_function,
+            target_sig,
+            template_functions,
+            exclude_args,
+        ),
+        default=target_sig,
+    )
+    return target_function
+
+
+def _build_signature(
+    target_function: Callable,
+    target_sig: inspect.Signature,
+    template_functions: list[TemplateFunction],
+    exclude_args: Iterable[str] | None = None,
+) -> inspect.Signature:
+    """Combine parameters from a function's original signature and its template functions"""
     # Start with 'self' parameter if this is an instance method
     fparams = {}
-    if 'self' in signature(target_function).parameters or ismethod(target_function):
+    if 'self' in target_sig.parameters or ismethod(target_function):
         fparams['self'] = Parameter('self', Parameter.POSITIONAL_OR_KEYWORD)
 
     # Add and combine parameters from all template functions, excluding duplicates, self, and *args
     for func in template_functions:
+        func_sig = target_sig if func is target_function else signature(func)
         new_fparams = {
             k: v
-            for k, v in signature(func).parameters.items()
+            for k, v in func_sig.parameters.items()
             if k != 'self' and v.kind != Parameter.VAR_POSITIONAL
         }
         fparams.update(new_fparams)
@@ -116,13 +141,58 @@ def copy_signatures(
         fparams.pop(key, None)
 
     fparams = _deduplicate_var_kwargs(fparams)
+    return inspect.Signature(parameters=list(fparams.values()))
 
-    # Create new signature and apply to function
-    new_params = list(fparams.values())
-    new_sig = inspect.Signature(parameters=new_params)
-    target_function.__signature__ = new_sig  # type: ignore[attr-defined]
 
-    return target_function
+class LazySignature(inspect.Signature):
+    """A function signature that is built the first time its contents are accessed. Building
+    signatures for every API function and controller method adds a noticeable amount of time to
+    imports, and most programs never need them.
+
+    Args:
+        factory: Function that builds the complete signature
+        default: Signature to use instead if ``factory`` fails
+    """
+
+    __slots__ = ('_default', '_factory')
+
+    def __init__(
+        self,
+        factory: Callable[[], inspect.Signature],
+        default: inspect.Signature | None = None,
+    ):
+        self._factory: Callable[[], inspect.Signature] | None = factory
+        self._default = default or inspect.Signature()
+
+    @property
+    def parameters(self):
+        self._load()
+        return self._parameters
+
+    @property
+    def return_annotation(self):
+        self._load()
+        return self._return_annotation
+
+    # Returns a regular Signature, since the replacement doesn't need to be lazy
+    def replace(self, **kwargs) -> inspect.Signature:  # type: ignore[override]
+        return inspect.Signature(
+            list(self.parameters.values()),
+            return_annotation=self.return_annotation,
+        ).replace(**kwargs)
+
+    def _load(self):
+        if self._factory is None:
+            return
+        try:
+            sig = self._factory()
+        # If for any reason this fails, just log the error and use the original signature
+        except Exception:
+            logger.exception('Failed to build function signature')
+            sig = self._default
+        self._parameters = sig.parameters
+        self._return_annotation = sig.return_annotation
+        self._factory = None
 
 
 def _deduplicate_var_kwargs(params: dict) -> dict:
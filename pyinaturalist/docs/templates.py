@@ -15,6 +15,7 @@ Note: Since the templates are applied dynamically at import time, this adds a ti
 from typing import Any
 
 from pyinaturalist.constants import (
+    BULK_MAX_WORKERS,
     AnyDate,
     AnyDateTime,
     CommunityIDStatus,
@@ -705,6 +706,12 @@ def _geojson_properties(properties: list[str] | None = None):
     """
 
 
+def _max_workers(max_workers: int = BULK_MAX_WORKERS):
+    """Args:
+    max_workers: Maximum number of requests to send at once, if the query is split into multiple requests
+    """
+
+
 def _name(name: str | None = None):
     """Args:
     name: Name must match this value
@@ -729,6 +736,12 @@ def _project_id(project_id: int | None = None):
     """
 
 
+def _partition(partition: bool = False):
+    """Args:
+    partition: Get all results, by splitting the query into multiple smaller queries
+    """
+
+
 def _pagination(
     page: int | None = None,
     per_page: int | None = None,
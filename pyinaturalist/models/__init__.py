@@ -13,7 +13,14 @@ from attr import define, validators
 
 from pyinaturalist.constants import JsonResponse, ResponseOrResults
 from pyinaturalist.converters import convert_lat_long, try_datetime
-from pyinaturalist.models.base import BaseModel, BaseModelCollection, T, load_json
+from pyinaturalist.models.base import (
+    BaseModel,
+    BaseModelCollection,
+    T,
+    load_json,
+    to_dicts,
+    to_json_bytes,
+)
 from pyinaturalist.models.lazy_property import LazyProperty, add_lazy_attrs, get_lazy_properties
 
 
@@ -100,6 +107,7 @@ from pyinaturalist.models.observation import (
     Flag,
     HistogramBin,
     Histogram,
+    HistogramMatrix,
     QualityMetric,
     Vote,
 )
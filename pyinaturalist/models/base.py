@@ -1,6 +1,7 @@
 """Base class and utilities for data models"""
 
 from collections import UserList
+from collections.abc import Iterable
 from copy import deepcopy
 from datetime import datetime
 from logging import getLogger
@@ -8,7 +9,7 @@ from os.path import expanduser
 from pathlib import Path
 from typing import Generic, TypeVar
 
-from attr import Factory, asdict, define, field, fields_dict
+from attr import Factory, define, field, fields, fields_dict
 
 from pyinaturalist.constants import (
     DATETIME_SHORT_FORMAT,
@@ -26,6 +27,12 @@ try:
 except ImportError:
     import json  # type: ignore
 
+# Optionally use orjson for serializing models to JSON, if available
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 T = TypeVar('T', bound='BaseModel')
 TC = TypeVar('TC', bound='BaseModelCollection')
 logger = getLogger(__name__)
@@ -117,31 +124,27 @@ class BaseModel:
         """Get the subset of attribute names to show in the model's string representation"""
         return [getattr(a, 'name', '') for a in self.__attrs_attrs__]
 
-    def to_dict(self, keys: list[str] | None = None, recurse: bool = True) -> JsonResponse:
-        """Convert this object back to dict format
+    def to_dict(
+        self, keys: list[str] | None = None, recurse: bool = True, raw: bool = False
+    ) -> JsonResponse:
+        """Convert this object back to dict format. Any nested data for lazy-loaded properties that
+        hasn't been accessed yet is returned without converting it to model objects.
 
         Args:
             keys: Only keep the specified keys (attribute names)
             recurse: Recurse into nested model objects
+            raw: Return unconverted nested data as-is instead of copying it. This is much faster for
+                models that are only loaded and dumped again, but the returned dict will share data
+                with this object.
         """
-
-        def recursive_serializer(_inst, _attribute, value):
-            if keys and _attribute and _attribute.name.lstrip('_') not in keys:
-                return None
-            return value.to_dict() if isinstance(value, BaseModel) else value
-
-        obj_dict = asdict(
-            self,
-            filter=lambda a, _: a.init is True,
-            retain_collection_types=True,
-            recurse=recurse,
-            value_serializer=recursive_serializer if recurse else None,
-        )
-
-        obj_dict = {k.lstrip('_'): v for k, v in obj_dict.items()}
+        dict_fields = _get_dict_fields(type(self))
         if keys:
-            obj_dict = {k: v for k, v in obj_dict.items() if k in keys}
-        return obj_dict
+            dict_fields = tuple((name, key) for name, key in dict_fields if key in keys)
+        if not recurse:
+            return {key: getattr(self, name) for name, key in dict_fields}
+        if raw:
+            return {key: _serialize_raw(getattr(self, name)) for name, key in dict_fields}
+        return {key: _serialize(getattr(self, name)) for name, key in dict_fields}
 
     def __rich_repr__(self):
         """Custom output to use when pretty-printed with rich. Compared to default rich behavior for
@@ -272,6 +275,96 @@ class BaseModelCollection(BaseModel, UserList, Generic[T]):  # type: ignore [mis
         return '\n'.join([str(obj) for obj in self.data])
 
 
+def to_dicts(
+    models: Iterable[BaseModel], keys: list[str] | None = None, raw: bool = False
+) -> list[JsonResponse]:
+    """Convert a collection of model objects back to dict format
+
+    Args:
+        models: Model objects to convert
+        keys: Only keep the specified keys (attribute names)
+        raw: Return unconverted nested data as-is instead of copying it
+    """
+    return [model.to_dict(keys=keys, raw=raw) for model in models]
+
+
+def to_json_bytes(models: Iterable[BaseModel], keys: list[str] | None = None) -> bytes:
+    """Serialize a collection of model objects to a JSON array, encoded as UTF-8. Uses
+    `orjson <https://github.com/ijl/orjson>`_ if installed, which is much faster for large
+    collections.
+
+    Example:
+        >>> observations = iNatClient().observations.search(user_id='my_username').all()
+        >>> Path('observations.json').write_bytes(to_json_bytes(observations))
+
+    Args:
+        models: Model objects to serialize
+        keys: Only keep the specified keys (attribute names)
+    """
+    # Dicts are serialized immediately, so there's no need to copy any nested data
+    dicts = to_dicts(models, keys=keys, raw=True)
+    if orjson is not None:
+        # Some models have dicts with non-str keys, e.g. histograms with int keys
+        return orjson.dumps(dicts, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(dicts, default=_json_default, ensure_ascii=False).encode('utf-8')
+
+
+# Attribute names and dict keys to use for serializing each model class
+_DICT_FIELDS: dict[type[BaseModel], tuple[tuple[str, str], ...]] = {}
+
+
+def _get_dict_fields(cls: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    """Get attribute names and their corresponding dict keys to use for serializing a model class.
+    This only needs to be done once per class.
+    """
+    if (dict_fields := _DICT_FIELDS.get(cls)) is None:
+        dict_fields = tuple((a.name, a.name.lstrip('_')) for a in fields(cls) if a.init is True)
+        _DICT_FIELDS[cls] = dict_fields
+    return dict_fields
+
+
+# Types that can be returned as-is when serializing
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), datetime})
+
+
+def _serialize(value):
+    """Convert a model attribute value to dict format, including any nested model objects. Dicts
+    and lists are copied.
+    """
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if value_type is list:
+        return [_serialize(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _serialize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value_type(_serialize(v) for v in value)
+    return value
+
+
+def _serialize_raw(value):
+    """Convert a model attribute value to dict format, returning any data that doesn't contain model
+    objects (like unconverted lazy-loaded data) as-is
+    """
+    if isinstance(value, BaseModel):
+        return value.to_dict(raw=True)
+    if type(value) is list and value and isinstance(value[0], BaseModel):
+        return [_serialize_raw(v) for v in value]
+    return value
+
+
+def _json_default(value):
+    """Serialize values not natively supported by the JSON library"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
 def load_json(value: ResponseOrFile) -> ResponseOrResults:
     """Load a JSON string, file path, or file-like object"""
     if not value:
@@ -1,7 +1,5 @@
 from io import BytesIO
-from typing import BinaryIO
-
-import requests
+from typing import TYPE_CHECKING, BinaryIO
 
 from pyinaturalist.constants import (
     ALL_LICENSES,
@@ -18,6 +16,9 @@ from pyinaturalist.constants import (
 from pyinaturalist.converters import format_dimensions, format_license
 from pyinaturalist.models import BaseModel, datetime_field, define_model, field
 
+if TYPE_CHECKING:
+    from pyinaturalist.client import ClientSession
+
 
 @define_model
 class BaseMedia(BaseModel):
@@ -142,10 +143,20 @@ class Photo(BaseMedia):
             return None
         return self._url_format.format(size=size)
 
-    def open(self, size: str = 'large') -> BinaryIO:
-        """Download the image and return as a file-like object"""
+    def open(self, size: str = 'large', session: 'ClientSession | None' = None) -> BinaryIO:
+        """Download the image and return as a file-like object. Images are cached, so opening the
+        same image again will not download it again. To download many images to local files, see
+        :py:func:`.download_media`.
+
+        Args:
+            size: Image size to download
+            session: Session to use for the request; defaults to a thread-local session
+        """
+        from pyinaturalist.client import get_local_session
+
         url = self.url_size(size) or self.url
-        return BytesIO(requests.get(url, stream=True).raw.read())
+        session = session or get_local_session()
+        return BytesIO(session.request('GET', url, headers={'Accept': '*/*'}).content)
 
     def show(self, size: str = 'large'):
         """Display the image inline in Jupyter notebooks, or with the system's default image viewer.
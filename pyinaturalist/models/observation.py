@@ -554,5 +554,55 @@ class Histogram(BaseModelCollection):
         return ['data']
 
 
+@define_model
+class HistogramMatrix(BaseModel):
+    """:fa:`table-cells` Histograms for multiple taxa or places, combined into a table of counts.
+    Each row contains counts for one taxon or place, and each column contains counts for one bin.
+
+    To convert to a NumPy array or pandas DataFrame, use :py:meth:`.to_array` or
+    :py:meth:`.to_dataframe` (these require ``numpy`` or ``pandas`` to be installed).
+    """
+
+    ids: list[int] = field(factory=list, doc='Taxon or place IDs, one per row')
+    labels: list[DateOrInt] = field(factory=list, doc='Bin labels, one per column')
+    counts: list[list[int]] = field(factory=list, doc='Observation counts, as a list of rows')
+    id_field: str = field(default=None, doc="ID type; either 'taxon_id' or 'place_id'")
+    interval: str = field(default=None, doc=f'Histogram interval; one of: {HISTOGRAM_INTERVALS}')
+
+    @classmethod
+    def from_histograms(
+        cls, histograms: dict[int, Histogram], id_field: str | None = None
+    ) -> 'HistogramMatrix':
+        """Combine histograms for multiple IDs. Bins missing from any histogram have a count of 0."""
+        raw_histograms = {id: hist.raw for id, hist in histograms.items()}
+        labels = sorted({label for raw in raw_histograms.values() for label in raw})
+        interval = next((bin.interval for hist in histograms.values() for bin in hist), None)
+        return cls(  # type: ignore [call-arg]
+            ids=list(raw_histograms),
+            labels=labels,
+            counts=[[raw.get(label, 0) for label in labels] for raw in raw_histograms.values()],
+            id_field=id_field,
+            interval=interval,
+        )
+
+    def to_array(self):
+        """Get counts as a 2-D NumPy array, with one row per ID"""
+        import numpy as np
+
+        return np.array(self.counts, dtype=np.int64).reshape(len(self.ids), len(self.labels))
+
+    def to_dataframe(self):
+        """Get counts as a pandas DataFrame, indexed by ID, with one column per bin"""
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.counts, index=pd.Index(self.ids, name=self.id_field), columns=self.labels
+        )
+
+    @property
+    def _str_attrs(self) -> list[str]:
+        return ['id_field', 'interval', 'ids']
+
+
 # Fix __init__ and class docstring
 Observation = extend_init_signature(Observation.__attrs_init__)(Observation)  # type: ignore
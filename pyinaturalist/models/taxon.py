@@ -376,6 +376,8 @@ class TaxonCount(Taxon):
     @classmethod
     def from_json(cls, value: JsonResponse, user_id: int | None = None, **kwargs) -> 'TaxonCount':
         """Flatten out count + taxon fields into a single-level dict before initializing"""
+        if isinstance(value, cls):
+            return value
         if 'taxon' in value:
             value = value.copy()
             value.update(value.pop('taxon'))
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from copy import copy
 from datetime import datetime
 
 from pyinaturalist.constants import INAT_BASE_URL, JsonResponse, TableRow
@@ -95,6 +97,8 @@ class UserCount(User):
     @classmethod
     def from_json(cls, value: JsonResponse, **kwargs) -> 'UserCount':
         """Flatten out count + user fields into a single-level dict before initializing"""
+        if isinstance(value, cls):
+            return value
         if 'results' in value:
             value = value['results']
         if 'user' in value:
@@ -122,3 +126,25 @@ class UserCounts(BaseModelCollection):
     """:fa:`user` :fa:`list` A collection of users with an associated counts"""
 
     data: list[UserCount] = field(factory=list, converter=UserCount.from_json_list)
+
+    @classmethod
+    def merge(cls, collections: Iterable['UserCounts']) -> 'UserCounts':
+        """Combine counts for the same users from multiple collections, for example from queries
+        for non-overlapping sets of observations. Results are sorted by count, in descending order.
+
+        Observation and ID counts are added together. Species counts can't be combined this way,
+        since the same species may be counted in more than one collection, so the highest species
+        count is used instead (a lower bound for the actual value).
+        """
+        merged: dict[int, UserCount] = {}
+        for collection in collections:
+            for user in collection:
+                if (existing := merged.get(user.id)) is None:
+                    merged[user.id] = copy(user)
+                else:
+                    existing.count += user.count
+                    existing.observation_count += user.observation_count
+                    existing.species_count = max(existing.species_count, user.species_count)
+
+        users = sorted(merged.values(), key=lambda user: user.count, reverse=True)
+        return cls(data=users)  # type: ignore [call-arg]
@@ -7,8 +7,10 @@ params.
 """
 
 import re
+import threading
 from collections.abc import Callable, Iterable, Mapping
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from inspect import signature
 from logging import getLogger
 from typing import Any
@@ -68,6 +70,12 @@ MULTIPLE_CHOICE_ERROR_MSG = (
 
 MAX_URL_LENGTH = 2048  # Depends on server and browser. This is is on the lower end.
 
+# Params that change between pages of a paginated query; everything else is preprocessed once
+CURSOR_PARAMS = ['page', 'id_above', 'id_below']
+PARAMS_CACHE_SIZE = 256
+_params_cache: dict[tuple, RequestParams] = {}
+_params_cache_lock = threading.Lock()
+
 logger = getLogger(__name__)
 
 
@@ -77,19 +85,65 @@ def preprocess_request_body(body: RequestParams | None) -> RequestParams | None:
         return None
     for resource in ['project', 'observation']:
         if resource in body:
-            body[resource] = preprocess_request_params(body[resource], convert_lists=False)
+            body[resource] = _preprocess_request_params(body[resource], convert_lists=False)
     else:
-        body = preprocess_request_params(body, convert_lists=False)
+        body = _preprocess_request_params(body, convert_lists=False)
     return body
 
 
 def preprocess_request_params(
     params: RequestParams | None, convert_lists: bool = True
 ) -> RequestParams:
-    """Perform type conversions, sanity checks, etc. on request parameters"""
+    """Perform type conversions, sanity checks, etc. on request parameters.
+
+    Paginated queries send the same params for every page except for the page cursor, so results
+    for all other params are cached, and only the cursor params are processed for each request.
+    Only results containing immutable values are cached, so callers can't modify cached results.
+    """
     if not params:
         return {}
 
+    static_params = {k: v for k, v in params.items() if k not in CURSOR_PARAMS}
+    cursor_params = {k: v for k, v in params.items() if k in CURSOR_PARAMS}
+    try:
+        cache_key = (_freeze(static_params), convert_lists)
+        hash(cache_key)
+    # Params with unhashable values (e.g., file objects) aren't cached
+    except TypeError:
+        return _preprocess_request_params(params, convert_lists)
+
+    with _params_cache_lock:
+        static_result = _params_cache.get(cache_key)
+    if static_result is None:
+        static_result = _preprocess_request_params(static_params, convert_lists)
+        if _is_immutable(static_result):
+            with _params_cache_lock:
+                if len(_params_cache) >= PARAMS_CACHE_SIZE:
+                    _params_cache.clear()
+                _params_cache[cache_key] = static_result
+    if not cursor_params:
+        return dict(static_result)
+    return {**static_result, **_preprocess_request_params(cursor_params, convert_lists)}
+
+
+def _freeze(value: Any) -> Any:
+    """Convert request params into a hashable form that can be used as a cache key. Types are
+    included, since values of different types may compare as equal (e.g., ``True == 1``) but be
+    converted differently.
+    """
+    if isinstance(value, Mapping):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _is_immutable(params: RequestParams) -> bool:
+    """Check if processed params only contain immutable values, so they can be safely cached"""
+    return all(isinstance(v, (str, int, float, type(None))) for v in params.values())
+
+
+def _preprocess_request_params(params: RequestParams, convert_lists: bool = True) -> RequestParams:
     params = normalize_rank_params(params)
     params = validate_multiple_choice_params(params)
     params = convert_pagination_params(params)
@@ -158,6 +212,29 @@ def convert_datetime_params(params: RequestParams) -> RequestParams:
     return params
 
 
+def convert_fields_param(fields: str | Iterable[str] | Mapping | None) -> str | dict | None:
+    """Translate a v2 ``fields`` selection into the nested format accepted by the API.
+    Accepts ``'all'``, a nested dict, or field names as a list or comma-separated string, using
+    dot notation for nested fields. For example: ``['id', 'taxon.id', 'taxon.name']`` ->
+    ``{'id': True, 'taxon': {'id': True, 'name': True}}``
+    """
+    if not fields or fields == 'all' or isinstance(fields, Mapping):
+        return fields  # type: ignore [return-value]
+
+    field_tree: dict = {}
+    for path in ensure_list(fields, split_str_list=True):
+        *parents, leaf = path.split('.')
+        node = field_tree
+        for key in parents:
+            # A parent previously selected as a whole field takes precedence over subfields
+            if node.get(key) is True:
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[leaf] = True
+    return field_tree
+
+
 def convert_list_params(params: RequestParams) -> RequestParams:
     """Convert any list parameters into an API-compatible (comma-delimited) string.
     Will be url-encoded by requests. For example: `['k1', 'k2', 'k3'] -> k1%2Ck2%2Ck3`
@@ -311,10 +388,18 @@ def get_interval_ranges(
 
 def get_valid_kwargs(func: Callable, kwargs: dict) -> dict:
     """Get the subset of non-None ``kwargs`` that are valid params for ``func``"""
-    sig_params = list(signature(func).parameters)
+    sig_params = _get_param_names(getattr(func, '__func__', func))
     return {k: v for k, v in kwargs.items() if k in sig_params and v is not None}
 
 
+@lru_cache(maxsize=512)
+def _get_param_names(func: Callable) -> frozenset[str]:
+    """Get parameter names from a function signature. Since this is called for every request
+    sent by :py:class:`.iNatClient`, signatures are only inspected once per function.
+    """
+    return frozenset(signature(func).parameters)
+
+
 def split_common_params(params: RequestParams) -> tuple[RequestParams, RequestParams]:
     """Split out common keyword args (for pyinaturalist functions) from request params (for API)"""
     kwargs = {k: params.pop(k, None) for k in COMMON_PARAMS}
@@ -0,0 +1,244 @@
+"""A local spatial index for searching and aggregating observations (or any other located models)
+that have already been fetched from the API
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from math import asin, cos, degrees, floor, radians, sin, sqrt
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pyinaturalist.client.tiling import BoundingBox
+from pyinaturalist.constants import SPATIAL_CELL_SIZE, GeoJson
+
+if TYPE_CHECKING:
+    from pyinaturalist.models import Place
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.195  # Distance per degree of latitude
+
+Cell = tuple[int, int]
+Ring = Sequence[Sequence[float]]
+I = TypeVar('I')  # noqa: E741
+
+
+class SpatialIndex(Generic[I]):
+    """An in-memory spatial index of points, for fast location queries on results that have already
+    been fetched. Points are grouped into grid cells of ``cell_size`` degrees, so each query only
+    needs to check points in the cells that overlap it.
+
+    This can be built from any models with a ``location`` attribute, like :py:class:`.Observations`,
+    :py:class:`.Place` or :py:class:`.Project` objects. Items without a location are skipped.
+
+    Example:
+        >>> observations = client.observations.search(place_id=1, taxon_id=47219).all()
+        >>> index = SpatialIndex(observations)
+        >>> nearby = index.within_radius(37.77, -122.42, radius_km=10)
+        >>> in_park = index.within_place(client.places(53962))
+
+    Query results are returned in the same order as the original items.
+
+    Args:
+        items: Models to index
+        cell_size: Size of grid cells, in degrees
+    """
+
+    def __init__(self, items: Iterable[I] = (), cell_size: float = SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.items: list[I] = []
+        self.lats: list[float] = []
+        self.lngs: list[float] = []
+        self._cells: dict[Cell, list[int]] = defaultdict(list)
+        for item in items:
+            if location := getattr(item, 'location', None):
+                self.add(location[0], location[1], item)
+
+    @classmethod
+    def from_coordinates(
+        cls,
+        lats: Iterable[float],
+        lngs: Iterable[float],
+        items: Iterable[Any] | None = None,
+        cell_size: float = SPATIAL_CELL_SIZE,
+    ) -> 'SpatialIndex':
+        """Create an index from separate sequences of latitudes and longitudes, for example columns
+        from a table. If ``items`` are not provided, query results will be row indices.
+        """
+        lats, lngs = list(lats), list(lngs)
+        if len(lats) != len(lngs):
+            raise ValueError('Latitudes and longitudes must have the same length')
+
+        index: SpatialIndex = cls(cell_size=cell_size)
+        items = range(len(lats)) if items is None else items
+        for lat, lng, item in zip(lats, lngs, items, strict=True):
+            index.add(lat, lng, item)
+        return index
+
+    def add(self, lat: float, lng: float, item: I):
+        """Add a single item to the index"""
+        self._cells[self._get_cell(lat, lng)].append(len(self.items))
+        self.items.append(item)
+        self.lats.append(lat)
+        self.lngs.append(lng)
+
+    def within_bbox(self, bbox: BoundingBox | Sequence[float]) -> list[I]:
+        """Get items within a bounding box (including its edges)
+
+        Args:
+            bbox: A :py:class:`.BoundingBox`, or ``(swlat, swlng, nelat, nelng)`` coordinates
+        """
+        bbox = BoundingBox(*bbox)
+        return self._get_items(
+            i for i in self._query_bbox(bbox) if bbox.contains(self.lats[i], self.lngs[i])
+        )
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> list[I]:
+        """Get items within a distance of a point, using great-circle distance
+
+        Args:
+            lat: Latitude of the center point
+            lng: Longitude of the center point
+            radius_km: Search radius, in kilometers
+        """
+        bbox = _radius_bbox(lat, lng, radius_km)
+        return self._get_items(
+            i
+            for i in self._query_bbox(bbox)
+            if haversine_distance(lat, lng, self.lats[i], self.lngs[i]) <= radius_km
+        )
+
+    def within_polygon(self, geometry: GeoJson) -> list[I]:
+        """Get items within a GeoJSON ``Polygon`` or ``MultiPolygon`` (or a ``Feature`` containing
+        one). Polygons may contain holes.
+        """
+        return self._get_items(
+            i
+            for polygon in _get_polygons(geometry)
+            for i in self._query_bbox(_polygon_bbox(polygon))
+            if _polygon_contains(polygon, self.lats[i], self.lngs[i])
+        )
+
+    def within_place(self, place: 'Place') -> list[I]:
+        """Get items within a place boundary. If the place doesn't have a boundary polygon, its
+        bounding box will be used instead.
+        """
+        geometry = place.geometry_geojson or place.bounding_box_geojson
+        if not geometry:
+            raise ValueError(f'Place {place.id} does not have a boundary')
+        return self.within_polygon(geometry)
+
+    def grid_counts(self, cell_size: float | None = None) -> dict[BoundingBox, int]:
+        """Count items in each cell of a grid, for example to make a heatmap. Cells without any
+        items are not included.
+
+        Args:
+            cell_size: Size of grid cells, in degrees; defaults to the index's cell size
+        """
+        if cell_size is None or cell_size == self.cell_size:
+            cell_counts = {cell: len(idxs) for cell, idxs in self._cells.items()}
+            cell_size = self.cell_size
+        else:
+            cell_counts = defaultdict(int)
+            for lat, lng in zip(self.lats, self.lngs, strict=True):
+                cell_counts[(floor(lat / cell_size), floor(lng / cell_size))] += 1
+
+        return {
+            BoundingBox(
+                row * cell_size,
+                col * cell_size,
+                (row + 1) * cell_size,
+                (col + 1) * cell_size,
+            ): count
+            for (row, col), count in sorted(cell_counts.items())
+        }
+
+    def _get_cell(self, lat: float, lng: float) -> Cell:
+        return floor(lat / self.cell_size), floor(lng / self.cell_size)
+
+    def _query_bbox(self, bbox: BoundingBox) -> Iterator[int]:
+        """Get indices of all items in cells that overlap a bounding box"""
+        min_row, max_row = floor(bbox.swlat / self.cell_size), floor(bbox.nelat / self.cell_size)
+        for swlng, nelng in _lng_ranges(bbox):
+            min_col, max_col = floor(swlng / self.cell_size), floor(nelng / self.cell_size)
+
+            # For large query areas, checking occupied cells is faster than checking every cell
+            n_query_cells = (max_row - min_row + 1) * (max_col - min_col + 1)
+            if n_query_cells > len(self._cells):
+                for (row, col), idxs in self._cells.items():
+                    if min_row <= row <= max_row and min_col <= col <= max_col:
+                        yield from idxs
+            else:
+                for row in range(min_row, max_row + 1):
+                    for col in range(min_col, max_col + 1):
+                        yield from self._cells.get((row, col), ())
+
+    def _get_items(self, idxs: Iterable[int]) -> list[I]:
+        return [self.items[i] for i in sorted(set(idxs))]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __str__(self) -> str:
+        return (
+            f'SpatialIndex(items={len(self)}, cells={len(self._cells)}, cell_size={self.cell_size})'
+        )
+
+
+def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Get the great-circle distance between two points, in kilometers"""
+    lat1, lng1, lat2, lng2 = map(radians, (lat1, lng1, lat2, lng2))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def _lng_ranges(bbox: BoundingBox) -> list[tuple[float, float]]:
+    """Split a bounding box that crosses the antimeridian into two longitude ranges"""
+    if bbox.swlng <= bbox.nelng:
+        return [(bbox.swlng, bbox.nelng)]
+    return [(bbox.swlng, 180), (-180, bbox.nelng)]
+
+
+def _radius_bbox(lat: float, lng: float, radius_km: float) -> BoundingBox:
+    """Get a bounding box that contains a circle around a point"""
+    d_lat = radius_km / KM_PER_DEGREE
+    swlat, nelat = max(lat - d_lat, -90), min(lat + d_lat, 90)
+    # Near the poles (or for very large circles), a circle may include all longitudes
+    sin_d_lng = sin(radius_km / EARTH_RADIUS_KM) / cos(radians(lat)) if abs(lat) < 90 else 2
+    if swlat == -90 or nelat == 90 or radius_km >= EARTH_RADIUS_KM or sin_d_lng >= 1:
+        return BoundingBox(swlat, -180, nelat, 180)
+
+    d_lng = degrees(asin(sin_d_lng))
+    swlng, nelng = lng - d_lng, lng + d_lng
+    swlng = swlng + 360 if swlng < -180 else swlng
+    nelng = nelng - 360 if nelng > 180 else nelng
+    return BoundingBox(swlat, swlng, nelat, nelng)
+
+
+def _get_polygons(geometry: GeoJson) -> list[list[Ring]]:
+    """Get a list of polygons (each a list of rings) from a GeoJSON geometry"""
+    if geometry.get('type') == 'Feature':
+        geometry = geometry.get('geometry') or {}
+    if geometry.get('type') == 'Polygon':
+        return [geometry['coordinates']]
+    elif geometry.get('type') == 'MultiPolygon':
+        return geometry['coordinates']
+    raise ValueError(f'Unsupported geometry type: {geometry.get("type")}')
+
+
+def _polygon_bbox(polygon: list[Ring]) -> BoundingBox:
+    lngs = [point[0] for point in polygon[0]]
+    lats = [point[1] for point in polygon[0]]
+    return BoundingBox(min(lats), min(lngs), max(lats), max(lngs))
+
+
+def _polygon_contains(polygon: list[Ring], lat: float, lng: float) -> bool:
+    """Check if a point is inside a polygon using ray casting. With the even-odd rule, points inside
+    holes are counted as outside.
+    """
+    inside = False
+    for ring in polygon:
+        # Rings should be closed (first point == last point), but don't assume so
+        ring = list(ring)
+        for (x1, y1, *_), (x2, y2, *_) in zip(ring, ring[1:] + ring[:1], strict=True):
+            if (y1 > lat) != (y2 > lat) and lng < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+    return inside
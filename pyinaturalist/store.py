@@ -0,0 +1,454 @@
+"""A local SQLite database of observations, which can be kept in sync with API search results. See
+:py:meth:`.ObservationController.sync` for usage details.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from hashlib import sha256
+from logging import getLogger
+from pathlib import Path
+
+from attr import fields
+
+from pyinaturalist.constants import STORE_FILE, JsonResponse, PathOrStr, RequestParams
+from pyinaturalist.converters import try_datetime
+from pyinaturalist.models import Observation, to_json_bytes
+from pyinaturalist.request_params import COMMON_PARAMS
+
+# Request params that don't affect which observations match a query
+IGNORED_QUERY_PARAMS = {
+    *COMMON_PARAMS,
+    'id_above',
+    'id_below',
+    'order',
+    'order_by',
+    'page',
+    'per_page',
+    'updated_since',
+}
+# Maximum number of query parameters (for IDs) in a single SQL statement
+SQL_BATCH_SIZE = 500
+
+# Observation attributes stored in their own columns, for filtering local searches. Column types
+# are based on model field types.
+OBSERVATION_COLUMNS = [
+    'captive',
+    'created_at',
+    'geoprivacy',
+    'license_code',
+    'observed_on',
+    'quality_grade',
+    'updated_at',
+]
+# Additional columns for attributes of nested objects
+NESTED_COLUMNS = {
+    'taxon_id': 'INTEGER',
+    'user_id': 'INTEGER',
+    'user_login': 'TEXT',
+    'latitude': 'REAL',
+    'longitude': 'REAL',
+}
+INDEXED_COLUMNS = ['created_at', 'observed_on', 'quality_grade', 'taxon_id', 'user_id']
+SQL_TYPES = {bool: 'INTEGER', int: 'INTEGER', float: 'REAL'}  # Anything else is stored as TEXT
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    {columns},
+    data TEXT NOT NULL
+);
+{indexes}
+CREATE TABLE IF NOT EXISTS observation_places (
+    place_id INTEGER NOT NULL,
+    observation_id INTEGER NOT NULL,
+    PRIMARY KEY (place_id, observation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_observation_places_id ON observation_places (observation_id);
+CREATE TABLE IF NOT EXISTS observation_taxa (
+    taxon_id INTEGER NOT NULL,
+    observation_id INTEGER NOT NULL,
+    PRIMARY KEY (taxon_id, observation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_observation_taxa_id ON observation_taxa (observation_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    query_key TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    updated_since TEXT,
+    max_id INTEGER,
+    last_synced TEXT,
+    last_reconciled TEXT
+);
+CREATE TABLE IF NOT EXISTS query_observations (
+    query_key TEXT NOT NULL,
+    observation_id INTEGER NOT NULL,
+    PRIMARY KEY (query_key, observation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_query_observations_id ON query_observations (observation_id);
+"""
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class SyncState:
+    """High-water mark for a synced query, used to only fetch changes on the next sync"""
+
+    query_key: str  #: Unique key for the query parameters
+    params: RequestParams  #: Original query parameters
+    updated_since: datetime | None = None  #: Latest ``updated_at`` value of any synced observation
+    max_id: int | None = None  #: Highest observation ID synced
+    last_synced: datetime | None = None  #: Time of the last sync
+    last_reconciled: datetime | None = None  #: Time of the last full ID reconciliation
+
+
+@dataclass
+class SyncResult:
+    """Summary of changes made by a single sync"""
+
+    query_key: str  #: Unique key for the query parameters
+    new: int = 0  #: Number of observations added
+    updated: int = 0  #: Number of existing observations that were modified
+    deleted: int = 0  #: Number of observations removed (deleted, or no longer matching the query)
+    reconciled: bool = False  #: Whether a full ID reconciliation was done
+
+    @property
+    def summary(self) -> str:
+        return f'{self.new} new, {self.updated} updated, {self.deleted} deleted'
+
+
+class ObservationStore:
+    """A local SQLite database of observations, keyed by ID. Observations are stored as JSON, and
+    loaded as :py:class:`.Observation` objects.
+
+    Selected observation attributes (see ``OBSERVATION_COLUMNS`` and ``NESTED_COLUMNS``) are also
+    stored in separate, indexed columns, along with place IDs and taxon ancestor IDs. This allows
+    searching stored observations without loading all of them; see
+    :py:class:`.LocalObservationController` for details.
+
+    The store also keeps track of which observations belong to which synced queries, and the
+    high-water mark (:py:class:`.SyncState`) for each query.
+
+    Example:
+        >>> with ObservationStore('~/observations.db') as store:
+        ...     client.observations.sync(store, place_id=7953, taxon_id=47224)
+        ...     observations = store.all()
+
+    Args:
+        path: Path to the SQLite database file
+    """
+
+    def __init__(self, path: PathOrStr = STORE_FILE):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_get_schema())
+
+    def upsert(
+        self, observations: Iterable[Observation], query_key: str | None = None
+    ) -> tuple[int, int]:
+        """Insert new observations, and replace existing ones if they have been updated
+
+        Args:
+            observations: Observations to save
+            query_key: Record the observations as belonging to this synced query
+
+        Returns:
+            Number of observations inserted, and number updated
+        """
+        obs_by_id = {obs.id: obs for obs in observations}
+        if not obs_by_id:
+            return 0, 0
+
+        with self._lock, self._conn:
+            existing = dict(self._select_by_ids('SELECT id, updated_at', obs_by_id))
+            changed = [
+                obs
+                for obs in obs_by_id.values()
+                if obs.id not in existing or existing[obs.id] != _isoformat(obs.updated_at)
+            ]
+            records = json.loads(to_json_bytes(changed)) if changed else []
+            rows = [
+                (*_get_column_values(obs), json.dumps(record))
+                for obs, record in zip(changed, records, strict=True)
+            ]
+            columns = ['id', *OBSERVATION_COLUMNS, *NESTED_COLUMNS, 'data']
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO observations ({",".join(columns)}) '
+                f'VALUES ({",".join("?" * len(columns))})',
+                rows,
+            )
+
+            # Replace place and taxon lookup tables for changed observations
+            changed_ids = [obs.id for obs in changed]
+            self._delete_by_ids('observation_places', changed_ids)
+            self._delete_by_ids('observation_taxa', changed_ids)
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO observation_places VALUES (?, ?)',
+                [(place_id, obs.id) for obs in changed for place_id in obs.place_ids or []],
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO observation_taxa VALUES (?, ?)',
+                [(taxon_id, obs.id) for obs in changed for taxon_id in _get_taxon_ids(obs)],
+            )
+            if query_key:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO query_observations VALUES (?, ?)',
+                    [(query_key, id) for id in obs_by_id],
+                )
+
+        n_inserted = len(obs_by_id) - len(existing)
+        return n_inserted, len(changed) - n_inserted
+
+    def get(self, observation_id: int) -> Observation | None:
+        """Get a single observation by ID"""
+        results = self.get_many([observation_id])
+        return results[0] if results else None
+
+    def get_many(self, observation_ids: Iterable[int]) -> list[Observation]:
+        """Get observations by ID. IDs not in the store are skipped."""
+        with self._lock:
+            rows = self._select_by_ids('SELECT data', observation_ids)
+        return [Observation.from_json(json.loads(row[0])) for row in rows]
+
+    def all(self, query_key: str | None = None) -> list[Observation]:
+        """Get all observations, optionally only for a single synced query"""
+        return list(self.iter(query_key))
+
+    def iter(self, query_key: str | None = None) -> Iterator[Observation]:
+        """Iterate over all observations, optionally only for a single synced query"""
+        if query_key:
+            sql = (
+                'SELECT data FROM observations JOIN query_observations ON id = observation_id '
+                'WHERE query_key = ? ORDER BY id'
+            )
+            rows = self._conn.execute(sql, (query_key,))
+        else:
+            rows = self._conn.execute('SELECT data FROM observations ORDER BY id')
+        for row in rows:
+            yield Observation.from_json(json.loads(row[0]))
+
+    def ids(self, query_key: str | None = None) -> set[int]:
+        """Get the IDs of all observations, optionally only for a single synced query"""
+        with self._lock:
+            if query_key:
+                sql = 'SELECT observation_id FROM query_observations WHERE query_key = ?'
+                rows = self._conn.execute(sql, (query_key,)).fetchall()
+            else:
+                rows = self._conn.execute('SELECT id FROM observations').fetchall()
+        return {row[0] for row in rows}
+
+    def delete(self, observation_ids: Iterable[int]) -> int:
+        """Delete observations by ID
+
+        Returns:
+            Number of observations deleted
+        """
+        observation_ids = list(observation_ids)
+        with self._lock, self._conn:
+            for table in ['observation_places', 'observation_taxa', 'query_observations']:
+                self._delete_by_ids(table, observation_ids)
+            return self._delete_by_ids('observations', observation_ids, id_column='id')
+
+    def remove_from_query(self, query_key: str, observation_ids: Iterable[int]) -> int:
+        """Remove observations from a synced query. Any that don't belong to another synced query
+        are deleted.
+
+        Returns:
+            Number of observations removed
+        """
+        observation_ids = list(observation_ids)
+        with self._lock, self._conn:
+            for batch in _chunkify(observation_ids):
+                placeholders = ','.join('?' * len(batch))
+                self._conn.execute(
+                    'DELETE FROM query_observations '
+                    f'WHERE query_key = ? AND observation_id IN ({placeholders})',
+                    [query_key, *batch],
+                )
+            orphaned = [
+                id
+                for id in observation_ids
+                if not self._conn.execute(
+                    'SELECT 1 FROM query_observations WHERE observation_id = ?', (id,)
+                ).fetchone()
+            ]
+            self.delete(orphaned)
+        return len(observation_ids)
+
+    def get_sync_state(self, query_key: str) -> SyncState | None:
+        """Get the high-water mark for a synced query, if it has been synced before"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT query_key, params, updated_since, max_id, last_synced, last_reconciled '
+                'FROM sync_state WHERE query_key = ?',
+                (query_key,),
+            ).fetchone()
+        if not row:
+            return None
+        return SyncState(
+            query_key=row[0],
+            params=json.loads(row[1]),
+            updated_since=try_datetime(row[2]),
+            max_id=row[3],
+            last_synced=try_datetime(row[4]),
+            last_reconciled=try_datetime(row[5]),
+        )
+
+    def save_sync_state(self, state: SyncState):
+        """Save the high-water mark for a synced query"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    state.query_key,
+                    json.dumps(state.params, default=str),
+                    _isoformat(state.updated_since),
+                    state.max_id,
+                    _isoformat(state.last_synced),
+                    _isoformat(state.last_reconciled),
+                ),
+            )
+
+    def search(
+        self,
+        where: str = '',
+        args: Iterable = (),
+        order: str = 'asc',
+        limit: int | None = None,
+    ) -> list[JsonResponse]:
+        """Search stored observations with a SQL ``WHERE`` clause, and return them as JSON.
+        Results are sorted by ID.
+
+        Args:
+            where: SQL filter conditions (without ``WHERE``), using any indexed columns and tables
+            args: Values for any ``?`` placeholders in ``where``
+            order: Sort order for IDs (``'asc'`` or ``'desc'``)
+            limit: Maximum number of results to return
+        """
+        direction = 'DESC' if order.lower() == 'desc' else 'ASC'
+        sql = f'SELECT data FROM observations {_where(where)} ORDER BY id {direction}'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        with self._lock:
+            rows = self._conn.execute(sql, list(args)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, where: str = '', args: Iterable = ()) -> int:
+        """Count stored observations matching a SQL ``WHERE`` clause"""
+        sql = f'SELECT COUNT(*) FROM observations {_where(where)}'
+        with self._lock:
+            return self._conn.execute(sql, list(args)).fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    def _delete_by_ids(
+        self, table: str, observation_ids: list[int], id_column: str = 'observation_id'
+    ) -> int:
+        n_deleted = 0
+        for batch in _chunkify(observation_ids):
+            placeholders = ','.join('?' * len(batch))
+            sql = f'DELETE FROM {table} WHERE {id_column} IN ({placeholders})'
+            n_deleted += self._conn.execute(sql, batch).rowcount
+        return n_deleted
+
+    def _select_by_ids(self, select: str, observation_ids: Iterable[int]) -> list[tuple]:
+        rows = []
+        for batch in _chunkify(list(observation_ids)):
+            placeholders = ','.join('?' * len(batch))
+            sql = f'{select} FROM observations WHERE id IN ({placeholders}) ORDER BY id'
+            rows.extend(self._conn.execute(sql, batch).fetchall())
+        return rows
+
+    def __enter__(self) -> 'ObservationStore':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM observations').fetchone()[0]
+
+    def __str__(self) -> str:
+        return f'ObservationStore(path={self.path}, observations={len(self)})'
+
+
+def get_query_key(params: RequestParams) -> str:
+    """Get a unique key for a set of observation search parameters. Parameters that don't affect
+    which observations match (like pagination and request settings) are ignored.
+    """
+    query_params = {
+        k: v for k, v in params.items() if k not in IGNORED_QUERY_PARAMS and v is not None
+    }
+    params_str = json.dumps(query_params, sort_keys=True, default=str)
+    return sha256(params_str.encode()).hexdigest()[:16]
+
+
+def _get_schema() -> str:
+    """Get the SQL schema for the store, with column types based on Observation field types"""
+    field_types = {field.name: field.type for field in fields(Observation)}
+    columns = {name: SQL_TYPES.get(field_types[name], 'TEXT') for name in OBSERVATION_COLUMNS}
+    columns.update(NESTED_COLUMNS)
+    indexes = [
+        f'CREATE INDEX IF NOT EXISTS idx_observations_{name} ON observations ({name});'
+        for name in INDEXED_COLUMNS
+    ]
+    return SCHEMA.format(
+        columns=',\n    '.join(f'{name} {sql_type}' for name, sql_type in columns.items()),
+        indexes='\n'.join(indexes),
+    )
+
+
+def _get_column_values(obs: Observation) -> list:
+    """Get values for an observation's ID and indexed columns. Timestamps are stored as UTC
+    ISO 8601 strings, and ``observed_on`` as a local date.
+    """
+    values: list = [obs.id]
+    for name in OBSERVATION_COLUMNS:
+        value = getattr(obs, name)
+        if name == 'observed_on':
+            value = value.date().isoformat() if value else None
+        elif isinstance(value, datetime):
+            value = _isoformat(value)
+        values.append(value)
+
+    taxon, user, location = obs.taxon, obs.user, obs.location
+    values += [
+        taxon.id if taxon else None,
+        user.id if user else None,
+        user.login if user else None,
+        location[0] if location else None,
+        location[1] if location else None,
+    ]
+    return values
+
+
+def _get_taxon_ids(obs: Observation) -> set[int]:
+    """Get an observation's taxon ID and all its ancestor IDs"""
+    if not obs.taxon:
+        return set()
+    return {*(obs.taxon.ancestor_ids or []), obs.taxon.id}
+
+
+def _chunkify(ids: list[int]) -> Iterator[list[int]]:
+    for i in range(0, len(ids), SQL_BATCH_SIZE):
+        yield ids[i : i + SQL_BATCH_SIZE]
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Format a datetime as an ISO 8601 string in UTC, so values can be compared as strings"""
+    if not value:
+        return None
+    if value.tzinfo:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+def _where(where: str) -> str:
+    return f'WHERE {where}' if where else ''
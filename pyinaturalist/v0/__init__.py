@@ -9,6 +9,7 @@ from pyinaturalist.v0.observations import (
     create_observation,
     delete_observation,
     get_observations,
+    iter_observations,
     update_observation,
     upload_photos,
     upload_sounds,
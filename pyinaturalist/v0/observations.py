@@ -1,12 +1,25 @@
+from collections.abc import Iterator
 from logging import getLogger
-
-from pyinaturalist.client import delete, get, post, put
+from xml.etree.ElementTree import Element
+
+from pyinaturalist.client import (
+    delete,
+    get,
+    iter_csv_rows,
+    iter_json_results,
+    iter_xml_elements,
+    post,
+    put,
+)
 from pyinaturalist.constants import (
     API_V0,
     OBSERVATION_FORMATS,
+    OBSERVATION_RECORD_TAGS,
+    PER_PAGE_RESULTS,
     V0_OBS_ORDER_BY_PROPERTIES,
     ListResponse,
     MultiFile,
+    ResponseResult,
 )
 from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps, ensure_list
 from pyinaturalist.docs import document_request_params
@@ -77,6 +90,7 @@ def get_observations(**params) -> list | str:
 
     Returns:
         Return type will be ``dict`` for the ``json`` response format, and ``str`` for all others.
+        For large exports, use :py:func:`iter_observations` instead to parse records incrementally.
     """
     response_format = params.pop('response_format', 'json')
     if response_format not in OBSERVATION_FORMATS:
@@ -93,6 +107,83 @@ def get_observations(**params) -> list | str:
         return response.text
 
 
+@document_request_params(
+    docs._observation_common,
+    docs._observation_v0,
+    docs._bounding_box,
+)
+def iter_observations(
+    response_format: str = 'csv', limit: int | None = None, **params
+) -> Iterator[ResponseResult | Element]:
+    """Get observation data in an export format, and iterate over all pages of results. Each page
+    is streamed and parsed incrementally, so records are yielded as soon as they're downloaded, and
+    memory usage stays constant regardless of the total number of results.
+
+    .. rubric:: Notes
+
+    * API reference: :v0:`GET /observations <get-observations>`
+    * Records are returned as:
+
+      * ``csv``: A dict for each row
+      * ``json``: A dict for each observation, with the same conversions as
+        :py:func:`get_observations`
+      * ``atom``, ``dwc``, and ``kml``: An :py:class:`~xml.etree.ElementTree.Element` for each
+        ``<entry>``, ``<dwr:SimpleDarwinRecord>`` (or ``<dwc:Occurrence>``), or ``<Placemark>``
+        element, respectively
+
+    Examples:
+        Get all observations in a project as CSV rows:
+
+        >>> for row in iter_observations(project_id=36883, response_format='csv'):
+        ...     print(row['id'], row['scientific_name'])
+
+        Get Darwin Core records:
+
+        >>> from pyinaturalist.constants import DWC_NAMESPACE
+        >>> for record in iter_observations(project_id=36883, response_format='dwc'):
+        ...     print(record.findtext(f'{{{DWC_NAMESPACE}}}scientificName'))
+
+    Args:
+        response_format: Any format supported by :py:func:`get_observations`, except ``widget``
+        limit: Maximum number of records to return
+    """
+    if response_format not in OBSERVATION_FORMATS or response_format == 'widget':
+        raise ValueError('Invalid response format')
+    validate_multiple_choice_param(params, 'order_by', V0_OBS_ORDER_BY_PROPERTIES)
+    params.setdefault('per_page', PER_PAGE_RESULTS)
+    page = int(params.pop('page', None) or 1)
+    n_results = 0
+
+    while True:
+        response = get(f'{API_V0}/observations.{response_format}', page=page, stream=True, **params)
+        total_results = int(response.headers.get('X-Total-Entries') or 0)
+        n_page_results = 0
+        for record in _iter_records(response, response_format):
+            yield record
+            n_page_results += 1
+            n_results += 1
+            if limit and n_results >= limit:
+                response.close()
+                return
+
+        if n_page_results < int(params['per_page']) or (
+            total_results and n_results >= total_results
+        ):
+            return
+        page += 1
+
+
+def _iter_records(response, response_format: str) -> Iterator[ResponseResult | Element]:
+    """Iterate over records in a streamed response of any v0 export format"""
+    if response_format == 'csv':
+        yield from iter_csv_rows(response)
+    elif response_format == 'json':
+        for record in iter_json_results(response):
+            yield convert_all_timestamps(convert_all_coordinates([record]))[0]
+    else:
+        yield from iter_xml_elements(response, OBSERVATION_RECORD_TAGS[response_format])
+
+
 @document_request_params(docs._access_token, docs._create_observation)
 def create_observation(**params) -> ListResponse:
     """Create a new observation
@@ -312,7 +312,9 @@ def get_observation_species_counts(**params) -> JsonResponse:
         Response dict containing taxon records with counts
     """
     if params.get('page') == 'all':
-        return paginate_all(get, f'{API_V1}/observations/species_counts', **params)
+        return paginate_all(
+            get, f'{API_V1}/observations/species_counts', method='concurrent', **params
+        )
     else:
         return get(f'{API_V1}/observations/species_counts', **params).json()
 
@@ -6,11 +6,14 @@ See: http://api.inaturalist.org/v2/docs/
 # ruff: noqa: F401, F403
 from pyinaturalist.v2.observations import (
     create_observation,
+    create_observations,
     delete_observation,
     get_observations,
     set_observation_field,
     update_observation,
+    update_observations,
     upload,
+    upload_bulk,
 )
 from pyinaturalist.v2.taxa import (
     get_taxa,
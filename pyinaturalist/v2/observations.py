@@ -1,11 +1,18 @@
-from copy import deepcopy
+from collections.abc import Callable, Iterable
 from logging import getLogger
+from mimetypes import guess_type
+from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from pyinaturalist.client import delete, get, paginate_all, post, put
+from pyinaturalist.client.bulk import BulkExecutor, BulkReport, BulkResult, run_bulk
 from pyinaturalist.constants import (
     API_V2,
+    BULK_MAX_ATTEMPTS,
+    BULK_MAX_WORKERS,
     V2_OBS_ORDER_BY_PROPERTIES,
+    FileOrPath,
     JsonResponse,
     ListResponse,
     MultiFile,
@@ -17,6 +24,7 @@ from pyinaturalist.docs import document_common_args, document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.exceptions import ObservationNotFound
 from pyinaturalist.request_params import (
+    convert_fields_param,
     convert_observation_params_v2,
     validate_multiple_choice_param,
 )
@@ -73,6 +81,14 @@ def get_observations(**params) -> JsonResponse:
         >>>     fields={'uuid':True, 'user':{'login':True}},
         >>> )
 
+        Nested fields can also be selected with dot notation:
+
+        >>> response = get_observations(
+        >>>     taxon_name='Danaus plexippus',
+        >>>     created_on='2020-08-27',
+        >>>     fields=['uuid', 'user.login', 'taxon.id', 'location'],
+        >>> )
+
         Return all response fields *except* identifications:
 
         >>> response = get_observations(id=14150125, except_fields=['identifications'])
@@ -106,11 +122,12 @@ def get_observations(**params) -> JsonResponse:
     if params.get('fields') and except_fields:
         raise ValueError('Cannot use both fields and except_fields')
 
-    # Request all fields except those specified
+    # Request all fields except those specified. Nested field selections are shared with
+    # ALL_OBS_FIELDS rather than copied, since they are only read when serializing the request.
     if except_fields:
-        params['fields'] = deepcopy(ALL_OBS_FIELDS)
-        for k in except_fields:
-            params['fields'].pop(k, None)
+        params['fields'] = {k: v for k, v in ALL_OBS_FIELDS.items() if k not in except_fields}
+    elif params.get('fields'):
+        params['fields'] = convert_fields_param(params['fields'])
 
     # If field selections are specified, or we're querying more IDs than can fit in a GET request,
     # then use POST method and put field selection + other params in request body
@@ -198,6 +215,8 @@ def upload(
         sounds: One or more audio files, file-like objects, file paths, or URLs
         photo_ids: One or more IDs of previously uploaded photos to attach to the observation
         access_token: Access token for user authentication, as returned by :func:`get_access_token()`
+        upload_callback: Function to call with ``(bytes_sent, total_bytes)`` while each file is
+            uploaded
 
     Returns:
         IDs only for newly created files
@@ -239,6 +258,77 @@ def upload(
     return [response.json()['results'][0] for response in responses]
 
 
+@document_common_args
+def upload_bulk(
+    uploads: Iterable[tuple[str, MultiFile]],
+    max_workers: int = BULK_MAX_WORKERS,
+    max_attempts: int = BULK_MAX_ATTEMPTS,
+    callback: Callable[[BulkResult], None] | None = None,
+    **params,
+) -> BulkReport:
+    """Upload many photo and/or sound files to one or more existing observations, with multiple
+    uploads in progress at once.
+
+    Each file is uploaded separately, and any failed uploads are retried individually. Errors are
+    recorded in the results for each file instead of raised, so one failed upload does not stop the
+    rest. Audio files are detected by file extension; all other files are uploaded as photos.
+
+    .. rubric:: Notes
+
+    * :fa:`lock` :ref:`Requires authentication <auth>`
+    * API reference: :v2:`POST /observation_photos <ObservationPhotos/post_observation_photos>`
+    * API reference: :v2:`POST /observation_sounds <ObservationSounds/post_observation_sounds>`
+
+    Example:
+
+        >>> token = get_access_token()
+        >>> results = upload_bulk(
+        ...     [
+        ...         ('53411fc2-bdf0-434e-afce-4dac33970173', ['~/observations/2020_09_01_140031.jpg']),
+        ...         ('8b7a1b0e-ad12-4d48-b2b0-6a1a7f1bd7c5', '~/observations/2020_09_01_141507.mp3'),
+        ...     ],
+        ...     access_token=token,
+        ... )
+        >>> for result in results:
+        ...     observation_uuid, file = result.item
+        ...     print(observation_uuid, file, 'OK' if result.ok else result.error)
+
+    Args:
+        uploads: Pairs of ``(observation_uuid, files)``, where ``files`` may be one or more image or
+            audio files, file-like objects, file paths, or URLs
+        max_workers: Maximum number of files to upload at once
+        max_attempts: Maximum number of times to try uploading each file
+        callback: Function to call with each :py:class:`.BulkResult` as it completes
+        access_token: Access token for user authentication, as returned by :func:`get_access_token()`
+
+    Returns:
+        A :py:class:`.BulkResult` for each file, in the same order as the input. Each result's
+        ``item`` is an ``(observation_uuid, file)`` pair.
+    """
+    items = [
+        (observation_uuid, file)
+        for observation_uuid, files in uploads
+        for file in ensure_list(files)
+    ]
+    logger.info(f'Uploading {len(items)} files')
+
+    def _upload(item: tuple[str, FileOrPath]) -> JsonResponse:
+        observation_uuid, file = item
+        media_type = 'sounds' if _is_audio_file(file) else 'photos'
+        return upload(observation_uuid, **{media_type: file}, **params)[0]
+
+    return run_bulk(
+        _upload, items, max_workers=max_workers, max_attempts=max_attempts, callback=callback
+    )
+
+
+def _is_audio_file(file: FileOrPath) -> bool:
+    """Guess whether a file is a sound (rather than a photo), based on its name"""
+    name = file if isinstance(file, (str, Path)) else getattr(file, 'name', None)
+    mimetype = guess_type(str(name))[0] if name else None
+    return bool(mimetype and mimetype.startswith('audio/'))
+
+
 @document_request_params(docs._access_token, docs._create_observation, docs._create_observation_v2)
 def create_observation(**params) -> JsonResponse:
     """Create a new observation.
@@ -339,6 +429,172 @@ def update_observation(observation_uuid: str, **params) -> JsonResponse:
     return response.json()['results'][0]
 
 
+@document_common_args
+def create_observations(
+    observations: Iterable[RequestParams],
+    max_workers: int = BULK_MAX_WORKERS,
+    max_attempts: int = BULK_MAX_ATTEMPTS,
+    callback: Callable[[BulkResult], None] | None = None,
+    **params,
+) -> BulkReport:
+    """Create multiple observations, with multiple requests in progress at once.
+
+    Each observation accepts the same parameters as :py:func:`.create_observation`. Observation
+    field values, photos, and sounds for each observation are sent as separate follow-up requests as
+    soon as that observation has been created, concurrently with the remaining observations.
+
+    Any observations without a ``uuid`` will be assigned one before sending. Since the API identifies
+    new observations by UUID, a create request that is retried after an error (for example, a
+    timeout after the observation was saved) will not result in a duplicate observation.
+
+    .. rubric:: Notes
+
+    * :fa:`lock` :ref:`Requires authentication <auth>`
+    * API reference: :v2:`POST /observations <Observations/post_observations>`
+
+    Example:
+
+        >>> token = get_access_token()
+        >>> report = create_observations(
+        ...     [
+        ...         {'species_guess': 'Pieris rapae', 'observed_on': '2020-09-01', 'photos': '~/photo_1.jpg'},
+        ...         {'species_guess': 'Danaus plexippus', 'observation_fields': {297: 3}},
+        ...     ],
+        ...     access_token=token,
+        ... )
+        >>> print(report.summary)
+        >>> for result in report.failed:
+        ...     print(result.item['uuid'], result.error, [child.error for child in result.children])
+
+    Args:
+        observations: Parameters for each observation to create
+        max_workers: Maximum number of requests to send at once
+        max_attempts: Maximum number of times to try each request
+        callback: Function to call with each :py:class:`.BulkResult` as it completes
+        access_token: Access token for user authentication, as returned by :func:`get_access_token()`
+
+    Returns:
+        A :py:class:`.BulkResult` for each observation, in the same order as the input. Each
+        result's ``item`` contains the observation parameters (including ``uuid``), and ``children``
+        contains results for its observation field values, photos, and sounds.
+    """
+    observations = [
+        {**observation, 'uuid': observation.get('uuid') or str(uuid4())}
+        for observation in observations
+    ]
+    return _write_observations(observations, False, max_workers, max_attempts, callback, **params)
+
+
+@document_common_args
+def update_observations(
+    observations: Iterable[RequestParams],
+    max_workers: int = BULK_MAX_WORKERS,
+    max_attempts: int = BULK_MAX_ATTEMPTS,
+    callback: Callable[[BulkResult], None] | None = None,
+    **params,
+) -> BulkReport:
+    """Update multiple observations, with multiple requests in progress at once.
+
+    Each observation accepts the same parameters as :py:func:`.update_observation`, and must include
+    a ``uuid``. Observation field values, photos, and sounds are sent as separate follow-up requests,
+    the same as :py:func:`.create_observations`.
+
+    .. rubric:: Notes
+
+    * :fa:`lock` :ref:`Requires authentication <auth>`
+    * API reference: :v2:`PUT /observations/{uuid} <Observations/put_observations_uuid>`
+
+    Example:
+
+        >>> token = get_access_token()
+        >>> report = update_observations(
+        ...     [
+        ...         {'uuid': '53411fc2-bdf0-434e-afce-4dac33970173', 'captive_flag': True},
+        ...         {'uuid': '8b7a1b0e-ad12-4d48-b2b0-6a1a7f1bd7c5', 'observation_fields': {297: 3}},
+        ...     ],
+        ...     access_token=token,
+        ... )
+
+    Args:
+        observations: Parameters for each observation to update, including ``uuid``
+        max_workers: Maximum number of requests to send at once
+        max_attempts: Maximum number of times to try each request
+        callback: Function to call with each :py:class:`.BulkResult` as it completes
+        access_token: Access token for user authentication, as returned by :func:`get_access_token()`
+
+    Returns:
+        A :py:class:`.BulkResult` for each observation, in the same order as the input
+
+    Raises:
+        :py:exc:`ValueError` if any observations are missing a UUID
+    """
+    observations = list(observations)
+    if not all(observation.get('uuid') for observation in observations):
+        raise ValueError('A uuid is required for each observation to update')
+    return _write_observations(observations, True, max_workers, max_attempts, callback, **params)
+
+
+def _write_observations(
+    observations: list[RequestParams],
+    update: bool,
+    max_workers: int,
+    max_attempts: int,
+    callback: Callable[[BulkResult], None] | None,
+    **params,
+) -> BulkReport:
+    """Create or update observations concurrently, and collect the results"""
+    logger.info(f'Sending {len(observations)} observations')
+    with BulkExecutor(max_workers, max_attempts, callback) as executor:
+        for observation in observations:
+            _submit_observation(executor, observation, update, **params)
+        return executor.wait()
+
+
+def _submit_observation(
+    executor: BulkExecutor, observation: RequestParams, update: bool, **params
+) -> BulkResult:
+    """Submit a request to create or update an observation. After it succeeds, submit follow-up
+    requests for its observation field values, photos, and sounds. If its params are invalid, it's
+    recorded as a failed result instead.
+    """
+    try:
+        ofvs, photos, sounds, photo_ids, obs_params, kwargs = convert_observation_params_v2(
+            {**params, **observation}
+        )
+    except Exception as e:
+        return executor.add_failure(observation, e)
+    observation_uuid = obs_params.pop('uuid') if update else obs_params['uuid']
+    media = [('photos', photo) for photo in photos] + [('sounds', sound) for sound in sounds]
+
+    def write(_) -> JsonResponse:
+        payload = {'observation': obs_params}
+        if update:
+            response = put(f'{API_V2}/observations/{observation_uuid}', json=payload, **kwargs)
+        else:
+            response = post(f'{API_V2}/observations', json=payload, **kwargs)
+        return response.json()['results'][0]
+
+    def set_ofv(ofv: dict) -> JsonResponse:
+        return set_observation_field(observation_uuid, **ofv, **kwargs)
+
+    def upload_file(item: tuple[str, FileOrPath]) -> JsonResponse:
+        media_type, file = item
+        return upload(observation_uuid, **{media_type: file}, **kwargs)[0]
+
+    def attach_photos(ids: list) -> ListResponse:
+        return upload(observation_uuid, photo_ids=ids, **kwargs)
+
+    def write_extras(parent: BulkResult):
+        for ofv in ofvs:
+            executor.submit(set_ofv, ofv, parent=parent)
+        for item in media:
+            executor.submit(upload_file, item, parent=parent)
+        if photo_ids:
+            executor.submit(attach_photos, photo_ids, parent=parent)
+
+    return executor.submit(write, observation, on_success=write_extras)
+
+
 @document_request_params(docs._access_token)
 def delete_observation(observation_uuid: str, access_token: str | None = None, **params):
     """Delete an observation
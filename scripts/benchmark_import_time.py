@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Script to measure import time for common pyinaturalist entry points, using ``python -X importtime``.
+Each import statement is run in a fresh interpreter several times, and the median is reported.
+
+Usage:
+    python scripts/benchmark_import_time.py [-n ITERATIONS] [STATEMENT ...]
+
+Example:
+    python scripts/benchmark_import_time.py 'import pyinaturalist' 'from pyinaturalist import iNatClient'
+"""
+
+import re
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+
+DEFAULT_STATEMENTS = [
+    'import pyinaturalist',
+    'import pyinat',
+    'from pyinaturalist import API_V1',
+    'from pyinaturalist.models import Observation',
+    'from pyinaturalist import get_observations',
+    'from pyinaturalist import iNatClient',
+]
+IMPORT_LINE_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def measure(statement: str) -> tuple[float, int]:
+    """Run an import statement in a new interpreter, and get the total import time (in ms) and
+    number of modules imported
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    n_modules = 0
+    for line in result.stderr.splitlines():
+        if match := IMPORT_LINE_PATTERN.match(line):
+            n_modules += 1
+            # Top-level imports have a single space of indentation, and include all nested imports
+            if len(match.group(3)) == 1:
+                total_us += int(match.group(2))
+    return total_us / 1000, n_modules
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('statements', nargs='*', default=DEFAULT_STATEMENTS)
+    parser.add_argument('-n', '--iterations', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"Statement":<50} {"Median (ms)":>12} {"Modules":>8}')
+    for statement in args.statements:
+        results = [measure(statement) for _ in range(args.iterations)]
+        elapsed = median(r[0] for r in results)
+        print(f'{statement:<50} {elapsed:>12.1f} {results[0][1]:>8}')
+
+
+if __name__ == '__main__':
+    main()
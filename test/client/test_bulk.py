@@ -0,0 +1,129 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import ConnectionError, HTTPError, Response
+
+from pyinaturalist.client.bulk import BulkExecutor, is_retryable_error, run_bulk
+
+
+def get_http_error(status_code: int) -> HTTPError:
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(response=response)
+
+
+@patch('pyinaturalist.client.bulk.sleep')
+def test_run_bulk(mock_sleep):
+    callback = MagicMock()
+    results = run_bulk(lambda x: x * 2, range(10), max_workers=3, callback=callback)
+
+    assert [r.item for r in results] == list(range(10))
+    assert [r.result for r in results] == [x * 2 for x in range(10)]
+    assert all(r.ok and r.attempts == 1 for r in results)
+    assert callback.call_count == 10
+    mock_sleep.assert_not_called()
+
+
+def test_run_bulk__callback_order():
+    """The callback should be called for each item as it completes, not in submission order"""
+    first_item_done = threading.Event()
+    completed = []
+
+    def func(x):
+        if x == 0:
+            first_item_done.wait(timeout=5)
+        return x
+
+    def callback(result):
+        completed.append(result.item)
+        if len(completed) == 4:
+            first_item_done.set()
+
+    results = run_bulk(func, range(5), max_workers=2, callback=callback)
+    assert [r.item for r in results] == list(range(5))
+    assert sorted(completed[:4]) == [1, 2, 3, 4]
+    assert completed[4] == 0
+
+
+@patch('pyinaturalist.client.bulk.sleep')
+def test_run_bulk__retry(mock_sleep):
+    """Transient errors should be retried per item, without affecting other items"""
+    func = MagicMock(side_effect=[ConnectionError(), get_http_error(503), 'result'])
+    results = run_bulk(func, ['item'], max_attempts=3)
+
+    assert results[0].ok
+    assert results[0].result == 'result'
+    assert results[0].attempts == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch('pyinaturalist.client.bulk.sleep')
+def test_run_bulk__retries_exceeded(mock_sleep):
+    func = MagicMock(side_effect=ConnectionError())
+    results = run_bulk(func, ['item'], max_attempts=2)
+
+    assert not results[0].ok
+    assert isinstance(results[0].error, ConnectionError)
+    assert results[0].attempts == 2
+
+
+@patch('pyinaturalist.client.bulk.sleep')
+def test_run_bulk__not_retryable(mock_sleep):
+    def func(item):
+        if item == 2:
+            raise get_http_error(422)
+        return item
+
+    results = run_bulk(func, [1, 2, 3])
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].attempts == 1
+    mock_sleep.assert_not_called()
+
+
+def test_bulk_executor__on_success_error():
+    """An error in a follow-up function should be recorded for that item, without affecting others"""
+
+    def on_success(result):
+        if result.item == 2:
+            raise ValueError('Follow-up failed')
+
+    with BulkExecutor() as executor:
+        for item in [1, 2, 3]:
+            executor.submit(lambda x: x, item, on_success=on_success)
+        results = executor.wait()
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_bulk_executor__add_failure():
+    """Items that fail before being submitted should be included in results and callbacks"""
+    callback = MagicMock()
+    with BulkExecutor(callback=callback) as executor:
+        executor.submit(lambda x: x, 1)
+        executor.add_failure(2, ValueError('Invalid item'))
+        results = executor.wait()
+
+    assert [r.item for r in results] == [1, 2]
+    assert [r.ok for r in results] == [True, False]
+    assert results[1].attempts == 0
+    assert callback.call_count == 2
+
+
+def test_run_bulk__empty():
+    assert run_bulk(lambda x: x, []) == []
+
+
+@pytest.mark.parametrize(
+    'error, expected',
+    [
+        (ConnectionError(), True),
+        (get_http_error(429), True),
+        (get_http_error(502), True),
+        (get_http_error(404), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable_error(error, expected):
+    assert is_retryable_error(error) is expected
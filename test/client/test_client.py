@@ -5,6 +5,7 @@ import pytest
 from requests import HTTPError
 
 from pyinaturalist.client import iNatClient
+from pyinaturalist.constants import API_V1
 from pyinaturalist.docs import document_common_args
 from pyinaturalist.exceptions import AuthenticationError
 from test.conftest import make_http_error, make_jwt
@@ -262,3 +263,33 @@ def test_client_auth__token_info_updated_on_401(get_access_token):
 
     assert client._token_info is not None
     assert client._token_info.token == 'fresh_token'
+
+
+def test_warm_cache(requests_mock):
+    requests_mock.get(f'{API_V1}/controlled_terms', json={'results': []})
+    requests_mock.get(f'{API_V1}/places/1,14', json={'results': []})
+    requests_mock.get(
+        f'{API_V1}/taxa/48484',
+        json={'results': [{'id': 48484, 'ancestor_ids': [48460, 1, 47120, 48484]}]},
+    )
+    requests_mock.get(f'{API_V1}/taxa/1,47120,48460', json={'results': []})
+    client = iNatClient(default_params={'locale': 'fr'})
+
+    report = client.warm_cache(iconic_taxa=False, place_ids=[1, 14, 1], taxon_ids=[48484])
+    urls = [request.url for request in requests_mock.request_history]
+    assert len(report.fetched) == 4
+    assert report.failed == []
+    assert f'{API_V1}/places/1,14' in urls
+    assert urls[-1] == f'{API_V1}/taxa/1,47120,48460?locale=fr'
+
+
+def test_warm_cache__iconic_taxa(requests_mock):
+    requests_mock.get(f'{API_V1}/controlled_terms', json={'results': []})
+    requests_mock.get(
+        f'{API_V1}/taxa/1,3,20978,26036,40151,47178,47115,47119,47158,47126,47170,48222,47686',
+        json={'results': []},
+    )
+    client = iNatClient()
+
+    report = client.warm_cache()
+    assert report.summary == '2 requests: 2 fetched, 0 revalidated, 0 fresh, 0 failed'
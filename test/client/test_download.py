@@ -0,0 +1,130 @@
+import re
+
+import pytest
+from requests_ratelimiter import InMemoryBucket
+
+from pyinaturalist.client import ClientSession
+from pyinaturalist.client.download import download_media, get_media_filename
+from pyinaturalist.models import Photo, Sound
+
+CONTENT = b'0123456789' * 1000
+ETAG = '"abc123"'
+PHOTO_URL = re.compile(r'https://static\.inaturalist\.org/photos/.*')
+
+
+@pytest.fixture
+def session(tmp_path):
+    return ClientSession(cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket)
+
+
+def mock_media_server(requests_mock, content=CONTENT, etag=ETAG):
+    """Respond to GET requests with partial content for matching Range + If-Range headers"""
+
+    def respond(request, context):
+        context.headers['ETag'] = etag
+        context.headers['Content-Type'] = 'image/jpeg'
+        range_header = request.headers.get('Range')
+        if range_header and request.headers.get('If-Range') == etag:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            context.status_code = 206
+            return content[start:]
+        return content
+
+    requests_mock.get(PHOTO_URL, content=respond)
+    requests_mock.head(PHOTO_URL, headers={'Content-Length': str(len(content))})
+
+
+def get_photo(id: int) -> Photo:
+    return Photo(id=id, url=f'https://static.inaturalist.org/photos/{id}/square.jpg?1234')
+
+
+def test_download_media(requests_mock, session, tmp_path):
+    mock_media_server(requests_mock)
+    requests_mock.get('https://static.inaturalist.org/sounds/3.wav', content=b'sound')
+    media = [
+        get_photo(1),
+        get_photo(2),
+        get_photo(1),
+        Sound(id=3, file_url='https://static.inaturalist.org/sounds/3.wav'),
+    ]
+
+    report = download_media(media, dest=tmp_path, size='large', session=session)
+    assert report.summary == '3 files: 3 downloaded, 0 resumed, 0 skipped, 0 failed'
+    assert [r.item.id for r in report] == [1, 2, 3]
+    assert (tmp_path / '1_large.jpg').read_bytes() == CONTENT
+    assert (tmp_path / '3.wav').read_bytes() == b'sound'
+    assert any(r.url.endswith('/1/large.jpg?1234') for r in requests_mock.request_history)
+    assert not list(tmp_path.glob('*.part')) and not list(tmp_path.glob('*.etag'))
+
+    # Downloaded files should not be cached, since they're already on disk
+    assert not session.cache.responses
+
+    # Existing files should be skipped without sending any requests
+    call_count = requests_mock.call_count
+    report = download_media(media, dest=tmp_path, size='large', session=session)
+    assert report.summary == '3 files: 0 downloaded, 0 resumed, 3 skipped, 0 failed'
+    assert requests_mock.call_count == call_count
+
+
+def test_download_media__resume(requests_mock, session, tmp_path):
+    mock_media_server(requests_mock)
+    (tmp_path / '1_medium.jpg.part').write_bytes(CONTENT[:4000])
+    (tmp_path / '1_medium.jpg.etag').write_text(ETAG)
+
+    report = download_media([get_photo(1)], dest=tmp_path, session=session)
+    assert report.summary == '1 files: 0 downloaded, 1 resumed, 0 skipped, 0 failed'
+    assert requests_mock.last_request.headers['Range'] == 'bytes=4000-'
+    assert (tmp_path / '1_medium.jpg').read_bytes() == CONTENT
+    assert report[0].result.size == len(CONTENT)
+
+
+def test_download_media__resume_changed_file(requests_mock, session, tmp_path):
+    """If the remote file has changed since a partial download, it should be downloaded again"""
+    mock_media_server(requests_mock, etag='"def456"')
+    (tmp_path / '1_medium.jpg.part').write_bytes(b'old content')
+    (tmp_path / '1_medium.jpg.etag').write_text(ETAG)
+
+    report = download_media([get_photo(1)], dest=tmp_path, session=session)
+    assert report.summary == '1 files: 1 downloaded, 0 resumed, 0 skipped, 0 failed'
+    assert (tmp_path / '1_medium.jpg').read_bytes() == CONTENT
+
+
+def test_download_media__verify(requests_mock, session, tmp_path):
+    """With verify=True, existing files with the wrong size should be downloaded again"""
+    mock_media_server(requests_mock)
+    (tmp_path / '1_medium.jpg').write_bytes(CONTENT)
+    (tmp_path / '2_medium.jpg').write_bytes(b'truncated')
+
+    report = download_media(
+        [get_photo(1), get_photo(2)], dest=tmp_path, session=session, verify=True
+    )
+    assert report.summary == '2 files: 1 downloaded, 0 resumed, 1 skipped, 0 failed'
+    assert (tmp_path / '2_medium.jpg').read_bytes() == CONTENT
+
+
+def test_download_media__errors(requests_mock, session, tmp_path):
+    """Failed downloads should be reported without stopping other downloads"""
+    mock_media_server(requests_mock)
+    requests_mock.get('https://static.inaturalist.org/photos/2/medium.jpg?1234', status_code=404)
+
+    report = download_media(
+        [get_photo(1), get_photo(2), Sound(id=3)], dest=tmp_path, session=session
+    )
+    assert report.summary == '3 files: 1 downloaded, 0 resumed, 0 skipped, 2 failed'
+    assert report[1].attempts == 1
+    assert isinstance(report[2].error, ValueError)
+
+
+def test_get_media_filename():
+    assert get_media_filename(get_photo(1), 'original') == '1_original.jpg'
+    assert get_media_filename(Photo(id=1)) == '1_medium.jpg'
+    assert (
+        get_media_filename(Sound(id=2, file_url='https://static.inaturalist.org/sounds/2.M4A?5'))
+        == '2.m4a'
+    )
+
+
+def test_photo_open(requests_mock, session):
+    mock_media_server(requests_mock)
+    assert get_photo(1).open(session=session).read() == CONTENT
+    assert requests_mock.last_request.url.endswith('/1/large.jpg?1234')
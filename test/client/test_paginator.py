@@ -1,10 +1,18 @@
 from asyncio import get_event_loop
 from copy import deepcopy
+from time import sleep
 from unittest.mock import patch
 
 import pytest
 
-from pyinaturalist.client import Paginator, WrapperPaginator
+from pyinaturalist.client import (
+    ConcurrentPaginator,
+    Paginator,
+    WrapperPaginator,
+    get,
+    paginate_all,
+)
+from pyinaturalist.client.paginator import JsonConcurrentPaginator
 from pyinaturalist.constants import API_V1
 from pyinaturalist.models import Observation
 from pyinaturalist.v1 import get_observations
@@ -31,6 +39,51 @@ def test_iter(requests_mock):
     assert len(observations) == 3
 
 
+def test_iter__stream(requests_mock):
+    page_1 = deepcopy(SAMPLE_DATA['get_observations_page1'])
+    page_1['total_results'] = 2
+    requests_mock.get(
+        f'{API_V1}/observations',
+        [
+            {'json': page_1, 'status_code': 200},
+            {'json': SAMPLE_DATA['get_observations_page2'], 'status_code': 200},
+        ],
+    )
+
+    def _request_observations(**params):
+        return get(f'{API_V1}/observations', **params)
+
+    paginator = Paginator(_request_observations, Observation, per_page=1, stream=True)
+    observations = list(paginator)
+    assert len(observations) == 2
+    assert isinstance(observations[0], Observation)
+    assert paginator.total_results == 2
+    assert requests_mock.request_history[0].stream is True
+
+
+@patch('pyinaturalist.client.paginator.sleep')
+def test_iter__stream_invalid_json(mock_sleep, requests_mock):
+    """A streamed page with invalid (truncated) JSON should be requested again"""
+    page_1 = deepcopy(SAMPLE_DATA['get_observations_page1'])
+    page_1['total_results'] = 1
+    requests_mock.get(
+        f'{API_V1}/observations',
+        [
+            {'text': '{"total_results": 1, "results": [{"id": 1', 'status_code': 200},
+            {'json': page_1, 'status_code': 200},
+        ],
+    )
+
+    def _request_observations(**params):
+        return get(f'{API_V1}/observations', **params)
+
+    paginator = Paginator(_request_observations, Observation, per_page=1, stream=True)
+    observations = list(paginator)
+    assert len(observations) == 1
+    assert requests_mock.call_count == 2
+    assert mock_sleep.call_count == 1
+
+
 def test_iter__with_limit(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations',
@@ -166,6 +219,106 @@ def test_str():
     assert '0/50' in str(paginator)
 
 
+def get_fake_pages(total_results: int = 95):
+    """Fake request function that returns pages of ``{'id': int}`` results, with a short delay for
+    earlier pages so they complete out of order
+    """
+    requested_pages = []
+
+    def get_page(page=1, per_page=10, **kwargs):
+        requested_pages.append(page)
+        sleep(0.01 * (10 - page) if page <= 10 else 0)
+        start = (page - 1) * per_page
+        ids = range(start + 1, min(start + per_page, total_results) + 1)
+        return {'total_results': total_results, 'results': [{'id': i} for i in ids]}
+
+    return get_page, requested_pages
+
+
+def test_concurrent_paginator():
+    """All remaining pages should be requested after the first page, and returned in order"""
+    get_page, requested_pages = get_fake_pages()
+    paginator = ConcurrentPaginator(get_page, Observation, per_page=10, max_workers=4)
+    results = paginator.all()
+
+    assert [obs.id for obs in results] == list(range(1, 96))
+    assert sorted(requested_pages) == list(range(1, 11))
+    assert paginator.exhausted is True
+    assert paginator.next_page() == []
+
+
+def test_concurrent_paginator__limit():
+    get_page, requested_pages = get_fake_pages()
+    paginator = ConcurrentPaginator(get_page, Observation, per_page=10, limit=25)
+    results = paginator.all()
+
+    assert [obs.id for obs in results] == list(range(1, 26))
+    assert sorted(requested_pages) == [1, 2, 3]
+
+
+def test_concurrent_paginator__single_page():
+    get_page, requested_pages = get_fake_pages(total_results=5)
+    paginator = ConcurrentPaginator(get_page, Observation, per_page=10)
+    assert len(paginator.all()) == 5
+    assert requested_pages == [1]
+
+
+def test_concurrent_paginator__page_size():
+    """If the first page is larger than requested, the actual page size should be used"""
+    get_page, requested_pages = get_fake_pages()
+    paginator = ConcurrentPaginator(
+        lambda page=1, per_page=10, **kwargs: get_page(page, per_page=20), Observation, per_page=5
+    )
+    assert len(paginator.all()) == 95
+    assert sorted(requested_pages) == [1, 2, 3, 4, 5]
+
+
+def test_concurrent_paginator__one():
+    """one() should only request a single result, without fetching any other pages"""
+    get_page, requested_pages = get_fake_pages(total_results=2000)
+    paginator = ConcurrentPaginator(get_page, Observation, per_page=10)
+    assert paginator.one().id == 1
+    sleep(0.2)
+    assert requested_pages == [1]
+
+
+def test_concurrent_paginator__break():
+    """Stopping iteration early should cancel remaining requests, and only a few pages should be
+    requested ahead of the current page
+    """
+    get_page, requested_pages = get_fake_pages(total_results=2000)
+    paginator = ConcurrentPaginator(get_page, Observation, per_page=10, max_workers=2)
+    for obs in paginator:
+        if obs.id == 15:
+            break
+
+    sleep(0.2)
+    assert paginator.exhausted is True
+    assert paginator._executor._shutdown is True
+    assert sorted(requested_pages) in ([1, 2, 3], [1, 2, 3, 4])
+
+
+def test_json_concurrent_paginator__break():
+    """Stopping iteration early over raw results should also cancel remaining requests"""
+    get_page, requested_pages = get_fake_pages(total_results=2000)
+    paginator = JsonConcurrentPaginator(get_page, per_page=10, max_workers=2)
+    for result in paginator:
+        if result['id'] == 15:
+            break
+
+    sleep(0.2)
+    assert paginator.exhausted is True
+    assert paginator._executor._shutdown is True
+    assert sorted(requested_pages) in ([1, 2, 3], [1, 2, 3, 4])
+
+
+def test_paginate_all__concurrent():
+    get_page, _ = get_fake_pages()
+    response = paginate_all(get_page, method='concurrent', per_page=10)
+    assert response['total_results'] == 95
+    assert response['results'][-1] == {'id': 95}
+
+
 def test_wrapper_paginator():
     results = [Observation(id=i) for i in range(10)]
     paginator = WrapperPaginator(results)
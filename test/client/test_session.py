@@ -1,16 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from time import sleep
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import urllib3.util.retry
 from requests import ConnectionError, Request, Session
 from requests_cache import CacheMixin
-from requests_ratelimiter import Duration, HostBucketFactory, Limiter, Rate, SQLiteBucket
+from requests_ratelimiter import (
+    Duration,
+    HostBucketFactory,
+    InMemoryBucket,
+    Limiter,
+    Rate,
+    SQLiteBucket,
+)
 from urllib3.exceptions import MaxRetryError
 
 from pyinaturalist.client.session import (
     CACHE_FILE,
+    CacheMetrics,
     ClientSession,
     FileLockSQLiteBucket,
     MockResponse,
@@ -19,12 +28,15 @@ from pyinaturalist.client.session import (
     delete,
     get,
     get_local_session,
+    get_shared_session,
     post,
     put,
+    use_shared_session,
 )
 from pyinaturalist.constants import (
     CACHE_EXPIRATION,
     CONNECT_TIMEOUT,
+    POOL_MAXSIZE,
     REQUEST_TIMEOUT,
     WRITE_TIMEOUT,
 )
@@ -133,6 +145,23 @@ def test_request_dry_run_disabled(requests_mock):
     assert ClientSession().request('GET', 'http://url').json() == real_response
 
 
+@patch.object(urllib3.util.retry.time, 'sleep')
+def test_request_validate_json__skip_stream(mock_sleep, requests_mock):
+    """Streamed responses should be left unread, to be parsed incrementally by the caller"""
+    requests_mock.get(
+        'http://url/invalid_json',
+        body=BytesIO(b'{"results": "invalid respo"'),
+        headers={'Content-Type': 'application/json'},
+        status_code=200,
+    )
+    response = ClientSession(max_retries=7).get(
+        'http://url/invalid_json', stream=True, force_refresh=True
+    )
+
+    assert response.content == b'{"results": "invalid respo"'
+    assert mock_sleep.call_count == 0
+
+
 @patch.object(urllib3.util.retry.time, 'sleep')
 def test_request_validate_json__retry_failure(mock_sleep, requests_mock):
     requests_mock.get(
@@ -339,6 +368,36 @@ def test_send__non_write_connection_error_not_retried(mock_sleep, requests_mock)
     assert mock_sleep.call_count == 0
 
 
+@patch.object(urllib3.util.retry.time, 'sleep')
+def test_send__upload_stream(mock_sleep, requests_mock, tmp_path):
+    """File uploads should be streamed from disk, and rewound if the request needs to be retried"""
+    file_path = tmp_path / 'photo.jpg'
+    file_path.write_bytes(b'test content')
+
+    def read_body(request, context):
+        body = request.body.read()
+        if len(requests_mock.request_history) == 1:
+            raise ConnectionError(
+                'Connection aborted.', TimeoutError('The write operation timed out')
+            )
+        return {'body': body.decode()}
+
+    requests_mock.post('http://test.com', json=read_body)
+    callback = MagicMock()
+    session = ClientSession(max_retries=3)
+    response = session.request(
+        'POST', 'http://test.com', data={'key': 'value'}, files=file_path, upload_callback=callback
+    )
+
+    request = requests_mock.last_request
+    assert request.headers['Content-Type'].startswith('multipart/form-data; boundary=')
+    assert int(request.headers['Content-Length']) == len(response.json()['body'])
+    assert 'filename="photo.jpg"' in response.json()['body']
+    assert 'test content' in response.json()['body']
+    callback.assert_called_with(len(request.body), len(request.body))
+    assert request.body.files[0].closed
+
+
 @pytest.mark.enable_client_session  # For all other tests, caching is disabled. Re-enable that here.
 @patch.object(CacheMixin, 'send')
 def test_send__cache_settings(mock_cache_send):
@@ -357,6 +416,98 @@ def test_send__cache_settings(mock_cache_send):
     assert mock_cache_send.call_args.kwargs.get('force_refresh') is True
 
 
+def test_send__revalidate(requests_mock, tmp_path):
+    """Refreshed requests should send validators from the cached response, and reuse the cached
+    response body if the server responds with 304 Not Modified
+    """
+    content = b'{"results": [{"id": 1}]}'
+
+    def respond(request, context):
+        context.headers['ETag'] = '"abc123"'
+        context.headers['Content-Type'] = 'application/json'
+        if request.headers.get('If-None-Match') == '"abc123"':
+            context.status_code = 304
+            return b''
+        return content
+
+    requests_mock.get('https://test.com', content=respond)
+    session = ClientSession(cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket)
+
+    response_1 = session.get('https://test.com')
+    response_2 = session.get('https://test.com')
+    response_3 = session.get('https://test.com', refresh=True)
+
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers['If-None-Match'] == '"abc123"'
+    assert response_1.from_cache is False
+    assert response_2.from_cache is True
+    assert response_3.revalidated is True
+    assert response_3.status_code == 200
+    assert response_3.json() == {'results': [{'id': 1}]}
+    assert session.cache_metrics.summary() == {
+        'hits': 1,
+        'revalidated': 1,
+        'misses': 1,
+        'bytes_downloaded': len(content),
+        'bytes_saved': len(content) * 2,
+    }
+
+
+def test_preload(requests_mock, tmp_path):
+    """Preloading should report which requests were fetched, already fresh, or failed"""
+    requests_mock.get('https://test.com/1', json={'id': 1})
+    requests_mock.get('https://test.com/2', json={'id': 2})
+    requests_mock.get('https://test.com/3', status_code=404)
+    session = ClientSession(cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket)
+    session.get('https://test.com/1')
+
+    report = session.preload(
+        ['https://test.com/1', Request('GET', 'https://test.com/2'), 'https://test.com/3']
+    )
+    assert [r.item.url for r in report.fresh] == ['https://test.com/1']
+    assert [r.item.url for r in report.fetched] == ['https://test.com/2']
+    assert [r.item.url for r in report.failed] == ['https://test.com/3']
+    assert report.revalidated == []
+    assert report.summary == '3 requests: 1 fetched, 0 revalidated, 1 fresh, 1 failed'
+    assert session.get('https://test.com/2', only_if_cached=True).json() == {'id': 2}
+
+
+def test_cache_metrics__json_retry(requests_mock, tmp_path):
+    """Cache metrics should only be recorded for the final response, not for each retry"""
+    requests_mock.get(
+        'http://url/maybe_valid_json',
+        [
+            {
+                'body': BytesIO(b'{"results": "invalid respo"'),
+                'headers': {'Content-Type': 'application/json'},
+                'status_code': 200,
+            },
+            {
+                'body': BytesIO(b'{"results": "valid response"}'),
+                'headers': {'Content-Type': 'application/json'},
+                'status_code': 200,
+            },
+        ],
+    )
+    session = ClientSession(cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket)
+    session.get('http://url/maybe_valid_json')
+
+    assert requests_mock.call_count == 2
+    assert session.cache_metrics.summary()['misses'] == 1
+
+
+def test_cache_metrics__streamed_response():
+    """For a streamed response that hasn't been read yet, Content-Length should be used instead"""
+    response = MagicMock(spec=['headers'], headers={'Content-Length': '1024'})
+    metrics = CacheMetrics()
+    metrics.record(response)
+    assert metrics.misses == 1
+    assert metrics.bytes_downloaded == 1024
+
+    metrics.reset()
+    assert metrics.summary() == dict.fromkeys(metrics.summary(), 0)
+
+
 def test_get_local_session():
     session_1 = get_local_session()
     session_2 = get_local_session()
@@ -364,6 +515,49 @@ def test_get_local_session():
     assert isinstance(session_1, ClientSession)
 
 
+@pytest.fixture
+def reset_shared_session(monkeypatch):
+    monkeypatch.setattr('pyinaturalist.client.session._shared_session', None)
+    monkeypatch.setattr('pyinaturalist.client.session._shared_session_enabled', False)
+
+
+def test_get_shared_session(reset_shared_session, tmp_path):
+    def _get_session(_):
+        return get_shared_session(cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(_get_session, range(8)))
+    assert all(session is sessions[0] for session in sessions)
+    assert get_local_session() is not sessions[0]
+
+
+def test_use_shared_session(reset_shared_session, tmp_path):
+    use_shared_session()
+    shared_session = get_shared_session(
+        cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert executor.submit(get_local_session).result() is shared_session
+
+    use_shared_session(False)
+    assert get_local_session() is not shared_session
+
+
+@pytest.mark.parametrize('url', ['https://api.inaturalist.org', 'http://localhost'])
+def test_pool_settings(url):
+    adapter = ClientSession(bucket_class=InMemoryBucket).get_adapter(url)
+    assert adapter._pool_maxsize == POOL_MAXSIZE
+    assert adapter._pool_block is False
+
+    session = ClientSession(
+        bucket_class=InMemoryBucket, pool_connections=2, pool_maxsize=64, pool_block=True
+    )
+    adapter = session.get_adapter(url)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+
+
 @pytest.mark.enable_client_session
 def test_clear_cache():
     session = get_local_session()
@@ -0,0 +1,189 @@
+import json
+from email.parser import BytesParser
+from io import BytesIO, UnsupportedOperation
+from json import JSONDecodeError
+from unittest.mock import MagicMock
+
+import pytest
+from requests import Response
+
+from pyinaturalist.client import (
+    MultipartStream,
+    iter_csv_rows,
+    iter_json_results,
+    iter_xml_elements,
+    read_json_stream,
+)
+from pyinaturalist.constants import DWC_NAMESPACE, DWR_NAMESPACE, SAMPLE_DATA_DIR
+from test.sample_data import SAMPLE_DATA
+
+
+def get_stream_response(content: bytes) -> Response:
+    response = Response()
+    response.raw = BytesIO(content)
+    response.status_code = 200
+    return response
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 65536])
+def test_read_json_stream(chunk_size):
+    """Results should be parsed the same as json.loads(), regardless of chunk boundaries"""
+    response_json = SAMPLE_DATA['get_observations_page1']
+    content = json.dumps(response_json).encode()
+    response = get_stream_response(content)
+
+    assert read_json_stream(response, chunk_size=chunk_size) == response_json
+
+
+def test_iter_json_results__metadata():
+    content = b'{"total_results": 12345, "page": 1, "results": [{"id": 1}, {"id": 22}], "x": "y"}'
+    metadata: dict = {}
+    results = iter_json_results(get_stream_response(content), metadata=metadata, chunk_size=3)
+
+    assert next(results) == {'id': 1}
+    assert metadata == {'total_results': 12345, 'page': 1}
+    assert list(results) == [{'id': 22}]
+    assert metadata == {'total_results': 12345, 'page': 1, 'x': 'y'}
+
+
+@pytest.mark.parametrize(
+    'content, expected',
+    [
+        (b'[]', []),
+        (b'{"results": []}', []),
+        (b' [ 1 , 22 , 333 ] ', [1, 22, 333]),
+        ('{"results": [{"name": "Ménétriés"}]}'.encode(), [{'name': 'Ménétriés'}]),
+    ],
+)
+def test_iter_json_results__formats(content, expected):
+    assert list(iter_json_results(get_stream_response(content), chunk_size=2)) == expected
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        b'{"total_results": 2, "results": [{"id": 1}, {"id": 2',
+        b'{"total_results": 2, "results": [{"id": 1}',
+        b'{"total_results": 2',
+        b'',
+    ],
+)
+def test_iter_json_results__truncated(content):
+    with pytest.raises(JSONDecodeError):
+        list(iter_json_results(get_stream_response(content), chunk_size=4))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 65536])
+def test_iter_csv_rows(chunk_size):
+    """Rows should be parsed the same as a complete file, including multi-line values and
+    multi-byte characters split across chunks
+    """
+    content = 'id,name,description\r\n1,Ménétriés,"line 1\nline 2"\r\n2,b,\r\n'.encode()
+    rows = list(iter_csv_rows(get_stream_response(content), chunk_size=chunk_size))
+    assert rows == [
+        {'id': '1', 'name': 'Ménétriés', 'description': 'line 1\nline 2'},
+        {'id': '2', 'name': 'b', 'description': ''},
+    ]
+
+
+def test_iter_csv_rows__sample_data():
+    content = (SAMPLE_DATA_DIR / 'v0' / 'get_observations.csv').read_bytes()
+    rows = list(iter_csv_rows(get_stream_response(content), chunk_size=64))
+    assert len(rows) == 1
+    assert rows[0]['id'] == '16227955'
+    assert rows[0]['scientific_name'] == 'Lixus bardanae'
+
+
+@pytest.mark.parametrize('chunk_size', [3, 65536])
+def test_iter_xml_elements(chunk_size):
+    content = b'<root><a id="1"><b>x</b></a><c/><a id="2"><b>y</b></a></root>'
+    elements = iter_xml_elements(get_stream_response(content), 'a', chunk_size=chunk_size)
+
+    first = next(elements)
+    assert first.get('id') == '1' and first.findtext('b') == 'x'
+    second = next(elements)
+    assert second.get('id') == '2' and second.findtext('b') == 'y'
+    assert list(elements) == []
+
+
+def test_iter_xml_elements__removes_parsed_elements():
+    """Parsed elements should be removed from their parent, so they don't accumulate in memory"""
+    content = b'<root><doc>' + b'<a><b/></a>' * 100 + b'</doc></root>'
+    parents = []
+    for element in iter_xml_elements(get_stream_response(content), ['a', 'doc'], chunk_size=8):
+        if element.tag == 'doc':
+            parents.append(element)
+    assert len(parents) == 1
+    assert len(parents[0]) == 0
+
+
+def test_iter_xml_elements__dwc():
+    content = (SAMPLE_DATA_DIR / 'v0' / 'get_observations.dwc').read_bytes()
+    tag = f'{{{DWR_NAMESPACE}}}SimpleDarwinRecord'
+    records = list(iter_xml_elements(get_stream_response(content), tag, chunk_size=100))
+    assert len(records) == 1
+    assert records[0].findtext(f'{{{DWC_NAMESPACE}}}catalogNumber') == '16227955'
+
+
+def parse_multipart(body: MultipartStream) -> dict:
+    content = f'Content-Type: {body.content_type}\r\n\r\n'.encode() + body.read()
+    message = BytesParser().parsebytes(content)
+    return {
+        part.get_param('name', header='Content-Disposition'): (
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    }
+
+
+def test_multipart_stream():
+    file_obj = BytesIO(b'test content')
+    file_obj.name = '/tmp/photo.jpg'
+    body = MultipartStream({'observation_photo[observation_id]': 1234}, {'file': file_obj})
+
+    parts = parse_multipart(body)
+    assert parts['observation_photo[observation_id]'] == (None, 'text/plain', b'1234')
+    assert parts['file'] == ('photo.jpg', 'image/jpeg', b'test content')
+    assert body.tell() == len(body)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_multipart_stream__chunks(chunk_size):
+    """Iterating over the body in chunks should give the same content as a single read"""
+    callback = MagicMock()
+    body = MultipartStream(
+        {'key': 'value'},
+        {'file': BytesIO(b'0123456789' * 100)},
+        chunk_size=chunk_size,
+        callback=callback,
+    )
+    chunks = list(body)
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+
+    body.seek(0)
+    assert b''.join(chunks) == body.read()
+
+    # Progress should be reported after each chunk, ending with the total size
+    assert callback.call_count == len(chunks) + 1
+    callback.assert_called_with(len(body), len(body))
+
+
+def test_multipart_stream__seek():
+    body = MultipartStream(files={'file': BytesIO(b'test content')})
+    content = body.read()
+    assert body.read() == b''
+
+    body.seek(0)
+    assert body.read() == content
+    with pytest.raises(UnsupportedOperation):
+        body.seek(10)
+
+
+def test_multipart_stream__close():
+    file_obj = BytesIO(b'test content')
+    MultipartStream(files={'file': file_obj}).close()
+    assert not file_obj.closed
+    MultipartStream(files={'file': file_obj}, close_files=True).close()
+    assert file_obj.closed
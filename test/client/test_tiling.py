@@ -0,0 +1,97 @@
+import pytest
+
+from pyinaturalist.client import BoundingBox, IDRangePaginator, TiledPaginator
+from pyinaturalist.models import Observation
+
+# Observations on a 10x10 grid from (0, 0) to (45, 45), including some on tile edges
+OBSERVATIONS = [
+    {'id': i * 10 + j + 1, 'location': [i * 5.0, j * 5.0]} for i in range(10) for j in range(10)
+]
+
+
+def search_observations(**params):
+    """Fake observation search that filters by bounding box and paginates by ID"""
+    bbox = BoundingBox.from_params(params)
+    results = [
+        obs
+        for obs in OBSERVATIONS
+        if bbox.contains(*obs['location']) and obs['id'] > (params.get('id_above') or 0)
+    ]
+    return {'total_results': len(results), 'results': results[: params['per_page']]}
+
+
+def get_paginator(**kwargs):
+    paginator = IDRangePaginator(
+        search_observations, Observation, swlat=0, swlng=0, nelat=45, nelng=45, per_page=10
+    )
+    return TiledPaginator(paginator, **kwargs)
+
+
+def test_bounding_box__split():
+    bbox = BoundingBox(swlat=0, swlng=-10, nelat=20, nelng=30)
+    assert bbox.split() == [
+        BoundingBox(0, -10, 10, 10),
+        BoundingBox(0, 10, 10, 30),
+        BoundingBox(10, -10, 20, 10),
+        BoundingBox(10, 10, 20, 30),
+    ]
+
+
+def test_bounding_box__antimeridian():
+    """A bounding box that crosses the antimeridian should be split across it"""
+    bbox = BoundingBox(swlat=-50, swlng=160, nelat=-30, nelng=-160)
+    assert bbox.width == 40
+    assert bbox.contains(-40, 170) and bbox.contains(-40, -170)
+    assert not bbox.contains(-40, 0)
+    assert [(b.swlng, b.nelng) for b in bbox.split()[:2]] == [(160, 180), (180, -160)]
+
+
+def test_bounding_box__from_params():
+    assert BoundingBox.from_params({}) == BoundingBox(-90, -180, 90, 180)
+    assert BoundingBox.from_params({'swlat': '1.5', 'nelng': 2}).params == {
+        'swlat': 1.5,
+        'swlng': -180,
+        'nelat': 90,
+        'nelng': 2,
+    }
+
+
+@pytest.mark.parametrize('max_tile_results, expected_tiles', [(100, 1), (30, 4), (10, 16)])
+def test_get_tiles(max_tile_results, expected_tiles):
+    paginator = get_paginator(max_tile_results=max_tile_results)
+    tiles = paginator.get_tiles()
+    assert len(tiles) == expected_tiles
+    assert all(count <= max_tile_results for _, count in tiles)
+
+
+def test_get_tiles__max_depth():
+    """Tiles should not be split past the max depth, even if they have too many results"""
+    tiles = get_paginator(max_tile_results=1, max_depth=1).get_tiles()
+    assert len(tiles) == 4
+
+
+def test_all():
+    """All results should be returned exactly once, including those on tile edges"""
+    paginator = get_paginator(max_tile_results=10)
+    results = paginator.all()
+    assert sorted(obs.id for obs in results) == [obs['id'] for obs in OBSERVATIONS]
+    assert paginator.exhausted
+
+
+def test_limit():
+    paginator = get_paginator(max_tile_results=10)
+    results = paginator.limit(25)
+    assert len(results) == 25
+    assert len({obs.id for obs in results}) == 25
+    assert paginator.next_page() == []
+
+
+def test_break():
+    """Stopping iteration early should cancel remaining requests and shut down the executor"""
+    paginator = get_paginator(max_tile_results=10)
+    for _obs in paginator:
+        break
+
+    assert paginator.exhausted
+    assert paginator._executor._shutdown is True
+    assert paginator.next_page() == []
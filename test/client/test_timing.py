@@ -0,0 +1,105 @@
+from io import BytesIO
+from logging import WARNING
+
+from requests_ratelimiter import InMemoryBucket
+
+from pyinaturalist.client import ClientSession, iNatClient
+from pyinaturalist.client.timing import RequestTiming
+from pyinaturalist.constants import API_V1
+from test.sample_data import SAMPLE_DATA
+
+
+def get_session(tmp_path, **kwargs) -> tuple[ClientSession, list[RequestTiming]]:
+    timings: list[RequestTiming] = []
+    session = ClientSession(
+        cache_file=tmp_path / 'cache.db',
+        bucket_class=InMemoryBucket,
+        timing_callback=timings.append,
+        **kwargs,
+    )
+    return session, timings
+
+
+def test_timing(requests_mock, tmp_path):
+    """Each request should be timed once, with phases depending on whether it was cached"""
+    requests_mock.get(
+        'https://test.com',
+        json={'results': [{'id': 1}]},
+        headers={'Content-Type': 'application/json'},
+    )
+    session, timings = get_session(tmp_path)
+    session.get('https://test.com')
+    session.get('https://test.com')
+
+    assert len(timings) == 2
+    miss, hit = timings
+    assert miss.method == 'GET'
+    assert miss.url == 'https://test.com/'
+    assert miss.status_code == 200
+    assert miss.from_cache is False
+    assert miss.retries == 0
+    assert set(miss.phases) == {
+        'cache_lookup',
+        'ratelimit_wait',
+        'response',
+        'download',
+        'cache_write',
+        'json_decode',
+    }
+    assert hit.from_cache is True
+    assert set(hit.phases) == {'cache_lookup', 'json_decode'}
+    assert all(t.total >= sum(t.phases.values()) for t in timings)
+
+
+def test_timing__retries(requests_mock, tmp_path):
+    """A request retried after an invalid response should only be timed once"""
+    requests_mock.get(
+        'https://test.com',
+        [
+            {
+                'body': BytesIO(b'{"results": "invalid respo"'),
+                'headers': {'Content-Type': 'application/json'},
+            },
+            {
+                'body': BytesIO(b'{"results": "valid response"}'),
+                'headers': {'Content-Type': 'application/json'},
+            },
+        ],
+    )
+    session, timings = get_session(tmp_path, backoff_factor=0)
+    session.get('https://test.com')
+
+    assert len(timings) == 1
+    assert timings[0].retries == 1
+    assert 'retry_wait' in timings[0].phases
+    assert timings[0].status_code == 200
+
+
+def test_timing__callback_error(requests_mock, tmp_path, caplog):
+    """An error in the timing callback should be logged instead of failing the request"""
+
+    def callback(timing):
+        raise ValueError('Callback error')
+
+    requests_mock.get('https://test.com', json={})
+    session = ClientSession(
+        cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket, timing_callback=callback
+    )
+    with caplog.at_level(WARNING):
+        response = session.get('https://test.com')
+
+    assert response.status_code == 200
+    assert 'Error in timing callback' in caplog.text
+
+
+def test_timing__paginator(requests_mock, tmp_path):
+    """Paginated requests should also include time spent converting results to models"""
+    requests_mock.get(
+        f'{API_V1}/observations', json=SAMPLE_DATA['get_observations_page1'], status_code=200
+    )
+    session, timings = get_session(tmp_path)
+    client = iNatClient(session=session)
+    client.observations.search(user_id='test').next_page()
+
+    assert len(timings) == 1
+    assert timings[0].phases['model_conversion'] > 0
@@ -67,6 +67,20 @@ def test_lookup__doesnt_exist(requests_mock):
     assert annotations[1].term == '999'  # Unable to look up; use ID as placeholder
 
 
+def test_value_lookup(requests_mock):
+    requests_mock.get(
+        f'{API_V1}/controlled_terms',
+        json=SAMPLE_DATA['get_controlled_terms'],
+        status_code=200,
+    )
+    client = iNatClient()
+    term, value = client.annotations.value_lookup[(1, 2)]
+    assert term.label == 'Life Stage'
+    assert value.label == 'Adult'
+    assert client.annotations.value_lookup is client.annotations.value_lookup
+    assert requests_mock.call_count == 1
+
+
 def test_create(requests_mock):
     requests_mock.post(
         f'{API_V2}/annotations',
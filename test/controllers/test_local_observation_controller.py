@@ -0,0 +1,98 @@
+import pytest
+
+from pyinaturalist.controllers import LocalObservationController
+from pyinaturalist.models import Observation
+from pyinaturalist.store import ObservationStore
+from test.sample_data import SAMPLE_DATA
+
+
+def get_observation(id: int, **kwargs) -> dict:
+    return {
+        'id': id,
+        'created_at': f'2020-0{id}-01T12:00:00+00:00',
+        'updated_at': f'2021-0{id}-01T12:00:00+00:00',
+        'observed_on': f'2019-0{id}-15T09:00:00-07:00',
+        'quality_grade': 'research' if id % 2 else 'needs_id',
+        'captive': id == 5,
+        'license_code': 'cc-by',
+        'location': [id * 10.0, id * -10.0],
+        'place_ids': [1, id * 100],
+        'taxon': {'id': id * 10, 'ancestor_ids': [1, 2, id * 10]},
+        'user': {'id': id % 3, 'login': f'user_{id % 3}'},
+        **kwargs,
+    }
+
+
+OBSERVATIONS = [get_observation(id) for id in range(1, 8)] + [{'id': 8, 'quality_grade': 'casual'}]
+
+
+@pytest.fixture
+def local(tmp_path):
+    with ObservationStore(tmp_path / 'observations.db') as store:
+        store.upsert(Observation.from_json_list(OBSERVATIONS))
+        yield LocalObservationController(store)
+
+
+@pytest.mark.parametrize(
+    'params, expected_ids',
+    [
+        ({}, [1, 2, 3, 4, 5, 6, 7, 8]),
+        ({'id': [2, 3, 9]}, [2, 3]),
+        ({'not_id': '2,3'}, [1, 4, 5, 6, 7, 8]),
+        ({'id_above': 6}, [7, 8]),
+        ({'taxon_id': 30}, [3]),
+        ({'taxon_id': 2}, [1, 2, 3, 4, 5, 6, 7]),
+        ({'without_taxon_id': [10, 20]}, [3, 4, 5, 6, 7, 8]),
+        ({'user_id': 1}, [1, 4, 7]),
+        ({'user_id': 'user_2'}, [2, 5]),
+        ({'user_id': [1, 'user_2']}, [1, 2, 4, 5, 7]),
+        ({'user_login': 'user_0'}, [3, 6]),
+        ({'place_id': 300}, [3]),
+        ({'place_id': [1, 999]}, [1, 2, 3, 4, 5, 6, 7]),
+        ({'swlat': 25, 'swlng': -55, 'nelat': 55, 'nelng': 0}, [3, 4, 5]),
+        ({'geo': False}, [8]),
+        ({'d1': '2019-03-15', 'd2': '2019-05-15'}, [3, 4, 5]),
+        ({'observed_on': '2019-02-15'}, [2]),
+        ({'year': 2019, 'month': [1, 2]}, [1, 2]),
+        ({'created_d1': '2020-06-01', 'created_d2': '2020-07-01'}, [6, 7]),
+        ({'created_on': '2020-04-01'}, [4]),
+        ({'updated_since': '2021-07-01T00:00:00+00:00'}, [7]),
+        ({'quality_grade': 'needs_id'}, [2, 4, 6]),
+        ({'verifiable': False}, [8]),
+        ({'captive': True}, [5]),
+        ({'license': 'cc-by', 'captive': 'false'}, [1, 2, 3, 4, 6, 7]),
+    ],
+)
+def test_search(local, params, expected_ids):
+    assert [obs.id for obs in local.search(**params)] == expected_ids
+
+
+def test_search__pagination(local):
+    query = local.search(quality_grade='research', per_page=2)
+    assert query.count() == 4
+    assert [obs.id for obs in query.next_page()] == [1, 3]
+    assert [obs.id for obs in query.next_page()] == [5, 7]
+    assert query.next_page() == []
+
+    assert [obs.id for obs in local.search(order='desc', limit=3)] == [8, 7, 6]
+
+
+def test_search__unsupported_params(local):
+    with pytest.raises(ValueError, match='photos, q'):
+        local.search(q='butterfly', photos=True)
+
+
+def test_from_ids(local):
+    assert local(3).id == 3
+    assert local(100) is None
+    assert [obs.id for obs in local.from_ids([3, 5, 100]).all()] == [3, 5]
+
+
+def test_search__sample_data(tmp_path):
+    """Search on real observation data, including place IDs and taxon ancestors"""
+    with ObservationStore(tmp_path / 'observations.db') as store:
+        store.upsert(Observation.from_json_list(SAMPLE_DATA['get_observations_page1']))
+        local = LocalObservationController(store)
+        results = local.search(taxon_id=47224, place_id=7953, user_id='samroom').all()
+        assert [obs.id for obs in results] == [57754375]
+        assert results[0].taxon.name == 'Danaus plexippus'
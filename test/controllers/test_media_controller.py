@@ -0,0 +1,16 @@
+import re
+
+from pyinaturalist.client import iNatClient
+from pyinaturalist.models import Observation
+from test.sample_data import j_observation_1
+
+
+def test_download(requests_mock, tmp_path):
+    """Observations should be expanded into their photos and sounds"""
+    requests_mock.get(re.compile(r'https://static\.inaturalist\.org/photos/.*'), content=b'photo')
+    observation = Observation.from_json(j_observation_1)
+
+    report = iNatClient().media.download([observation], dest=tmp_path, size='small')
+    assert report.summary == '2 files: 2 downloaded, 0 resumed, 0 skipped, 0 failed'
+    assert [r.item.id for r in report] == [p.id for p in observation.photos]
+    assert (tmp_path / f'{observation.photos[0].id}_small.jpeg').read_bytes() == b'photo'
@@ -1,12 +1,21 @@
 # ruff: noqa: F403, F405
-from datetime import datetime
+import re
+from copy import deepcopy
+from datetime import date, datetime, timedelta, timezone
+from inspect import signature
 from io import BytesIO
 from unittest.mock import patch
 
+import pytest
+from dateutil.parser import parse as parse_date
 from dateutil.tz import tzutc
 
 from pyinaturalist.client import iNatClient
-from pyinaturalist.constants import API_V1
+from pyinaturalist.constants import API_V1, API_V2
+from pyinaturalist.controllers.observation_controller import (
+    _merge_histograms,
+    _split_histogram_params,
+)
 from pyinaturalist.models import (
     Annotation,
     ConservationStatus,
@@ -20,6 +29,7 @@ from pyinaturalist.models import (
     TaxonSummary,
     User,
 )
+from pyinaturalist.store import ObservationStore
 from test.sample_data import *
 
 
@@ -125,6 +135,186 @@ def test_search__descending(requests_mock):
     assert results[1].id == 50
 
 
+def test_search_tiled(requests_mock):
+    """The bounding box should be split until each tile is under the result threshold, and each
+    tile should be paginated with the original search params
+    """
+
+    def respond(request, context):
+        swlat = float(request.qs['swlat'][0])
+        swlng = float(request.qs['swlng'][0])
+        is_whole_area = swlat == 0 and swlng == 0 and request.qs['nelat'] == ['40.0']
+        if request.qs['per_page'] == ['0']:
+            return {'total_results': 300 if is_whole_area else 100, 'results': []}
+        # Return one observation per tile, with one duplicate on a tile edge
+        obs_id = int(swlat + swlng / 20) + 1
+        return {'total_results': 1, 'results': [{'id': min(obs_id, 2)}]}
+
+    requests_mock.get(f'{API_V1}/observations', json=respond)
+    paginator = iNatClient().observations.search_tiled(
+        taxon_id=47792, swlat=0, swlng=0, nelat=40, nelng=40, max_tile_results=200
+    )
+    results = paginator.all()
+
+    assert [bbox for bbox, _ in paginator.get_tiles()] == [
+        (0, 0, 20, 20),
+        (0, 20, 20, 40),
+        (20, 0, 40, 20),
+        (20, 20, 40, 40),
+    ]
+    assert sorted(obs.id for obs in results) == [1, 2]
+    assert all('taxon_id=47792' in request.url for request in requests_mock.request_history)
+
+
+def test_search_tiled__max_depth(requests_mock):
+    """Tiles should not be split past max_depth"""
+    requests_mock.get(f'{API_V1}/observations', json={'total_results': 300, 'results': []})
+    paginator = iNatClient().observations.search_tiled(
+        swlat=0, swlng=0, nelat=40, nelng=40, max_tile_results=200, max_depth=1
+    )
+    assert paginator.max_depth == 1
+    assert len(paginator.get_tiles()) == 4
+
+
+def mock_sync_server(requests_mock, observations: dict[int, str]):
+    """Respond to observation searches (v1 for full records, and v2 for IDs only) with
+    observations from a dict of ``{id: updated_at}``, which can be modified between requests
+    """
+
+    def filter_observations(params) -> dict:
+        ids = sorted(observations)
+        if params.get('id'):
+            ids = [id for id in ids if str(id) in str(params['id']).split(',')]
+        if params.get('updated_since'):
+            updated_since = parse_date(params['updated_since'])
+            ids = [id for id in ids if parse_date(observations[id]) >= updated_since]
+        ids = [id for id in ids if id > int(params.get('id_above') or 0)]
+        results = [{'id': id, 'updated_at': observations[id]} for id in ids]
+        return {'total_results': len(results), 'results': results[: int(params['per_page'])]}
+
+    requests_mock.get(
+        f'{API_V1}/observations',
+        json=lambda request, context: filter_observations({k: v[0] for k, v in request.qs.items()}),
+    )
+    requests_mock.get(
+        re.compile(rf'{API_V1}/observations/[\d,]+'),
+        json=lambda request, context: filter_observations(
+            {'id': request.path.split('/')[-1], 'per_page': 200}
+        ),
+    )
+    requests_mock.post(
+        f'{API_V2}/observations',
+        json=lambda request, context: filter_observations(
+            {**request.json(), 'per_page': request.qs['per_page'][0]}
+        ),
+    )
+
+
+def test_sync(requests_mock, tmp_path):
+    observations = dict.fromkeys(range(1, 11), '2020-01-01T00:00:00+00:00')
+    mock_sync_server(requests_mock, observations)
+    client = iNatClient()
+
+    with ObservationStore(tmp_path / 'observations.db') as store:
+        result = client.observations.sync(store, taxon_id=1, per_page=3)
+        assert (result.new, result.updated, result.deleted, result.reconciled) == (10, 0, 0, True)
+        assert store.ids(result.query_key) == set(observations)
+        state = store.get_sync_state(result.query_key)
+        assert state.updated_since == datetime(2020, 1, 1, tzinfo=timezone.utc)
+        assert state.max_id == 10
+
+        # Next sync should only request updated observations, and reconciliation isn't due yet
+        observations[3] = observations[11] = '2021-01-01T00:00:00+00:00'
+        requests_mock.reset_mock()
+        result = client.observations.sync(store, taxon_id=1, per_page=3)
+        assert (result.new, result.updated, result.deleted, result.reconciled) == (1, 1, 0, False)
+        assert 'updated_since=2020-01-01' in requests_mock.request_history[0].url
+        assert not any(request.method == 'POST' for request in requests_mock.request_history)
+        assert store.get(3).updated_at == datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def test_sync__reconcile(requests_mock, tmp_path):
+    """Reconciliation should remove observations that no longer match, and fetch any that are
+    missing locally
+    """
+    observations = dict.fromkeys(range(1, 6), '2020-01-01T00:00:00+00:00')
+    mock_sync_server(requests_mock, observations)
+    client = iNatClient()
+
+    with ObservationStore(tmp_path / 'observations.db') as store:
+        result = client.observations.sync(store, taxon_id=1, reconcile=False)
+        assert result.reconciled is False
+
+        # Observation 6 was updated before the last high-water mark, so only reconciling finds it
+        del observations[2]
+        observations[6] = '2019-01-01T00:00:00+00:00'
+        result = client.observations.sync(store, taxon_id=1)
+        assert (result.new, result.updated, result.deleted, result.reconciled) == (1, 0, 1, True)
+        assert store.ids() == {1, 3, 4, 5, 6}
+
+
+def test_sync__updated_since(requests_mock, tmp_path):
+    """If updated_since is passed, the later of that and the last sync's high-water mark is used"""
+    observations = {1: '2019-01-01T00:00:00+00:00', 2: '2020-01-01T00:00:00+00:00'}
+    mock_sync_server(requests_mock, observations)
+    client = iNatClient()
+
+    with ObservationStore(tmp_path / 'observations.db') as store:
+        result = client.observations.sync(
+            store, taxon_id=1, updated_since='2019-06-01', reconcile=False
+        )
+        assert result.new == 1
+        assert store.ids() == {2}
+        assert 'updated_since=2019-06-01' in requests_mock.request_history[0].url
+
+        requests_mock.reset_mock()
+        client.observations.sync(store, taxon_id=1, updated_since='2019-06-01', reconcile=False)
+        assert 'updated_since=2020-01-01' in requests_mock.request_history[0].url
+
+        requests_mock.reset_mock()
+        client.observations.sync(store, taxon_id=1, updated_since='2021-01-01', reconcile=False)
+        assert 'updated_since=2021-01-01' in requests_mock.request_history[0].url
+
+
+def test_sync__fields(tmp_path):
+    with ObservationStore(tmp_path / 'observations.db') as store, pytest.raises(ValueError):
+        iNatClient().observations.sync(store, fields=['id'])
+
+
+def test_search__fields(requests_mock):
+    """Selecting fields should use the v2 API, with dot notation converted to nested fields"""
+    page_1 = {
+        'results': [{'id': 100, 'taxon': {'id': 48662}, 'location': '50.646894,-104.7686'}],
+        'total_results': 2,
+    }
+    page_2 = {
+        'results': [{'id': 150, 'taxon': {'id': 48662}, 'location': '50.646894,-104.7686'}],
+        'total_results': 2,
+    }
+    requests_mock.post(
+        f'{API_V2}/observations',
+        [
+            {'json': page_1, 'status_code': 200},
+            {'json': page_2, 'status_code': 200},
+        ],
+    )
+
+    results = (
+        iNatClient().observations.search(place_id=7953, fields=['taxon.id', 'location'], per_page=1)
+    ).all()
+
+    first_request = requests_mock.request_history[0]
+    assert first_request.headers['X-HTTP-Method-Override'] == 'GET'
+    assert first_request.json()['fields'] == {'taxon': {'id': True}, 'location': True, 'id': True}
+    assert requests_mock.request_history[1].json()['id_above'] == 100
+
+    assert len(results) == 2
+    assert isinstance(results[0], Observation)
+    assert results[1].id == 150
+    assert results[0].taxon.id == 48662
+    assert results[0].location == (50.646894, -104.7686)
+
+
 def test_search__with_ofvs(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations',
@@ -163,6 +353,38 @@ def test_search__with_annotations(requests_mock):
     assert annotation.controlled_value.label == 'Adult'
 
 
+def test_search__with_annotations__multiple_observations(requests_mock):
+    """Annotations for a whole page of observations should be looked up at once"""
+    obs_1 = deepcopy(SAMPLE_DATA['get_observation_with_ofvs']['results'][0])
+    obs_2 = deepcopy(obs_1)
+    obs_2['id'] += 1
+    obs_2['annotations'] = []
+    obs_3 = deepcopy(obs_1)
+    obs_3['id'] += 2
+    obs_3['annotations'][0]['controlled_value_id'] = 999
+    requests_mock.get(
+        f'{API_V1}/observations',
+        [
+            {'json': {'results': [obs_1, obs_2, obs_3], 'total_results': 3}, 'status_code': 200},
+            {'json': {'results': [], 'total_results': 3}, 'status_code': 200},
+        ],
+    )
+    requests_mock.get(
+        f'{API_V1}/controlled_terms',
+        json=SAMPLE_DATA['get_controlled_terms'],
+        status_code=200,
+    )
+    client = iNatClient()
+    with patch.object(client.annotations, 'lookup', wraps=client.annotations.lookup) as mock_lookup:
+        results = client.observations.search().all()
+
+    assert mock_lookup.call_count == 1
+    assert [len(obs.annotations) for obs in results] == [3, 0, 3]
+    assert results[0].annotations[0].value == 'Adult'
+    assert results[2].annotations[0].term == 'Life Stage'
+    assert not results[2].annotations[0].controlled_value
+
+
 def test_histogram(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations/histogram',
@@ -176,6 +398,115 @@ def test_histogram(requests_mock):
     assert results.raw[datetime(2020, 1, 1, 0, 0)] == 11
 
 
+def mock_histogram_server(requests_mock):
+    """Respond with a count of 1 per day between d1 and d2, plus the taxon ID if specified"""
+
+    def respond(request, context):
+        params = {k: v[0] for k, v in request.qs.items()}
+        d1, d2 = parse_date(params['d1']).date(), parse_date(params['d2']).date()
+        count = 1 + int(params.get('taxon_id', 0))
+        days = (d1 + timedelta(days=i) for i in range((d2 - d1).days + 1))
+        return {'results': {'day': {day.isoformat(): count for day in days}}}
+
+    requests_mock.get(f'{API_V1}/observations/histogram', json=respond)
+
+
+def test_histogram__split_date_range(requests_mock):
+    """A long date range should be split into multiple requests, and combined into one histogram"""
+    mock_histogram_server(requests_mock)
+    results = iNatClient().observations.histogram(interval='day', d1='2019-01-01', d2='2021-06-30')
+
+    assert requests_mock.call_count == 3
+    assert len(results) == (date(2021, 6, 30) - date(2019, 1, 1)).days + 1
+    assert {bin.count for bin in results} == {1}
+    assert results[0].label == datetime(2019, 1, 1)
+    assert results[-1].label == datetime(2021, 6, 30)
+    assert [bin.label for bin in results] == sorted(bin.label for bin in results)
+
+
+def test_histogram__split_date_range__date_objects(requests_mock):
+    """Split date ranges should not overlap, so each bin at a range boundary is counted once"""
+    mock_histogram_server(requests_mock)
+    results = iNatClient().observations.histogram(
+        interval='day', d1=date(2018, 1, 1), d2=date(2019, 12, 31)
+    )
+
+    assert requests_mock.call_count == 2
+    assert len(results) == (date(2019, 12, 31) - date(2018, 1, 1)).days + 1
+    assert results.raw[datetime(2019, 1, 1)] == 1
+    assert {bin.count for bin in results} == {1}
+
+
+def test_histogram__split_params__datetimes():
+    """Split datetime ranges should end one second before the next range starts"""
+    params = _split_histogram_params(
+        {'interval': 'hour', 'd1': '2020-01-01', 'd2': '2020-01-10T12:00:00'}
+    )
+
+    assert [(p['d1'], p['d2']) for p in params] == [
+        ('2020-01-01', datetime(2020, 1, 7, 23, 59, 59)),
+        (datetime(2020, 1, 8), '2020-01-10T12:00:00'),
+    ]
+
+
+def test_histogram__no_split(requests_mock):
+    """Other intervals and open-ended date ranges should only send one request"""
+    mock_histogram_server(requests_mock)
+    client = iNatClient()
+    client.observations.histogram(interval='month', d1='2019-01-01', d2='2021-06-30')
+    client.observations.histogram(interval='day', d1='2019-01-01', d2='2019-02-01')
+    assert requests_mock.call_count == 2
+
+
+def test_histogram__merge_overlapping_bins():
+    """Bins included in multiple results should have their counts added together"""
+    results = [
+        {'week': {'2020-12-21': 1, '2020-12-28': 2}},
+        {'week': {'2020-12-28': 3, '2021-01-04': 4}},
+    ]
+    assert _merge_histograms(results) == {
+        'week': {'2020-12-21': 1, '2020-12-28': 5, '2021-01-04': 4}
+    }
+
+
+def test_histogram_matrix(requests_mock):
+    mock_histogram_server(requests_mock)
+    matrix = iNatClient().observations.histogram_matrix(
+        taxon_ids=[1, 2, 3], interval='day', d1='2019-06-01', d2='2020-06-30'
+    )
+
+    # Each date range split is sent separately for each taxon
+    assert requests_mock.call_count == 6
+    assert matrix.ids == [1, 2, 3]
+    assert matrix.id_field == 'taxon_id'
+    n_days = (date(2020, 6, 30) - date(2019, 6, 1)).days + 1
+    assert len(matrix.labels) == n_days
+    assert matrix.counts == [[2] * n_days, [3] * n_days, [4] * n_days]
+
+
+def test_histogram_matrix__invalid_params():
+    with pytest.raises(ValueError):
+        iNatClient().observations.histogram_matrix(interval='day')
+    with pytest.raises(ValueError):
+        iNatClient().observations.histogram_matrix(taxon_ids=[1], place_ids=[2])
+
+
+@pytest.mark.parametrize(
+    'method, expected_params',
+    [
+        ('histogram', {'interval', 'max_workers'}),
+        ('identifiers', {'partition', 'max_workers'}),
+        ('observers', {'partition', 'max_workers'}),
+        ('species_counts', {'max_workers'}),
+    ],
+)
+def test_controller_signatures(method, expected_params):
+    """Controller-specific args should be kept in the copied signatures and docstrings"""
+    func = getattr(iNatClient().observations, method)
+    assert expected_params <= set(signature(func).parameters)
+    assert all(f'{param}:' in func.__doc__ for param in expected_params)
+
+
 def test_identifiers(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations/identifiers',
@@ -205,6 +536,86 @@ def test_observers(requests_mock):
     assert results[0].species_count == 1230
 
 
+def mock_user_counts_server(requests_mock, endpoint, observations, max_results=5):
+    """Respond with user counts for observations created within the requested date range, with
+    only the first ``max_results`` users returned
+    """
+
+    def respond(request, context):
+        params = {k: v[0] for k, v in request.qs.items()}
+        d1, d2 = parse_date(params['created_d1']), parse_date(params['created_d2'])
+        counts: dict[int, int] = {}
+        for user_id, created_at in observations:
+            if d1 <= created_at <= d2:
+                counts[user_id] = counts.get(user_id, 0) + 1
+        results = [
+            {'user': {'id': user_id}, 'count': count, 'observation_count': count}
+            for user_id, count in sorted(counts.items(), key=lambda x: -x[1])
+        ]
+        return {'total_results': len(results), 'results': results[:max_results]}
+
+    requests_mock.get(f'{API_V1}/observations/{endpoint}', json=respond)
+
+
+@pytest.mark.parametrize('endpoint', ['identifiers', 'observers'])
+def test_user_counts__partition(requests_mock, endpoint):
+    """Partitions with too many results should be split until all results are returned, and
+    then combined by user
+    """
+    # 20 users with 1-4 observations each, spread across 10 years
+    start = datetime(2010, 1, 1, tzinfo=timezone.utc)
+    observations = [
+        (user_id, start + timedelta(days=37 * (user_id * 4 + i)))
+        for user_id in range(1, 21)
+        for i in range(user_id % 4 + 1)
+    ]
+    mock_user_counts_server(requests_mock, endpoint, observations)
+
+    request_method = getattr(iNatClient().observations, endpoint)
+    results = request_method(place_id=1, partition=True, created_d1=start)
+    assert len(results) == 20
+    assert requests_mock.call_count > 4
+    assert {user.id: user.count for user in results} == {
+        user_id: user_id % 4 + 1 for user_id in range(1, 21)
+    }
+    assert [user.count for user in results] == sorted(
+        (user.count for user in results), reverse=True
+    )
+
+
+def test_user_counts__partition_per_page(requests_mock):
+    """Partitions should request the max number of results, regardless of the requested page size,
+    and a date-only created_d2 should include that whole day
+    """
+    created_at = datetime(2020, 1, 2, 12, tzinfo=timezone.utc)
+    observations = [(user_id, created_at) for user_id in range(1, 11)]
+    mock_user_counts_server(requests_mock, 'observers', observations, max_results=500)
+
+    results = iNatClient().observations.observers(
+        partition=True, per_page=5, created_d1='2020-01-01', created_d2='2020-01-02'
+    )
+    assert len(results) == 10
+    assert requests_mock.call_count == 1
+    request = requests_mock.request_history[0]
+    assert request.qs['per_page'] == ['500']
+    assert parse_date(request.qs['created_d2'][0]) == datetime(
+        2020, 1, 2, 23, 59, 59, 999000, tzinfo=timezone.utc
+    )
+
+
+def test_user_counts__partition_min_duration(requests_mock, caplog):
+    """If a partition can't be split any further, incomplete results should be returned"""
+    created_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    observations = [(user_id, created_at) for user_id in range(1, 11)]
+    mock_user_counts_server(requests_mock, 'observers', observations)
+
+    results = iNatClient().observations.observers(
+        partition=True, created_d1='2020-01-01', created_d2='2020-01-02'
+    )
+    assert len(results) == 5
+    assert 'incomplete' in caplog.text
+
+
 def test_life_list(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations/taxonomy',
@@ -292,6 +703,26 @@ def test_species_counts(requests_mock):
     assert results[0].count == results.get_count(48484) == 31
 
 
+def test_species_counts__all_pages(requests_mock):
+    """With page='all', all remaining pages should be fetched and combined after the first page,
+    and any duplicates across pages removed
+    """
+    page_1 = SAMPLE_DATA['get_all_observation_species_counts_page1']
+    page_2 = deepcopy(SAMPLE_DATA['get_all_observation_species_counts_page2'])
+    page_2['results'].append(page_1['results'][-1])
+    requests_mock.get(
+        f'{API_V1}/observations/species_counts',
+        [{'json': page_1, 'status_code': 200}, {'json': page_2, 'status_code': 200}],
+    )
+    results = iNatClient().observations.species_counts(user_id='username', page='all', per_page=13)
+
+    assert isinstance(results, TaxonCounts)
+    assert requests_mock.call_count == 2
+    assert requests_mock.request_history[1].qs['page'] == ['2']
+    assert len(results) == len(results.id_map) == 22
+    assert results[0].id == 27805 and results[0].count == 19
+
+
 def test_taxon_summary__with_conservation_status(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations/89238647/taxon_summary',
@@ -327,6 +758,31 @@ def test_taxon_summary__with_listed_taxon(requests_mock):
     assert 'western honey bee' in results.wikipedia_summary
 
 
+@patch('pyinaturalist.controllers.observation_controller.create_observations')
+def test_create_bulk(mock_create_observations):
+    client = iNatClient()
+    observations = [{'species_guess': 'Pieris rapae'}]
+    client.observations.create_bulk(observations, max_workers=2, access_token='token')
+
+    kwargs = mock_create_observations.call_args[1]
+    assert kwargs['observations'] == observations
+    assert kwargs['max_workers'] == 2
+    assert kwargs['access_token'] == 'token'
+
+
+@patch('pyinaturalist.controllers.observation_controller.upload_bulk')
+def test_upload_bulk(mock_upload_bulk):
+    client = iNatClient()
+    client._access_token = 'token'
+    uploads = [('uuid-1', ['photo_1.jpg', 'photo_2.jpg'])]
+    client.observations.upload_bulk(uploads, max_workers=2, access_token='token')
+
+    kwargs = mock_upload_bulk.call_args[1]
+    assert kwargs['uploads'] == uploads
+    assert kwargs['max_workers'] == 2
+    assert kwargs['session'] is client.session
+
+
 @patch('pyinaturalist.client.client.get_access_token', return_value='token')
 @patch('pyinaturalist.v1.observations.update_observation')
 def test_upload(mock_update_observation, mock_get_access_token, requests_mock):
@@ -32,6 +32,7 @@ from pyinaturalist.constants import (
     Source,
 )
 from pyinaturalist.docs import (
+    LazySignature,
     copy_doc_signature,
     document_controller_params,
     document_request_params,
@@ -224,6 +225,34 @@ def test_document_controller_params():
     assert 'per_page' not in sig.parameters
 
 
+def test_lazy_signature():
+    """Signatures should only be built when first accessed"""
+    template_calls = []
+
+    def template(param_1: str | None = None):
+        template_calls.append(1)
+
+    @copy_doc_signature(template)
+    def target_function(**kwargs):
+        """Target function description."""
+
+    assert isinstance(target_function.__signature__, LazySignature)
+    assert template_calls == []
+    assert list(inspect.signature(target_function).parameters) == ['param_1', 'kwargs']
+    assert str(inspect.signature(target_function)) == '(param_1: str | None = None, **kwargs)'
+
+
+def test_lazy_signature__failure():
+    """If a signature can't be built, the original signature should be used"""
+
+    def factory():
+        raise ValueError()
+
+    sig = LazySignature(factory, default=inspect.signature(lambda x, y=1: None))
+    assert list(sig.parameters) == ['x', 'y']
+    assert list(sig.replace(return_annotation=int).parameters) == ['x', 'y']
+
+
 def test_invalid_template_function():
     """Test behavior with invalid template functions."""
 
@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+"""A local stand-in for the iNaturalist API, for load testing and benchmarking the client without
+sending requests to the real API. Responses are built from ``test/sample_data``, and can be
+configured to simulate slow or unreliable responses:
+
+* Paginated observation and taxon searches, by page or by ID range, with any number of total results
+* Taxa and places by ID
+* Controlled terms
+* Observation creation and media uploads (request bodies are read and discarded)
+* Fixed latency per response
+* Random server errors, rate-limiting errors (429), and truncated JSON responses
+
+Failures are randomly chosen with a fixed seed, so a given sequence of requests always gets the same
+sequence of responses.
+
+Example:
+    >>> with ReplayServer(total_results=5000, error_rate=0.05) as server:
+    ...     session = server.mount(ClientSession(cache_file=':memory:'))
+    ...     client = iNatClient(session=session)
+    ...     observations = client.observations.search(taxon_id=3).all()
+
+Or run as a standalone server, and point another client at it::
+
+    python -m test.replay_server --port 8000 --latency 0.2 --error-rate 0.1
+"""
+
+import json
+import random
+import threading
+from argparse import ArgumentParser
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+from time import sleep
+from urllib.parse import parse_qs, urlsplit
+from uuid import UUID
+
+from requests.adapters import HTTPAdapter
+
+from pyinaturalist.client import ClientSession
+from pyinaturalist.constants import API_V1, PER_PAGE_RESULTS
+from test.sample_data import load_sample_data
+
+API_HOST = 'https://api.inaturalist.org'
+CHUNK_SIZE = 64 * 1024
+ERROR_STATUSES = (500, 502, 503)
+
+logger = getLogger(__name__)
+
+# Templates for generated records
+OBSERVATION_V1 = load_sample_data('v1/get_observations_page1.json')['results'][0]
+OBSERVATION_V2 = load_sample_data('v2/get_observations_full.json')['results'][0]
+PLACE = load_sample_data('v1/get_places_by_id.json')['results'][0]
+TAXON = load_sample_data('v1/get_taxa.json')['results'][0]
+
+# Complete responses returned as-is
+CONTROLLED_TERMS = load_sample_data('v1/get_controlled_terms.json')
+CREATE_OBSERVATION = load_sample_data('v2/create_observation.json')
+UPLOAD_MEDIA_V1 = load_sample_data('v1/upload_photos.json')
+UPLOAD_MEDIA_V2 = load_sample_data('v2/post_observation_media.json')
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Local HTTP server that emulates a subset of the iNaturalist API
+
+    Args:
+        port: Port to listen on; by default, a random free port is used
+        latency: Number of seconds to wait before sending each response
+        error_rate: Fraction of requests that fail with a server error (500, 502, or 503)
+        ratelimit_rate: Fraction of requests that fail with ``429 Too Many Requests``
+        truncate_rate: Fraction of responses with truncated (invalid) JSON
+        total_results: Total number of results available from paginated endpoints
+        seed: Random seed used to choose which requests fail
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        ratelimit_rate: float = 0.0,
+        truncate_rate: float = 0.0,
+        total_results: int = 1000,
+        seed: int = 0,
+    ):
+        super().__init__(('127.0.0.1', port), ReplayHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.ratelimit_rate = ratelimit_rate
+        self.truncate_rate = truncate_rate
+        self.total_results = total_results
+        self.stats: Counter = Counter()
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'  # type: ignore[str-bytes-safe]
+
+    def start(self) -> 'ReplayServer':
+        """Start the server in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f'Replay server started on {self.url}')
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def mount(self, session: ClientSession) -> ClientSession:
+        """Send all API requests from a session to this server instead, with the session's retry
+        and connection pool settings
+        """
+        adapter = ReplayAdapter(self.url, max_retries=session.retries, **session.pool_settings)
+        session.mount(API_HOST, adapter)
+        return session
+
+    def choose_fault(self) -> str | None:
+        """Randomly choose a type of failure to simulate for a request, if any"""
+        with self._lock:
+            value = self._random.random()
+        for fault, rate in [
+            ('ratelimit', self.ratelimit_rate),
+            ('error', self.error_rate),
+            ('truncate', self.truncate_rate),
+        ]:
+            if value < rate:
+                return fault
+            value -= rate
+        return None
+
+    def choose_error_status(self) -> int:
+        with self._lock:
+            return self._random.choice(ERROR_STATUSES)
+
+    def record(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that redirects API requests to a local server"""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        # Copy the request, so the original URL is kept if the session needs to resend it
+        request = request.copy()
+        request.url = request.url.replace(API_HOST, self.base_url, 1)
+        return super().send(request, **kwargs)
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Request handler that builds API responses from sample data"""
+
+    server: ReplayServer
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        """Count new connections, to check connection reuse"""
+        super().setup()
+        with self.server._lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        path, params = self._parse_url()
+        total = self.server.total_results
+        segments = path.strip('/').split('/')
+
+        if path in ('/v1/observations', '/v2/observations'):
+            template = OBSERVATION_V2 if path.startswith('/v2') else OBSERVATION_V1
+            self._respond(_paginate(template, params, total))
+        elif path in ('/v1/taxa', '/v2/taxa'):
+            self._respond(_paginate(TAXON, params, total))
+        elif len(segments) == 3 and segments[1] in ('observations', 'places', 'taxa'):
+            template = {'observations': OBSERVATION_V1, 'places': PLACE, 'taxa': TAXON}
+            ids = [int(i) for i in segments[2].split(',')]
+            self._respond(_get_by_id(template[segments[1]], ids))
+        elif path == '/v1/controlled_terms':
+            self._respond(CONTROLLED_TERMS)
+        else:
+            self._respond({'error': f'Not found: {path}'}, status=404)
+
+    def do_POST(self):
+        path, _ = self._parse_url()
+        self._read_body()
+
+        if path == '/v2/observations':
+            self._respond(CREATE_OBSERVATION)
+        elif path in ('/v2/observation_photos', '/v2/observation_sounds'):
+            self._respond(UPLOAD_MEDIA_V2)
+        elif path in ('/v1/observation_photos', '/v1/observation_sounds'):
+            self._respond(UPLOAD_MEDIA_V1)
+        else:
+            self._respond({'error': f'Not found: {path}'}, status=404)
+
+    def _parse_url(self) -> tuple[str, dict[str, str]]:
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        return url.path, params
+
+    def _read_body(self):
+        """Read and discard the request body"""
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining > 0 and (chunk := self.rfile.read(min(CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+
+    def _respond(self, response_json, status: int = 200):
+        if self.server.latency:
+            sleep(self.server.latency)
+
+        body = json.dumps(response_json).encode()
+        fault = self.server.choose_fault() if status == 200 else None
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        if fault == 'ratelimit':
+            status, body = 429, b'{"error": "Too Many Requests"}'
+        elif fault == 'error':
+            status = self.server.choose_error_status()
+            body = b'{"error": "Internal Server Error"}'
+        elif fault == 'truncate':
+            body = body[: len(body) // 2]
+        self.server.record(fault or str(status))
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt: str, *args):
+        logger.debug(fmt, *args)
+
+
+def _paginate(template: dict, params: dict[str, str], total: int) -> dict:
+    """Get a page of generated records, using either page numbers or ID ranges"""
+    per_page = min(int(params.get('per_page', 30)), PER_PAGE_RESULTS)
+    page = int(params.get('page', 1))
+    ids = range(1, total + 1)
+    if 'id_above' in params:
+        ids = range(int(params['id_above']) + 1, total + 1)
+    if 'id_below' in params:
+        ids = range(1, min(int(params['id_below']), total + 1))
+    if params.get('order') == 'desc':
+        ids = ids[::-1]
+
+    page_ids = ids[(page - 1) * per_page : page * per_page]
+    return {
+        'total_results': len(ids),
+        'page': page,
+        'per_page': per_page,
+        'results': [_make_record(template, i) for i in page_ids],
+    }
+
+
+def _get_by_id(template: dict, ids: list[int]) -> dict:
+    results = [_make_record(template, i) for i in ids]
+    return {'total_results': len(results), 'page': 1, 'per_page': len(results), 'results': results}
+
+
+def _make_record(template: dict, id: int) -> dict:
+    record = {**template, 'id': id}
+    if 'uuid' in template:
+        record['uuid'] = str(UUID(int=id))
+    return record
+
+
+def main():
+    parser = ArgumentParser(description='Run a local stand-in for the iNaturalist API')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--ratelimit-rate', type=float, default=0.0)
+    parser.add_argument('--truncate-rate', type=float, default=0.0)
+    parser.add_argument('--total-results', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = ReplayServer(**vars(args))
+    print(f'Serving on {server.url}; for example: {server.url}{API_V1[len(API_HOST) :]}/taxa/1')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
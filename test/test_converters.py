@@ -53,7 +53,9 @@ def test_ensure_file_obj__path():
         temp.seek(0)
 
         file_obj = ensure_file_obj(temp.name)
+        assert not isinstance(file_obj, BytesIO)
         assert file_obj.read() == b'test content'
+        file_obj.close()
     os.remove(temp.name)
 
 
@@ -0,0 +1,99 @@
+import subprocess
+import sys
+
+import pytest
+
+import pyinat
+import pyinaturalist
+
+
+def test_lazy_import():
+    """Importing the top-level package should not import any modules with heavy dependencies"""
+    code = (
+        'import sys, pyinaturalist, pyinat; '
+        'print(",".join(m for m in sys.modules if m.startswith(("pyinaturalist.", "rich", "requests"))))'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip().split(',') == ['pyinaturalist.constants']
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'pyinaturalist.client',
+        'pyinaturalist.controllers',
+        'pyinaturalist.controllers.observation_controller',
+        'pyinaturalist.models',
+        'pyinaturalist.store',
+        'pyinaturalist.v0',
+        'pyinaturalist.v1',
+        'pyinaturalist.v2',
+    ],
+)
+def test_import_submodule_first(module):
+    """Any subpackage should be importable on its own in a fresh interpreter, without circular
+    import errors
+    """
+    subprocess.run([sys.executable, '-c', f'import {module}'], capture_output=True, check=True)
+
+
+@pytest.mark.parametrize(
+    'name, module',
+    [
+        ('iNatClient', 'pyinaturalist.client.client'),
+        ('Observation', 'pyinaturalist.models.observation'),
+        ('pprint', 'pyinaturalist.formatters'),
+        ('get_observations', 'pyinaturalist.v1.observations'),
+        ('get_observations_v2', 'pyinaturalist.v2.observations'),
+        ('get_observations_v0', 'pyinaturalist.v0.observations'),
+    ],
+)
+def test_getattr(name, module):
+    assert getattr(pyinaturalist, name).__module__ == module
+    assert getattr(pyinat, name) is getattr(pyinaturalist, name)
+
+
+def test_getattr__submodule():
+    assert pyinaturalist.converters.__name__ == 'pyinaturalist.converters'
+
+
+def test_getattr__invalid():
+    with pytest.raises(AttributeError):
+        pyinaturalist.__getattr__('not_a_real_name')
+    with pytest.raises(AttributeError):
+        pyinat.__getattr__('not_a_real_name')
+
+
+def test_all():
+    assert {'API_V1', 'iNatClient', 'Observation', 'get_observations', 'upload_v2'} <= set(
+        pyinaturalist.__all__
+    )
+    assert set(pyinaturalist.__all__) <= set(dir(pyinaturalist))
+
+
+def test_baseline_names():
+    """All names should resolve to the same objects as with eager star imports"""
+    namespace: dict = {}
+    exec(
+        'from pyinaturalist.client import *\n'
+        'from pyinaturalist.constants import *\n'
+        'from pyinaturalist.formatters import enable_logging, format_table, pprint, pprint_tree\n'
+        'from pyinaturalist.models import *\n'
+        'from pyinaturalist.request_params import get_interval_ranges\n'
+        'from pyinaturalist.v0 import *\n'
+        'from pyinaturalist.v2 import *\n'
+        'from pyinaturalist.v1 import *\n',
+        namespace,
+    )
+    names = [name for name in namespace if not name.startswith('_')]
+    assert [name for name in names if getattr(pyinaturalist, name) is not namespace[name]] == []
+    assert [name for name in names if getattr(pyinat, name) is not namespace[name]] == []
+    assert pyinaturalist.ConservationStatus.__module__ == 'pyinaturalist.models.conservation_status'
+
+
+def test_private_imports():
+    for module in (pyinaturalist, pyinat):
+        assert not hasattr(module, 'import_module')
+        assert 'import_module' not in module.__all__
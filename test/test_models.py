@@ -10,6 +10,7 @@
 * Formatting in the model's __str__ method
 """
 
+import json
 from copy import deepcopy
 from datetime import date, datetime
 
@@ -106,6 +107,67 @@ def test_to_dict__specific_keys():
     assert obs_dict['taxon']['id'] == j_observation_1['taxon']['id']
 
 
+def test_to_dict__nested_list():
+    """Models nested in lists should be converted the same way as other nested models"""
+    taxon = Taxon.from_json(j_taxon_1)
+    assert taxon.ancestors
+    taxon_dict = taxon.to_dict()
+    assert taxon_dict['ancestors'][0] == taxon.ancestors[0].to_dict()
+    assert '_ancestors' not in taxon_dict['ancestors'][0]
+
+
+def test_to_dict__unconverted_lazy_property():
+    """Nested data for lazy-loaded properties should not be converted if it hasn't been accessed"""
+    obs = Observation.from_json(j_observation_1)
+    obs_dict = obs.to_dict()
+    assert obs_dict['identifications'] == j_observation_1['identifications']
+    assert not isinstance(obs._identifications[0], BaseModel)
+    assert Observation.from_json(obs_dict).to_dict() == obs_dict
+
+
+def test_to_dict__raw():
+    """With raw=True, unconverted nested data should be returned as-is, and converted data should
+    be the same as a regular to_dict()
+    """
+    obs = Observation.from_json(j_observation_1)
+    taxon = obs.taxon
+    obs_dict = obs.to_dict(raw=True)
+    assert obs_dict['identifications'] is obs._identifications
+    assert not isinstance(obs._identifications[0], BaseModel)
+    assert obs_dict['taxon'] == taxon.to_dict()
+    assert obs_dict == obs.to_dict()
+
+
+def test_to_dicts():
+    observations = Observation.from_json_list([j_observation_1, j_observation_2])
+    obs_dicts = to_dicts(observations, keys=['id', 'taxon'])
+    assert obs_dicts == [obs.to_dict(keys=['id', 'taxon']) for obs in observations]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_to_json_bytes(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr('pyinaturalist.models.base.orjson', None)
+    observations = Observation.from_json_list([j_observation_1, j_observation_2])
+    json_bytes = to_json_bytes(observations)
+
+    obs_dicts = json.loads(json_bytes)
+    assert [d['id'] for d in obs_dicts] == [obs.id for obs in observations]
+    assert obs_dicts[0]['created_at'] == observations[0].created_at.isoformat()
+    assert obs_dicts[0]['user']['login'] == j_observation_1['user']['login']
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_to_json_bytes__int_keys(use_orjson, monkeypatch):
+    """Dicts with non-str keys should be serialized the same way with or without orjson"""
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr('pyinaturalist.models.base.orjson', None)
+    json_bytes = to_json_bytes([ControlledTermCount(count=1, histogram={1: 2})])
+    assert json.loads(json_bytes)[0]['histogram'] == {'1': 2}
+
+
 @define
 class ExampleModel(BaseModel):
     key: str = field(default=None)
@@ -373,6 +435,36 @@ def test_histogram():
     assert histogram[0].interval_column_label == 'Month'
 
 
+def test_histogram_matrix():
+    histograms = {
+        1: Histogram.from_json({'month_of_year': {'1': 5, '2': 3}}),
+        2: Histogram.from_json({'month_of_year': {'2': 1, '3': 7}}),
+    }
+    matrix = HistogramMatrix.from_histograms(histograms, id_field='taxon_id')
+    assert matrix.ids == [1, 2]
+    assert matrix.labels == [1, 2, 3]
+    assert matrix.counts == [[5, 3, 0], [0, 1, 7]]
+    assert matrix.interval == 'month_of_year'
+    assert str(matrix) == 'HistogramMatrix(id_field=taxon_id, interval=month_of_year, ids=[1, 2])'
+
+
+def test_histogram_matrix__to_array():
+    np = pytest.importorskip('numpy')
+    matrix = HistogramMatrix(ids=[1, 2], labels=[1, 2], counts=[[5, 3], [0, 1]])
+    assert np.array_equal(matrix.to_array(), np.array([[5, 3], [0, 1]]))
+    assert HistogramMatrix().to_array().shape == (0, 0)
+
+
+def test_histogram_matrix__to_dataframe():
+    pytest.importorskip('pandas')
+    matrix = HistogramMatrix(
+        ids=[1, 2], labels=[1, 2], counts=[[5, 3], [0, 1]], id_field='place_id'
+    )
+    df = matrix.to_dataframe()
+    assert df.index.name == 'place_id'
+    assert df.loc[1, 2] == 3
+
+
 # Identifications
 # --------------------
 
@@ -1549,6 +1641,29 @@ def test_user_counts__observers():
     assert isinstance(user_counts.data[0], UserCount) and user_counts.data[0].count == 750
 
 
+def test_user_counts__merge():
+    counts_1 = UserCounts.from_json(
+        [
+            {'user': {'id': 1}, 'observation_count': 5, 'species_count': 3},
+            {'user': {'id': 2}, 'observation_count': 4, 'species_count': 4},
+        ]
+    )
+    counts_2 = UserCounts.from_json(
+        [
+            {'user': {'id': 2}, 'observation_count': 2, 'species_count': 1},
+            {'user': {'id': 3}, 'observation_count': 1, 'species_count': 1},
+        ]
+    )
+    merged = UserCounts.merge([counts_1, counts_2])
+
+    assert [user.id for user in merged] == [2, 1, 3]
+    assert [user.count for user in merged] == [6, 5, 1]
+    assert merged[0].observation_count == 6
+    assert merged[0].species_count == 4
+    # Original objects should not be modified
+    assert counts_1[1].count == 4
+
+
 def test_user_counts__empty():
     user_counts = UserCounts()
     assert user_counts.data == []
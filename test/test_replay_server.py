@@ -0,0 +1,93 @@
+"""Tests for client behavior against a local replay server, over real HTTP connections"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import HTTPError, Request
+from requests_ratelimiter import InMemoryBucket
+
+from pyinaturalist.client import ClientSession, iNatClient
+from pyinaturalist.constants import API_V1
+from pyinaturalist.v2 import upload
+from test import conftest
+from test.replay_server import ReplayServer
+
+
+@pytest.fixture
+def replay_server():
+    """Replay server with default settings; tests can modify settings as needed"""
+    with ReplayServer() as server:
+        yield server
+
+
+@pytest.fixture
+def replay_session(replay_server):
+    return replay_server.mount(conftest.TestSession(backoff_factor=0, max_retries=10))
+
+
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_paginate_by_id(replay_server, replay_session, order):
+    replay_server.total_results = 450
+    client = iNatClient(session=replay_session)
+
+    observations = client.observations.search(order=order).all()
+    ids = [obs.id for obs in observations]
+    assert ids == sorted(ids, reverse=order == 'desc')
+    assert len(set(ids)) == 450
+    assert replay_server.stats == {'200': 3}
+
+
+def test_paginate_by_page(replay_server, replay_session):
+    replay_server.total_results = 250
+    client = iNatClient(session=replay_session)
+
+    taxa = client.taxa.search(q='test').all()
+    assert len({taxon.id for taxon in taxa}) == 250
+
+
+def test_retry_errors(replay_server, replay_session):
+    """Server errors and truncated responses should be retried"""
+    replay_server.total_results = 1000
+    replay_server.error_rate = 0.3
+    replay_server.truncate_rate = 0.3
+    client = iNatClient(session=replay_session)
+
+    observations = client.observations.search().all()
+    assert len({obs.id for obs in observations}) == 1000
+    assert replay_server.stats['error'] > 0
+    assert replay_server.stats['truncate'] > 0
+
+
+def test_connection_reuse(replay_server):
+    """Threads sharing a session should reuse connections from the same pool, up to its max size"""
+    session = conftest.TestSession(pool_maxsize=4, pool_block=True)
+    client = iNatClient(session=replay_server.mount(session))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        taxa = list(executor.map(client.taxa, range(1, 65)))
+    assert len(taxa) == 64
+    assert 1 <= replay_server.connections <= 4
+
+
+def test_ratelimit_error(replay_server, tmp_path):
+    """A 429 response should not be retried, and should also delay any further requests"""
+    replay_server.ratelimit_rate = 1
+    session = ClientSession(cache_file=tmp_path / 'cache.db', bucket_class=InMemoryBucket)
+    client = iNatClient(session=replay_server.mount(session))
+
+    with pytest.raises(HTTPError) as exc_info:
+        client.taxa(1)
+    assert exc_info.value.response.status_code == 429
+    assert replay_server.stats == {'ratelimit': 1}
+
+    # The limiter bucket should be filled, so another request can't be sent without waiting
+    bucket_name = session._bucket_name(Request('GET', API_V1).prepare())
+    assert session.limiter.try_acquire(bucket_name, blocking=False) is False
+
+
+def test_upload(replay_server, replay_session):
+    response = upload(
+        1234, photos=conftest.sample_data_path('obs_image.jpg'), session=replay_session
+    )
+    assert response[0]['id']
+    assert replay_server.stats == {'200': 1}
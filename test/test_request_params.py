@@ -6,13 +6,16 @@ import pytest
 from dateutil.tz import gettz
 
 from pyinaturalist.request_params import (
+    _params_cache,
     convert_bool_params,
     convert_datetime_params,
+    convert_fields_param,
     convert_list_params,
     convert_ofv_params,
     convert_pagination_params,
     convert_url_ids,
     get_interval_ranges,
+    get_valid_kwargs,
     normalize_rank,
     normalize_rank_params,
     preprocess_request_body,
@@ -22,6 +25,12 @@ from pyinaturalist.request_params import (
     validate_multiple_choice_params,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_params_cache():
+    _params_cache.clear()
+
+
 TEST_PARAMS = {
     'is_active': False,
     'only_id': 'true',
@@ -60,6 +69,26 @@ def test_convert_datetime_params(tzlocal, param, value, expected):
     assert converted[param] == expected
 
 
+@pytest.mark.parametrize(
+    'fields, expected',
+    [
+        (None, None),
+        ('all', 'all'),
+        ({'id': True}, {'id': True}),
+        ('id,uuid', {'id': True, 'uuid': True}),
+        (['id', 'location'], {'id': True, 'location': True}),
+        (
+            ['id', 'taxon.id', 'taxon.name', 'user.login'],
+            {'id': True, 'taxon': {'id': True, 'name': True}, 'user': {'login': True}},
+        ),
+        (['taxon', 'taxon.id'], {'taxon': True}),
+        (['taxon.ancestors.id'], {'taxon': {'ancestors': {'id': True}}}),
+    ],
+)
+def test_convert_fields_param(fields, expected):
+    assert convert_fields_param(fields) == expected
+
+
 # Test both int and string lists
 def test_convert_list_params():
     params = convert_list_params(TEST_PARAMS)
@@ -191,6 +220,72 @@ def test_preprocess_request_params(mock_bool, mock_datetime, mock_list, mock_str
     assert all([mock_bool.called, mock_datetime.called, mock_list.called, mock_strip.called])
 
 
+@patch('pyinaturalist.request_params.normalize_rank_params', side_effect=lambda p: p)
+def test_preprocess_request_params__cached(mock_normalize):
+    """Params other than page cursors should only be processed once"""
+    params = {'taxon_id': [1, 2], 'verifiable': True, 'per_page': 200}
+    assert preprocess_request_params({**params, 'page': 1}) == {
+        'taxon_id': '1,2',
+        'verifiable': 'true',
+        'per_page': '200',
+        'page': '1',
+    }
+    assert preprocess_request_params({**params, 'id_above': 1234}) == {
+        'taxon_id': '1,2',
+        'verifiable': 'true',
+        'per_page': '200',
+        'id_above': '1234',
+    }
+    # 1 call for the static params, plus 1 per request for cursor params
+    assert mock_normalize.call_count == 3
+
+    with pytest.raises(ValueError):
+        preprocess_request_params({**params, 'page': 0})
+
+
+def test_preprocess_request_params__cache_types():
+    """Values that compare as equal but have different types should be cached separately"""
+    assert preprocess_request_params({'verifiable': True}) == {'verifiable': 'true'}
+    assert preprocess_request_params({'verifiable': 1}) == {'verifiable': '1'}
+
+
+def test_preprocess_request_params__unhashable():
+    params = {'taxon_id': [1, 2], 'data': bytearray(b'123')}
+    assert preprocess_request_params(params)['taxon_id'] == '1,2'
+    assert len(_params_cache) == 0
+
+
+def test_preprocess_request_params__mutable_values():
+    """Results with nested lists or dicts shouldn't be cached, so they can't be shared with callers"""
+    result_1 = preprocess_request_params({'tags': ['a', 'b']}, convert_lists=False)
+    result_1['tags'].append('c')
+    assert preprocess_request_params({'tags': ['a', 'b']}, convert_lists=False) == {
+        'tags': ['a', 'b']
+    }
+    assert len(_params_cache) == 0
+
+
+def test_preprocess_request_body__not_cached():
+    def get_body():
+        return {'observation': {'species_guess': 'Pieris rapae', 'tags': ['a', 'b']}}
+
+    result_1 = preprocess_request_body(get_body())
+    result_1['observation']['tags'].append('c')
+    assert preprocess_request_body(get_body()) == get_body()
+    assert len(_params_cache) == 0
+
+
+def test_get_valid_kwargs():
+    class Foo:
+        def method(self, a, b=None): ...
+
+    def func(a, b=None, **kwargs): ...
+
+    kwargs = {'a': 1, 'b': None, 'c': 3}
+    assert get_valid_kwargs(func, kwargs) == {'a': 1}
+    assert get_valid_kwargs(Foo().method, kwargs) == {'a': 1}
+
+
 @patch('pyinaturalist.request_params.convert_bool_params')
 @patch('pyinaturalist.request_params.convert_datetime_params')
 @patch('pyinaturalist.request_params.convert_list_params')
@@ -0,0 +1,145 @@
+import pytest
+
+from pyinaturalist.client import BoundingBox
+from pyinaturalist.models import Observation, Observations, Place
+from pyinaturalist.spatial import SpatialIndex, haversine_distance
+
+# Observations on a 10x10 grid from (0, 0) to (4.5, 4.5), plus a few without locations
+OBSERVATIONS = Observations.from_json(
+    [{'id': i * 10 + j + 1, 'location': [i * 0.5, j * 0.5]} for i in range(10) for j in range(10)]
+    + [{'id': 101}, {'id': 102, 'location': None}]
+)
+
+# A square containing points from (0, 0) to (2, 2), with a hole around (1, 1)
+SQUARE_WITH_HOLE = {
+    'type': 'Polygon',
+    'coordinates': [
+        [[-0.25, -0.25], [2.25, -0.25], [2.25, 2.25], [-0.25, 2.25], [-0.25, -0.25]],
+        [[0.75, 0.75], [1.25, 0.75], [1.25, 1.25], [0.75, 1.25], [0.75, 0.75]],
+    ],
+}
+
+
+def get_ids(results) -> list[int]:
+    return [obs.id for obs in results]
+
+
+@pytest.fixture
+def index():
+    return SpatialIndex(OBSERVATIONS)
+
+
+def test_init(index):
+    assert len(index) == 100
+    assert len(index._cells) == 25
+    assert index.items[0] is OBSERVATIONS[0]
+
+
+def test_from_coordinates():
+    index = SpatialIndex.from_coordinates([10, 20, 30], [-10, -20, -30])
+    assert index.within_bbox((15, -35, 35, -15)) == [1, 2]
+
+    index = SpatialIndex.from_coordinates([10, 20], [-10, -20], items=['a', 'b'])
+    assert index.within_bbox((15, -35, 35, -15)) == ['b']
+
+    with pytest.raises(ValueError):
+        SpatialIndex.from_coordinates([10, 20], [-10])
+
+
+@pytest.mark.parametrize('cell_size', [0.1, 1.0, 100.0])
+def test_within_bbox(cell_size):
+    index = SpatialIndex(OBSERVATIONS, cell_size=cell_size)
+    results = index.within_bbox(BoundingBox(1, 1, 2, 1.5))
+    assert get_ids(results) == [23, 24, 33, 34, 43, 44]
+    assert len(index.within_bbox((-90, -180, 90, 180))) == 100
+
+
+def test_within_bbox__antimeridian():
+    index = SpatialIndex.from_coordinates([0, 0, 0, 0], [179.5, -179.5, 0, 170])
+    assert index.within_bbox((-1, 179, 1, -179)) == [0, 1]
+
+
+@pytest.mark.parametrize('cell_size', [0.1, 1.0, 100.0])
+def test_within_radius(cell_size):
+    index = SpatialIndex(OBSERVATIONS, cell_size=cell_size)
+    # Half a degree is about 55km, so this should include neighbors but not diagonals
+    results = index.within_radius(2, 2, radius_km=60)
+    assert get_ids(results) == [35, 44, 45, 46, 55]
+
+
+def test_within_radius__antimeridian():
+    index = SpatialIndex.from_coordinates([60, 60, 60], [179.9, -179.9, 179])
+    assert index.within_radius(60, 180, radius_km=20) == [0, 1]
+
+
+def test_within_radius__pole():
+    index = SpatialIndex.from_coordinates([89.9, 89.9, 80], [0, 180, 0])
+    assert index.within_radius(90, 0, radius_km=50) == [0, 1]
+
+
+def test_within_polygon(index):
+    results = index.within_polygon(SQUARE_WITH_HOLE)
+    ids = get_ids(results)
+    assert len(ids) == 24
+    assert 1 in ids and 45 in ids and 23 not in ids
+
+    feature = {'type': 'Feature', 'geometry': SQUARE_WITH_HOLE}
+    assert get_ids(index.within_polygon(feature)) == ids
+
+
+def test_within_polygon__multipolygon(index):
+    geometry = {
+        'type': 'MultiPolygon',
+        'coordinates': [
+            [[[-0.1, -0.1], [0.1, -0.1], [0.1, 0.1], [-0.1, 0.1]]],
+            [[[4.4, 4.4], [4.6, 4.4], [4.6, 4.6], [4.4, 4.6]]],
+        ],
+    }
+    assert get_ids(index.within_polygon(geometry)) == [1, 100]
+
+
+def test_within_polygon__invalid(index):
+    with pytest.raises(ValueError):
+        index.within_polygon({'type': 'Point', 'coordinates': [0, 0]})
+
+
+def test_within_place(index):
+    place = Place(id=1, geometry_geojson=SQUARE_WITH_HOLE)
+    assert index.within_place(place) == index.within_polygon(SQUARE_WITH_HOLE)
+
+    # Use bounding box if there's no boundary polygon
+    place = Place(
+        id=1,
+        bounding_box_geojson={
+            **SQUARE_WITH_HOLE,
+            'coordinates': [[[-0.1, -0.1], [1.1, -0.1], [1.1, 1.1], [-0.1, 1.1]]],
+        },
+    )
+    assert len(index.within_place(place)) == 9
+
+    with pytest.raises(ValueError):
+        index.within_place(Place(id=1))
+
+
+def test_grid_counts(index):
+    counts = index.grid_counts()
+    assert counts == {
+        BoundingBox(row, col, row + 1, col + 1): 4 for row in range(5) for col in range(5)
+    }
+
+    counts = index.grid_counts(cell_size=2.5)
+    assert list(counts.values()) == [25, 25, 25, 25]
+    assert next(iter(counts)) == BoundingBox(0, 0, 2.5, 2.5)
+
+
+def test_haversine_distance():
+    assert haversine_distance(0, 0, 0, 0) == 0
+    assert haversine_distance(0, 0, 1, 0) == pytest.approx(111.195, abs=0.01)
+    assert haversine_distance(0, 179.5, 0, -179.5) == pytest.approx(111.195, abs=0.01)
+
+
+def test_index_from_place_locations():
+    """Any model with a location should be supported"""
+    places = [Place(id=1, location=(1, 1)), Place(id=2, location=(10, 10))]
+    assert get_ids(SpatialIndex(places).within_radius(1, 1, 10)) == [1]
+    assert isinstance(SpatialIndex([Observation(id=1, location=(1, 1))]).items[0], Observation)
@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from pyinaturalist.models import Observation
+from pyinaturalist.store import ObservationStore, SyncState, get_query_key
+from test.sample_data import SAMPLE_DATA
+
+
+def get_observation(id: int, updated_at: str = '2020-01-01T00:00:00+00:00') -> Observation:
+    return Observation.from_json({'id': id, 'updated_at': updated_at, 'species_guess': f'obs {id}'})
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ObservationStore(tmp_path / 'observations.db') as store:
+        yield store
+
+
+def test_upsert(store):
+    assert store.upsert([get_observation(1), get_observation(2)]) == (2, 0)
+    assert len(store) == 2
+
+    # Only observations with a different updated_at should be replaced
+    observations = [
+        get_observation(1),
+        get_observation(2, '2021-01-01T00:00:00+00:00'),
+        get_observation(3),
+    ]
+    assert store.upsert(observations) == (1, 1)
+    assert store.upsert([]) == (0, 0)
+    assert len(store) == 3
+    assert store.get(2).updated_at == datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def test_get__round_trip(store):
+    """Stored observations should be loaded with the same values"""
+    json_obs = SAMPLE_DATA['get_observation_with_ofvs']['results'][0]
+    obs = Observation.from_json(json_obs)
+    store.upsert([obs])
+    assert store.get(obs.id).to_dict() == Observation.from_json(json_obs).to_dict()
+    assert store.get(9999) is None
+
+
+def test_get_many(store):
+    store.upsert([get_observation(id) for id in range(1, 6)])
+    assert [obs.id for obs in store.get_many([5, 2, 10])] == [2, 5]
+    assert [obs.id for obs in store.all()] == [1, 2, 3, 4, 5]
+
+
+def test_queries(store):
+    store.upsert([get_observation(1), get_observation(2)], query_key='a')
+    store.upsert([get_observation(2), get_observation(3)], query_key='b')
+    assert store.ids('a') == {1, 2}
+    assert store.ids('b') == {2, 3}
+    assert [obs.id for obs in store.all('b')] == [2, 3]
+
+    # Observations should only be deleted once they don't belong to any query
+    assert store.remove_from_query('a', [1, 2]) == 2
+    assert store.ids() == {2, 3}
+    assert store.ids('a') == set()
+
+    assert store.delete([2, 4]) == 1
+    assert store.ids() == {3}
+    assert store.ids('b') == {3}
+
+
+def test_sync_state(store):
+    assert store.get_sync_state('a') is None
+
+    state = SyncState(
+        query_key='a',
+        params={'taxon_id': 1, 'd1': datetime(2020, 1, 1)},
+        updated_since=datetime(2021, 1, 1, 12, tzinfo=timezone.utc),
+        max_id=10,
+    )
+    store.save_sync_state(state)
+    loaded = store.get_sync_state('a')
+    assert loaded.updated_since == state.updated_since
+    assert loaded.max_id == 10
+    assert loaded.last_reconciled is None
+    assert loaded.params == {'taxon_id': 1, 'd1': '2020-01-01 00:00:00'}
+
+
+def test_get_query_key():
+    key = get_query_key({'taxon_id': 1, 'place_id': [1, 2]})
+    assert key == get_query_key({'place_id': [1, 2], 'taxon_id': 1, 'page': 2, 'user_id': None})
+    assert key == get_query_key({'taxon_id': 1, 'place_id': [1, 2], 'updated_since': '2020-01-01'})
+    assert key != get_query_key({'taxon_id': 1, 'place_id': [1, 3]})
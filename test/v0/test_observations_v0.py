@@ -6,12 +6,13 @@ import pytest
 from dateutil.tz import tzutc
 from requests import HTTPError
 
-from pyinaturalist.constants import API_V0, OBSERVATION_FORMATS
+from pyinaturalist.constants import API_V0, DWC_NAMESPACE, OBSERVATION_FORMATS, SAMPLE_DATA_DIR
 from pyinaturalist.exceptions import ObservationNotFound
 from pyinaturalist.v0 import (
     create_observation,
     delete_observation,
     get_observations,
+    iter_observations,
     update_observation,
     upload_photos,
     upload_sounds,
@@ -58,6 +59,73 @@ def test_get_observations__invalid_format(response_format):
         get_observations(taxon_id=493595, response_format=response_format)
 
 
+EMPTY_PAGES = {
+    'atom': b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>',
+    'csv': b'id,scientific_name\n',
+    'dwc': b'<dwr:SimpleDarwinRecordSet xmlns:dwr="http://rs.tdwg.org/dwc/xsd/simpledarwincore/"/>',
+    'json': b'[]',
+    'kml': b'<kml xmlns="http://www.opengis.net/kml/2.2"><Document></Document></kml>',
+}
+
+
+@pytest.mark.parametrize('response_format', ['atom', 'csv', 'dwc', 'json', 'kml'])
+def test_iter_observations(response_format, requests_mock):
+    """Each format should be streamed and parsed into records, with pages fetched until a page has
+    fewer than ``per_page`` results
+    """
+    content = (SAMPLE_DATA_DIR / 'v0' / f'get_observations.{response_format}').read_bytes()
+    requests_mock.get(
+        f'{API_V0}/observations.{response_format}',
+        [{'content': content}, {'content': content}, {'content': EMPTY_PAGES[response_format]}],
+    )
+
+    records = list(iter_observations(taxon_id=493595, response_format=response_format, per_page=1))
+    assert len(records) == 2
+    assert [request.qs['page'] for request in requests_mock.request_history] == [
+        ['1'],
+        ['2'],
+        ['3'],
+    ]
+
+    record = records[0]
+    if response_format == 'csv':
+        assert record['id'] == '16227955'
+    elif response_format == 'json':
+        assert record['id'] == 16227955
+        assert record['latitude'] == 50.646894
+    elif response_format == 'dwc':
+        assert record.findtext(f'{{{DWC_NAMESPACE}}}catalogNumber') == '16227955'
+    else:
+        assert 'Lixus bardanae' in ''.join(record.itertext())
+
+
+def test_iter_observations__total_entries(requests_mock):
+    """If the response includes a total count, pagination should stop when it is reached"""
+    content = (SAMPLE_DATA_DIR / 'v0' / 'get_observations.csv').read_bytes()
+    requests_mock.get(
+        f'{API_V0}/observations.csv', content=content, headers={'X-Total-Entries': '2'}
+    )
+
+    records = list(iter_observations(response_format='csv', per_page=1))
+    assert len(records) == 2
+    assert requests_mock.call_count == 2
+
+
+def test_iter_observations__limit(requests_mock):
+    content = (SAMPLE_DATA_DIR / 'v0' / 'get_observations.csv').read_bytes()
+    requests_mock.get(f'{API_V0}/observations.csv', content=content)
+
+    records = list(iter_observations(response_format='csv', per_page=1, limit=3))
+    assert len(records) == 3
+    assert requests_mock.call_count == 3
+
+
+@pytest.mark.parametrize('response_format', ['widget', 'yaml'])
+def test_iter_observations__invalid_format(response_format):
+    with pytest.raises(ValueError):
+        next(iter_observations(response_format=response_format))
+
+
 def test_create_observation(requests_mock):
     requests_mock.post(
         f'{API_V0}/observations.json',
@@ -9,11 +9,14 @@ from pyinaturalist.constants import API_V2
 from pyinaturalist.exceptions import ObservationNotFound
 from pyinaturalist.v2 import (
     create_observation,
+    create_observations,
     delete_observation,
     get_observations,
     set_observation_field,
     update_observation,
+    update_observations,
     upload,
+    upload_bulk,
 )
 from test.sample_data import SAMPLE_DATA
 
@@ -151,6 +154,36 @@ def test_upload(requests_mock):
     assert response[1]['id'] == 123456
 
 
+def test_upload_bulk(requests_mock):
+    """Each file should be uploaded separately, with errors reported per file"""
+    photo_mock = requests_mock.post(
+        f'{API_V2}/observation_photos',
+        [
+            {'json': SAMPLE_DATA['post_observation_media'], 'status_code': 200},
+            {'json': {'error': 'Invalid photo'}, 'status_code': 422},
+        ],
+    )
+    sound_mock = requests_mock.post(
+        f'{API_V2}/observation_sounds',
+        json=SAMPLE_DATA['post_observation_media'],
+        status_code=200,
+    )
+    sound = BytesIO(b'123456')
+    sound.name = 'recording.mp3'
+
+    results = upload_bulk(
+        [('uuid-1', [BytesIO(b'123456'), sound]), ('uuid-2', BytesIO(b'123456'))],
+        max_workers=1,
+        access_token='token',
+    )
+    assert [result.item[0] for result in results] == ['uuid-1', 'uuid-1', 'uuid-2']
+    assert [result.ok for result in results] == [True, True, False]
+    assert results[0].result['id'] == 123456
+    assert results[2].error.response.status_code == 422
+    assert photo_mock.call_count == 2
+    assert sound_mock.call_count == 1
+
+
 def test_upload__with_photo_ids(requests_mock):
     """Test attaching existing photos to an observation"""
     requests_mock.post(
@@ -199,6 +232,91 @@ def test_create_observation(requests_mock):
     assert response['id'] == 123456
 
 
+@patch('pyinaturalist.client.bulk.sleep')
+def test_create_observations(mock_sleep, requests_mock):
+    """Each observation should get a UUID that is reused on retries, and observation fields and
+    media should be sent as follow-up requests
+    """
+    obs_mock = requests_mock.post(
+        f'{API_V2}/observations',
+        [
+            {'status_code': 503},
+            {'json': {'results': [{'uuid': 'uuid-1', 'id': 1}]}, 'status_code': 200},
+            {'json': {'results': [{'uuid': 'uuid-2', 'id': 2}]}, 'status_code': 200},
+        ],
+    )
+    ofv_mock = requests_mock.post(
+        f'{API_V2}/observation_field_values',
+        [
+            {'json': {'id': 1}, 'status_code': 200},
+            {'json': {'error': 'Invalid value'}, 'status_code': 422},
+        ],
+    )
+    photo_mock = requests_mock.post(
+        f'{API_V2}/observation_photos',
+        json=SAMPLE_DATA['post_observation_media'],
+        status_code=200,
+    )
+
+    report = create_observations(
+        [
+            {'species_guess': 'Pieris rapae', 'photos': BytesIO(b'123456')},
+            {'uuid': 'uuid-2', 'observation_fields': {297: 1, 298: 'x'}},
+        ],
+        max_workers=1,
+        access_token='token',
+        session=ClientSession(max_retries=0),
+    )
+    result_1, result_2 = report
+    assert result_1.ok and result_1.attempts == 2
+    assert result_1.result == {'uuid': 'uuid-1', 'id': 1}
+    assert len(result_1.children) == 1 and result_1.children[0].ok
+    assert result_2.error is None and not result_2.ok
+    assert [child.ok for child in result_2.children] == [True, False]
+    assert report.failed == [result_2]
+    assert report.summary == '2 items: 1 succeeded, 1 failed'
+
+    # The same client-generated UUID should be sent on each attempt
+    request_uuids = [r.json()['observation']['uuid'] for r in obs_mock.request_history]
+    assert request_uuids[0] == request_uuids[1] == result_1.item['uuid']
+    assert request_uuids[2] == 'uuid-2'
+    assert ofv_mock.call_count == 2
+    assert photo_mock.call_count == 1
+
+
+def test_create_observations__invalid_params(requests_mock):
+    """Observations with invalid params should be recorded as failed, without affecting others"""
+    requests_mock.post(
+        f'{API_V2}/observations',
+        json={'results': [{'uuid': 'uuid-1', 'id': 1}]},
+        status_code=200,
+    )
+    report = create_observations(
+        [{'species_guess': 'Pieris rapae'}, {'observation_fields': [297]}],
+        access_token='token',
+    )
+
+    assert [result.ok for result in report] == [True, False]
+    assert isinstance(report[1].error, AttributeError)
+    assert requests_mock.call_count == 1
+
+
+def test_update_observations(requests_mock):
+    requests_mock.put(
+        f'{API_V2}/observations/uuid-1',
+        json={'results': [{'uuid': 'uuid-1'}]},
+        status_code=200,
+    )
+    report = update_observations([{'uuid': 'uuid-1', 'captive_flag': True}], access_token='token')
+    assert report[0].ok
+    assert requests_mock.last_request.json() == {'observation': {'captive_flag': 'true'}}
+
+
+def test_update_observations__missing_uuid():
+    with pytest.raises(ValueError):
+        update_observations([{'captive_flag': True}], access_token='token')
+
+
 @patch('pyinaturalist.v2.observations.upload')
 @patch('pyinaturalist.v2.observations.post')
 def test_create_observation__with_files(mock_post, mock_upload):